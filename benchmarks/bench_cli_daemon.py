@@ -0,0 +1,101 @@
+"""
+Benchmark for the warm CLI daemon (taskflow.daemon): the same commands run in-process
+and forwarded to a running daemon.
+
+Runs against a throwaway data directory, never your real ~/.taskflow:
+
+    python benchmarks/bench_cli_daemon.py            # 500 tasks, 15 runs per command
+    python benchmarks/bench_cli_daemon.py 5000 10
+
+Every run is a fresh `python -m taskflow` process, as a shell user would pay. With the
+daemon, that process only parses argv and streams the answer. The daemon is started
+before the runs and stopped afterwards.
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_TMP_HOME = tempfile.mkdtemp(prefix="taskflow-bench-")
+_ROOT = str(Path(__file__).resolve().parent.parent)
+
+COMMANDS = (
+    ("ids", ["ids"]),
+    ("list", ["list"]),
+    ("today", ["today"]),
+    ("view 1", ["view", "1"]),
+    ("dump 'x tomorrow 5pm'", ["dump", "Bench capture tomorrow 5pm", "--force"]),
+    ("complete <new>", None),   # completes the newest task each run
+)
+
+
+def environment(daemon: bool):
+    env = dict(os.environ, HOME=_TMP_HOME, USERPROFILE=_TMP_HOME, PYTHONPATH=_ROOT)
+    env.pop("TASKFLOW_STORAGE", None)
+    env.pop("TASKFLOW_NO_DAEMON", None)
+    if not daemon:
+        env["TASKFLOW_NO_DAEMON"] = "1"
+    return env
+
+
+def seed(env, count):
+    """`count` tasks and a finished first run, so no command stops at the wizard."""
+    code = ("from task_manager.models import Task\n"
+            "from task_manager.storage import storage\n"
+            f"storage.save_tasks([Task(id=i, title=f'Task {{i}}', priority='Medium') for i in range(1, {count + 1})])\n"
+            "c = storage.load_config(); c['first_run_complete'] = True; c['path_warning_shown'] = True\n"
+            "storage.save_config(c)\n")
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def taskflow(args, env):
+    return subprocess.run([sys.executable, "-m", "taskflow"] + args, env=env, stdin=subprocess.DEVNULL,
+                          capture_output=True, text=True)
+
+
+def time_command(args, runs, env):
+    samples = []
+    for _ in range(runs):
+        if args is None:
+            newest = taskflow(["ids"], env).stdout.split()[-1]
+            run_args = ["complete", newest]
+        else:
+            run_args = args
+        start = time.perf_counter()
+        taskflow(run_args, env)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    local, warm = environment(daemon=False), environment(daemon=True)
+    seed(local, count)
+    started = taskflow(["daemon", "start"], warm)
+    if started.returncode != 0 or "running" not in started.stdout:
+        print(f"Could not start the daemon:\n{started.stdout}{started.stderr}")
+        return False
+    try:
+        print(f"{count} tasks, {runs} runs per command  (data dir: {_TMP_HOME})\n")
+        print(f"{'command':<24} {'in-process':>12} {'daemon':>10} {'speedup':>9}")
+        for label, args in COMMANDS:
+            cold = time_command(args, runs, local)
+            hot = time_command(args, runs, warm)
+            print(f"{label:<24} {cold:>10.1f}ms {hot:>8.1f}ms {cold / hot:>8.1f}x")
+    finally:
+        taskflow(["daemon", "stop"], warm)
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        passed = main()
+    finally:
+        shutil.rmtree(_TMP_HOME, ignore_errors=True)
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,109 @@
+"""
+Regression benchmark for CLI startup: how long until `taskflow` has done its job.
+
+Runs against a throwaway data directory, never your real ~/.taskflow:
+
+    python benchmarks/bench_cli_startup.py           # 15 runs of each command
+    python benchmarks/bench_cli_startup.py 40
+
+Every command runs in a fresh interpreter (that is what a shell user pays). For each
+one the median and best wall time are reported, plus the overhead over a bare
+`python -c pass`. `taskflow --version` must stay within VERSION_BUDGET_MS of a bare
+interpreter and must not import task_manager or dateparser at all; the script exits
+with status 1 if either check fails, so it can guard against an eager import creeping
+back in.
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_TMP_HOME = tempfile.mkdtemp(prefix="taskflow-bench-")
+_ROOT = str(Path(__file__).resolve().parent.parent)
+
+# Overhead `taskflow --version` may add to a bare interpreter start (argparse included)
+VERSION_BUDGET_MS = 80
+
+COMMANDS = (
+    ("python -c pass", ["-c", "pass"]),
+    ("taskflow --version", ["-m", "taskflow", "--version"]),
+    ("import task_manager.commands", ["-c", "import task_manager.commands"]),
+    ("taskflow ids", ["-m", "taskflow", "ids"]),
+    ("taskflow list", ["-m", "taskflow", "list"]),
+    ("taskflow dump 'x tomorrow 5pm'", ["-m", "taskflow", "dump", "Bench capture tomorrow 5pm", "--force"]),
+)
+
+_LOADED_PROBE = (
+    "import sys; sys.argv = ['taskflow', '--version']\n"
+    "import contextlib, io\n"
+    "from taskflow.cli import main\n"
+    "with contextlib.redirect_stdout(io.StringIO()): main()\n"
+    "print(' '.join(sorted(m for m in sys.modules if m.split('.')[0] in ('task_manager', 'dateparser'))))"
+)
+
+
+def environment():
+    env = dict(os.environ, HOME=_TMP_HOME, USERPROFILE=_TMP_HOME, PYTHONPATH=_ROOT)
+    env.pop("TASKFLOW_STORAGE", None)
+    return env
+
+
+def seed(env):
+    """A small task file and a finished first run, so no command stops at the wizard."""
+    code = ("from task_manager.models import Task\n"
+            "from task_manager.storage import storage\n"
+            "storage.save_tasks([Task(id=i, title=f'Task {i}', priority='Medium') for i in range(1, 201)])\n"
+            "c = storage.load_config(); c['first_run_complete'] = True; c['path_warning_shown'] = True\n"
+            "storage.save_config(c)\n")
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def time_command(args, runs, env):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, env=env, stdin=subprocess.DEVNULL,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    env = environment()
+    seed(env)
+    print(f"{runs} runs per command  (data dir: {_TMP_HOME})\n")
+    print(f"{'command':<34} {'median':>10} {'best':>10} {'overhead':>10}")
+    baseline = None
+    medians = {}
+    for label, args in COMMANDS:
+        median, best = time_command(args, runs, env)
+        baseline = median if baseline is None else baseline
+        medians[label] = median
+        print(f"{label:<34} {median:>8.1f}ms {best:>8.1f}ms {median - baseline:>8.1f}ms")
+
+    ok = True
+    overhead = medians["taskflow --version"] - baseline
+    print(f"\ntaskflow --version overhead: {overhead:.1f}ms (budget {VERSION_BUDGET_MS}ms)")
+    if overhead > VERSION_BUDGET_MS:
+        print("FAIL: over budget")
+        ok = False
+    loaded = subprocess.run([sys.executable, "-c", _LOADED_PROBE], env=env,
+                            capture_output=True, text=True).stdout.strip()
+    if loaded:
+        print(f"FAIL: taskflow --version imported {loaded}")
+        ok = False
+    return ok
+
+
+if __name__ == "__main__":
+    try:
+        passed = main()
+    finally:
+        shutil.rmtree(_TMP_HOME, ignore_errors=True)
+    sys.exit(0 if passed else 1)
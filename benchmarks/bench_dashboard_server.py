@@ -0,0 +1,132 @@
+"""
+Load-test the dashboard server: threaded (default) vs asyncio (`taskflow ui --async`).
+
+Runs against a throwaway data directory, never your real ~/.taskflow:
+
+    python benchmarks/bench_dashboard_server.py              # 500 tasks, 16 clients x 100 requests
+    python benchmarks/bench_dashboard_server.py 2000 32 200
+
+Both servers run in this process on free ports. Each client thread keeps one
+http.client connection (reused where the server allows keep-alive) and polls the
+dashboard read endpoints the way an open tab does (conditional GETs, so
+most answers are 304s and per-request overhead dominates). Reported: throughput, p50/p95/
+max latency, and the peak number of server-side threads (process threads minus the
+clients and the sampler).
+"""
+
+import http.client
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Point TaskFlow at a temporary home BEFORE importing it: the global storage
+# instance resolves ~/.taskflow at import time.
+_TMP_HOME = tempfile.mkdtemp(prefix="taskflow-bench-")
+os.environ["HOME"] = _TMP_HOME
+os.environ["USERPROFILE"] = _TMP_HOME
+os.environ.pop("TASKFLOW_STORAGE", None)
+os.environ.pop("TASKFLOW_SERVER", None)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from task_manager.models import Task  # noqa: E402
+from task_manager.storage import storage  # noqa: E402
+from task_manager.server import start_server  # noqa: E402
+
+# One open tab's mix: the focus timer is polled most, the full task list least
+PATHS = ("/api/focus-status", "/api/stats", "/api/focus-status", "/api/tasks/completed-today",
+         "/api/focus-status", "/api/stats", "/api/focus-status", "/api/tasks")
+
+
+def make_tasks(count):
+    return [Task(id=i, title=f"Task {i} — quarterly report section {i % 17}",
+                 priority=("Low", "Medium", "High")[i % 3], tags=["work", f"area{i % 7}"],
+                 deadline=f"2026-10-{i % 28 + 1:02d}T17:00:00", duration="30m")
+            for i in range(1, count + 1)]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def client(port, requests, latencies, errors):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    etags = {}
+    for i in range(requests):
+        path = PATHS[i % len(PATHS)]
+        headers = {"Accept-Encoding": "gzip"}
+        if path in etags:
+            headers["If-None-Match"] = etags[path]   # revalidate, like the dashboard's tfFetchJSON
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()   # http.client reconnects by itself after a Connection: close
+            if response.getheader("ETag"):
+                etags[path] = response.getheader("ETag")
+        except (OSError, http.client.HTTPException):
+            errors.append(1)
+            conn.close()
+            continue
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+
+
+def run(mode, clients, requests):
+    port = free_port()
+    server = start_server(port, mode)
+    time.sleep(0.2)
+    client(port, len(PATHS), [], [])   # warm the resident task list and caches
+    baseline = threading.active_count()
+    peak = [baseline]
+    done = threading.Event()
+
+    def sample():
+        while not done.is_set():
+            peak[0] = max(peak[0], threading.active_count())
+            time.sleep(0.002)
+
+    latencies, errors = [], []
+    workers = [threading.Thread(target=client, args=(port, requests, latencies, errors))
+               for _ in range(clients)]
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    sampler.join()
+    server.shutdown()
+    latencies.sort()
+    n = len(latencies)
+    pct = lambda p: latencies[min(n - 1, int(n * p))] * 1000 if n else float("nan")  # noqa: E731
+    server_threads = peak[0] - baseline - clients - 1
+    print(f"{mode:<7} {n / elapsed:>8.0f} req/s {pct(0.5):>8.1f}ms {pct(0.95):>8.1f}ms "
+          f"{pct(1.0) if n else 0:>8.1f}ms {max(server_threads, 0):>8} {len(errors):>7}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    requests = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    storage.save_tasks(make_tasks(count))
+    print(f"{count} tasks, {clients} clients x {requests} requests  (data dir: {storage.data_dir})\n")
+    print(f"{'server':<7} {'throughput':>14} {'p50':>10} {'p95':>10} {'max':>10} {'threads':>8} {'errors':>7}")
+    for mode in ("thread", "async"):
+        run(mode, clients, requests)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        shutil.rmtree(_TMP_HOME, ignore_errors=True)
@@ -0,0 +1,129 @@
+"""
+Benchmark for deadline phrases: dateparser vs the native grammar in task_manager.deadlines.
+
+Runs against a throwaway data directory, never your real ~/.taskflow:
+
+    python benchmarks/bench_deadline_parser.py          # 2000 parses per measurement
+    python benchmarks/bench_deadline_parser.py 20000
+
+The corpus holds phrases as TaskFlow's prompts, `dump` and the dashboard produce them.
+For each one, three costs are measured: dateparser (the previous path for every
+non-ISO phrase), the grammar with a cold cache, and parse_deadline with a warm cache.
+The two parsers must agree wherever dateparser understands the phrase, to the second.
+A fresh interpreter parsing "friday 5pm" must not import dateparser. The script exits
+with status 1 if either check fails.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+_TMP_HOME = tempfile.mkdtemp(prefix="taskflow-bench-")
+os.environ["HOME"] = _TMP_HOME
+os.environ["USERPROFILE"] = _TMP_HOME
+_ROOT = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, _ROOT)
+
+from task_manager.commands import parse_deadline  # noqa: E402
+from task_manager import deadlines  # noqa: E402
+
+CORPUS = (
+    "tomorrow", "tomorrow 9am", "tomorrow 5pm", "tomorrow at 5pm", "tomorrow at 10:30am",
+    "today 6pm", "today at 18:30", "today 11:59pm", "morning", "evening",
+    "friday", "friday 5pm", "friday at 5:30 pm", "next friday", "next monday 10am",
+    "monday 17h", "sat 9am", "fri 5pm", "sunday",
+    "in 30 minutes", "in 30 mins", "in 2 hours", "in 1 hr", "in 2h", "in 3 days",
+    "in 1 week", "in 2 weeks", "3 days", "2 weeks",
+    "5pm", "9am", "11:30pm", "3 pm", "17:00",
+    "oct 20", "october 20", "oct 20 5pm", "20 october 5pm", "dec 25", "jan 5",
+    "October 20th", "oct 20, 2027", "dec 31st",
+)
+# Phrases dateparser can't read: the grammar's own additions
+NATIVE_ONLY = ("tonight", "tomorrow morning", "tomorrow evening", "this afternoon")
+
+_PROBE = (
+    "import sys\n"
+    "from task_manager.commands import parse_deadline\n"
+    "assert parse_deadline('friday 5pm') is not None\n"
+    "print('dateparser' in sys.modules)"
+)
+
+
+def per_call_us(fn, phrases, count):
+    start = time.perf_counter()
+    done = 0
+    while done < count:
+        for phrase in phrases:
+            fn(phrase)
+        done += len(phrases)
+    return (time.perf_counter() - start) / done * 1e6
+
+
+def dateparser_parse(phrase):
+    plan = deadlines._dateparser_plan(deadlines._normalise(phrase))
+    return deadlines._resolve(plan, datetime.now()) if plan else None
+
+
+def native_cold(phrase):
+    deadlines._plan.cache_clear()
+    return parse_deadline(phrase)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    phrases = CORPUS + NATIVE_ONLY
+    ok = True
+
+    mismatches = []
+    for phrase in CORPUS:
+        expected, got = dateparser_parse(phrase), parse_deadline(phrase)
+        if expected is None:
+            continue
+        if got is None or abs((got - expected).total_seconds()) >= 1:
+            mismatches.append((phrase, expected, got))
+    missing = [p for p in NATIVE_ONLY if parse_deadline(p) is None]
+
+    dateparser_us = per_call_us(dateparser_parse, CORPUS, min(count, len(CORPUS) * 5))
+    cold_us = per_call_us(native_cold, phrases, count)
+    deadlines._plan.cache_clear()
+    warm_us = per_call_us(parse_deadline, phrases, count)
+
+    print(f"{len(phrases)} phrases, {count} parses per measurement  (data dir: {_TMP_HOME})\n")
+    print(f"{'path':<34} {'per parse':>12}")
+    print(f"{'dateparser (previous path)':<34} {dateparser_us:>10.1f}us")
+    print(f"{'native grammar, cold cache':<34} {cold_us:>10.1f}us")
+    print(f"{'parse_deadline, warm cache':<34} {warm_us:>10.1f}us")
+    print(f"\n{deadlines.cache_info()}")
+
+    if mismatches:
+        ok = False
+        print(f"\nFAIL: {len(mismatches)} phrase(s) differ from dateparser")
+        for phrase, expected, got in mismatches:
+            print(f"  {phrase!r}: dateparser {expected}, native {got}")
+    if missing:
+        ok = False
+        print(f"\nFAIL: the grammar no longer reads {', '.join(map(repr, missing))}")
+
+    env = dict(os.environ, PYTHONPATH=_ROOT)
+    start = time.perf_counter()
+    loaded = subprocess.run([sys.executable, "-c", _PROBE], env=env,
+                            capture_output=True, text=True).stdout.strip()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\nfresh interpreter, import + parse 'friday 5pm': {elapsed:.0f}ms")
+    if loaded != "False":
+        ok = False
+        print("FAIL: parsing 'friday 5pm' imported dateparser")
+    return ok
+
+
+if __name__ == "__main__":
+    try:
+        passed = main()
+    finally:
+        shutil.rmtree(_TMP_HOME, ignore_errors=True)
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,134 @@
+"""
+Benchmark for `taskflow search`: the inverted index in task_manager.search_index vs
+the previous linear title scan.
+
+Runs against a throwaway data directory, never your real ~/.taskflow:
+
+    python benchmarks/bench_search_index.py            # 20000 tasks, 50 queries per measurement
+    python benchmarks/bench_search_index.py 50000 100
+
+Measured: building the index on the first search, a warm query (index in step with
+tasks.json), the old scan over the loaded task list, one task edit with and without
+the index to maintain, and the catch-up query after tasks.json was rewritten behind
+the index's back. Every indexed query must find the task the scan finds, and the
+edited task must be findable by its new words straight away. The script exits with
+status 1 if either check fails.
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_TMP_HOME = tempfile.mkdtemp(prefix="taskflow-bench-")
+os.environ["HOME"] = _TMP_HOME
+os.environ["USERPROFILE"] = _TMP_HOME
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from task_manager.models import Task  # noqa: E402
+from task_manager.storage import storage  # noqa: E402
+
+WORDS = ("report", "review", "email", "design", "budget", "invoice", "deploy", "meeting",
+         "client", "draft", "release", "migration", "roadmap", "hiring", "security", "backup",
+         "kitchen", "plumber", "dentist", "groceries", "passport", "insurance", "garden", "taxes")
+RARE = ("axolotl", "quokka", "pangolin", "tapir", "okapi", "narwhal", "ibex", "dugong")
+QUERIES = ("report", "budget client", "deplo", "notes:plumber", "#work", "check:groceries",
+           "link:docs", "security release", "quokka", "pango", "tapir budget", "title:ibex")
+
+
+def make_tasks(count: int):
+    rng = random.Random(7)
+    tasks = []
+    for i in range(1, count + 1):
+        words = rng.sample(WORDS, 6)
+        task = Task(id=i, title=f"{words[0].title()} {words[1]} #{i}",
+                    priority=rng.choice(("Low", "Medium", "High")),
+                    tags=[rng.choice(("work", "home", "admin"))],
+                    notes=f"Remember the {words[2]} and the {words[3]}")
+        if i % 50 == 0:
+            task.title += f" ({RARE[rng.randrange(len(RARE))]})"
+        if i % 3 == 0:
+            task.description = f"Longer context about the {words[4]} for this one"
+        if i % 4 == 0:
+            task.checklist = [{"id": 1, "text": f"sort out {words[5]}", "done": False, "done_at": None}]
+        if i % 5 == 0:
+            task.links = [{"url": f"https://docs.example.org/{words[1]}", "title": f"{words[1]} docs"}]
+        task.completed = i % 4 == 1
+        tasks.append(task)
+    return tasks
+
+
+def timed(fn, runs=1):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = fn()
+    return (time.perf_counter() - start) / runs * 1000, result
+
+
+def linear_scan(keyword):
+    # The previous search_tasks: load everything, substring match on the title
+    return [t for t in storage.load_tasks() if keyword.lower() in t.title.lower()]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    storage.save_tasks(make_tasks(count))
+    ok = True
+
+    build_ms, _ = timed(lambda: storage.search_tasks("report"))
+    print(f"{count} tasks, {runs} queries per measurement  (data dir: {_TMP_HOME})\n")
+    print(f"{'query':<22} {'index':>10} {'scan':>10} {'hits':>7}")
+    for query in QUERIES:
+        index_ms, hits = timed(lambda: storage.search_tasks(query, limit=None), runs)
+        if query == "report":
+            scan_ms, scanned = timed(lambda: linear_scan(query), max(1, runs // 10))
+            if {t.id for t in scanned} - {r["id"] for r in hits}:
+                ok = False
+                print("FAIL: the index misses title matches the scan finds")
+            scan = f"{scan_ms:>8.2f}ms"
+        else:
+            scan = f"{'-':>10}"
+        print(f"{query:<22} {index_ms:>8.2f}ms {scan} {len(hits):>7}")
+    print(f"\n{'first search (build index)':<34} {build_ms:>10.1f}ms")
+
+    tasks = storage.load_tasks()
+    target = tasks[len(tasks) // 2]
+
+    def edit(word):
+        target.notes = f"now about the {word}"
+        storage.commit(tasks)
+
+    index_file = storage.search.db_path
+    storage.search.close()
+    hidden = index_file.with_suffix(".off")
+    index_file.rename(hidden)   # no index: the write hook has nothing to maintain
+    bare_ms, _ = timed(lambda: edit("narwhal"))
+    hidden.rename(index_file)
+    storage.search_tasks("narwhal", reindex=True)
+    indexed_ms, _ = timed(lambda: edit("wombat"))
+    found = [r["id"] for r in storage.search_tasks("wombat")]
+    print(f"{'edit one task, no index':<34} {bare_ms:>10.1f}ms")
+    print(f"{'edit one task, index maintained':<34} {indexed_ms:>10.1f}ms")
+    if found != [target.id]:
+        ok = False
+        print(f"FAIL: the edited task isn't found by its new notes ({found})")
+
+    storage._compact()
+    storage._write_snapshot([t.to_dict() for t in storage.load_tasks()][:-1])   # behind the index's back
+    storage._cache.invalidate("tasks", "task_headers")
+    catchup_ms, _ = timed(lambda: storage.search_tasks("report"))
+    print(f"{'catch-up after an outside rewrite':<34} {catchup_ms:>10.1f}ms")
+    return ok
+
+
+if __name__ == "__main__":
+    try:
+        passed = main()
+    finally:
+        storage.search.close()
+        shutil.rmtree(_TMP_HOME, ignore_errors=True)
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,86 @@
+"""
+Benchmark the tasks.json snapshot formats (pretty / compact / rows).
+
+Runs against a throwaway data directory, never your real ~/.taskflow:
+
+    python benchmarks/bench_storage_formats.py            # 20,000 tasks
+    python benchmarks/bench_storage_formats.py 5000
+
+For each format it reports full save time, full load time, header-only load
+time (TaskStorage.load_task_headers), time until the first task is available
+from TaskStorage.iter_tasks(), a repeat load served by the file cache, and the
+file size.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Point TaskFlow at a temporary home BEFORE importing it: the global storage
+# instance resolves ~/.taskflow at import time.
+_TMP_HOME = tempfile.mkdtemp(prefix="taskflow-bench-")
+os.environ["HOME"] = _TMP_HOME
+os.environ["USERPROFILE"] = _TMP_HOME
+os.environ.pop("TASKFLOW_STORAGE", None)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from task_manager.models import Task  # noqa: E402
+from task_manager.storage import TaskStorage  # noqa: E402
+from task_manager.task_codec import TASK_FORMATS  # noqa: E402
+
+
+def make_tasks(count):
+    tasks = []
+    for i in range(1, count + 1):
+        task = Task(id=i, title=f"Task {i} — quarterly report section {i % 17}",
+                    priority=("Low", "Medium", "High")[i % 3],
+                    tags=["work", f"area{i % 7}"],
+                    deadline=f"2026-10-{i % 28 + 1:02d}T17:00:00", duration="30m")
+        task.description = "Draft, review and send. " * 3
+        task.edit_history = [{"timestamp": "2026-09-01T10:00:00", "field": "title",
+                              "old_value": "old", "new_value": "new"}] * 3
+        task.checklist = [{"id": "chk_001", "text": "outline", "done": False, "done_at": None}]
+        if i % 3 == 0:
+            task.completed = True
+            task.completed_at = "2026-09-15 11:00"
+        tasks.append(task)
+    return tasks
+
+
+def best_of(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None or elapsed < best else best
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    tasks = make_tasks(count)
+    store = TaskStorage()
+    print(f"{count} tasks  (data dir: {store.data_dir})\n")
+    print(f"{'format':<9} {'save':>9} {'load':>9} {'headers':>9} {'first task':>11} {'cached':>9} {'size':>10}")
+    for fmt in TASK_FORMATS:
+        store.tasks_format = fmt
+        save = best_of(lambda: store.save_tasks(tasks))
+        # Cold reads: drop the in-process file cache so every run parses the file
+        load = best_of(lambda: (store._cache.clear(), store.load_tasks()))
+        headers = best_of(lambda: (store._cache.clear(), store.load_task_headers()))
+        first = best_of(lambda: (store._cache.clear(), next(store.iter_tasks())))
+        cached = best_of(store.load_tasks)
+        size = store.tasks_file.stat().st_size
+        print(f"{fmt:<9} {save * 1000:>7.0f}ms {load * 1000:>7.0f}ms {headers * 1000:>7.0f}ms "
+              f"{first * 1000:>9.1f}ms {cached * 1000:>7.0f}ms {size / 1024:>8.0f}KB")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        shutil.rmtree(_TMP_HOME, ignore_errors=True)
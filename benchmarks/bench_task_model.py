@@ -0,0 +1,92 @@
+"""
+Memory/throughput micro-benchmark for the slotted Task model.
+
+    python benchmarks/bench_task_model.py          # 50,000 tasks
+    python benchmarks/bench_task_model.py 10000
+
+Compares models.Task against an equivalent plain (per-instance __dict__)
+dataclass: retained memory for N tasks, Task.from_dict and Task.to_dict
+throughput. Nothing touches ~/.taskflow.
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from task_manager.models import Task  # noqa: E402
+
+
+def plain_task_class():
+    """The same fields as Task, as an ordinary dataclass (what Task was before slots)."""
+    spec = []
+    for f in fields(Task):
+        if f.default is not MISSING:
+            spec.append((f.name, f.type, field(default=f.default)))
+        elif f.default_factory is not MISSING:
+            spec.append((f.name, f.type, field(default_factory=f.default_factory)))
+        else:
+            spec.append((f.name, f.type))
+    return make_dataclass("PlainTask", spec)
+
+
+def make_records(count):
+    records = []
+    for i in range(1, count + 1):
+        record = Task(id=i, title=f"Task {i} — quarterly report section {i % 17}",
+                      priority=("Low", "Medium", "High")[i % 3], tags=["work"],
+                      deadline=f"2026-10-{i % 28 + 1:02d}T17:00:00", duration="30m").to_dict()
+        record["checklist"] = [{"id": "chk_001", "text": "outline", "done": False, "done_at": None}]
+        records.append(record)
+    return records
+
+
+def measure_memory(build, records):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = build(records)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objs
+    return after - before
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    records = make_records(count)
+    plain_cls = plain_task_class()
+    names = [f.name for f in fields(Task)]
+
+    def build_plain(recs):
+        return [plain_cls(**{k: r[k] for k in names}) for r in recs]
+
+    def build_slotted(recs):
+        return [Task.from_dict(r) for r in recs]
+
+    plain_mem = measure_memory(build_plain, records)
+    slotted_mem = measure_memory(build_slotted, records)
+
+    tasks = build_slotted(records)
+    t_from = min(timed(lambda: build_slotted(records)) for _ in range(3))
+    t_to = min(timed(lambda: [t.to_dict() for t in tasks]) for _ in range(3))
+    t_clean = min(timed(lambda: [t.mark_clean() for t in tasks]) for _ in range(3))
+
+    print(f"{count} tasks")
+    print(f"  memory, plain dataclass : {plain_mem / 1e6:7.1f} MB ({plain_mem / count:.0f} B/task)")
+    print(f"  memory, slotted Task    : {slotted_mem / 1e6:7.1f} MB ({slotted_mem / count:.0f} B/task)")
+    print(f"  Task.from_dict          : {t_from * 1000:7.0f} ms ({count / t_from:,.0f} tasks/s)")
+    print(f"  Task.to_dict            : {t_to * 1000:7.0f} ms ({count / t_to:,.0f} tasks/s)")
+    print(f"  Task.mark_clean         : {t_clean * 1000:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+TaskFlow Async Dashboard Server
+-------------------------------
+Opt-in asyncio front end for the dashboard (`taskflow ui --async`, or TASKFLOW_SERVER=async).
+
+ThreadingHTTPServer starts one thread per connection and answers HTTP/1.0, so every
+dashboard poll opens a fresh TCP connection, and every open tab pins a thread for as
+long as its /api/events stream lives. Here a single event loop owns every connection:
+
+  - HTTP/1.1 keep-alive: requests are parsed on the loop, responses framed with a
+    Content-Length so the connection can carry the next request.
+  - Bounded workers: routing is unchanged — the same TaskFlowHandler methods run, on a
+    fixed-size thread pool, because they make blocking storage calls. Each request is
+    handed to a handler instance whose rfile/wfile are in-memory buffers.
+  - /api/events is relayed by the loop itself and holds no thread while idle.
+"""
+
+import asyncio
+import http.client
+import io
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from task_manager import server as _server
+
+MAX_WORKERS = 4             # concurrent blocking handlers (they mostly hold the GIL anyway)
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 16 * 1024 * 1024
+KEEP_ALIVE_SECONDS = 75     # idle time before a kept-alive connection is closed
+SSE_PING_SECONDS = 15
+
+
+class _BufferedRequest(_server.TaskFlowHandler):
+    """TaskFlowHandler fed an already-parsed request; the response is written to a buffer."""
+
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, command, path, version, headers, body, client_address):
+        # Deliberately not calling BaseHTTPRequestHandler.__init__: it would read a socket
+        self.command = command
+        self.path = path
+        self.request_version = version
+        self.requestline = f"{command} {path} {version}"
+        self.headers = headers
+        self.rfile = io.BytesIO(body)
+        self.wfile = io.BytesIO()
+        self.client_address = client_address
+        self.server = None
+        self.close_connection = False
+
+    def run(self) -> bytes:
+        method = getattr(self, 'do_' + self.command, None)
+        try:
+            if method is None:
+                self.send_error(501, f"Unsupported method ({self.command!r})")
+            else:
+                method()
+        except Exception:
+            self.wfile = io.BytesIO()   # drop a half-written response
+            self._headers_buffer = []
+            self.send_error(500)
+        return self.wfile.getvalue()
+
+
+class _LoopQueue(queue.Queue):
+    """An _EventHub subscriber queue that wakes an asyncio task when something is put."""
+
+    def __init__(self, loop, wake, maxsize):
+        super().__init__(maxsize)
+        self._loop = loop
+        self._wake_event = wake
+
+    def put_nowait(self, item):
+        super().put_nowait(item)
+        self._loop.call_soon_threadsafe(self._wake_event.set)
+
+
+def _frame(raw: bytes, keep_alive: bool) -> bytes:
+    """Give a buffered handler response a Content-Length and a Connection header."""
+    head, sep, body = raw.partition(b"\r\n\r\n")
+    if not sep:
+        return _error_response(500)
+    lines = head.split(b"\r\n")
+    try:
+        status = int(lines[0].split()[1])
+    except (IndexError, ValueError):
+        return _error_response(500)
+    names = {line.split(b":", 1)[0].strip().lower() for line in lines[1:]}
+    if b"content-length" not in names and status >= 200 and status not in (204, 304):
+        lines.append(b"Content-Length: %d" % len(body))
+    if b"connection" not in names:
+        lines.append(b"Connection: keep-alive" if keep_alive else b"Connection: close")
+    return b"\r\n".join(lines) + b"\r\n\r\n" + body
+
+
+def _error_response(status: int) -> bytes:
+    reason = http.client.responses.get(status, "Error").encode('ascii')
+    return b"HTTP/1.1 %d %s\r\nContent-Length: 0\r\nConnection: close\r\n\r\n" % (status, reason)
+
+
+def _wants_keep_alive(version: str, headers) -> bool:
+    connection = (headers.get('Connection') or '').lower()
+    if version == 'HTTP/1.1':
+        return 'close' not in connection
+    return 'keep-alive' in connection
+
+
+class AsyncDashboardServer:
+    """The dashboard on an asyncio loop in a background thread (see module doc)."""
+
+    def __init__(self, host: str, port: int, workers: int = MAX_WORKERS):
+        self.host = host
+        self.port = port
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="taskflow-worker")
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        """Bind and start serving; raises (e.g. port in use) before returning if binding fails."""
+        ready = threading.Event()
+        failure = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._loop = loop
+            try:
+                self._server = loop.run_until_complete(asyncio.start_server(
+                    self._serve_connection, self.host, self.port, limit=MAX_HEADER_BYTES))
+            except Exception as e:
+                failure.append(e)
+                ready.set()
+                loop.close()
+                return
+            ready.set()
+            try:
+                loop.run_forever()
+            finally:
+                self._server.close()
+                loop.run_until_complete(self._server.wait_closed())
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name="taskflow-async-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+        return self
+
+    def shutdown(self):
+        """Stop accepting, close the loop and the worker pool."""
+        if self._loop is not None and self._thread is not None and self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+        self._executor.shutdown(wait=False)
+
+    # --- per connection ---
+    async def _serve_connection(self, reader, writer):
+        peer = writer.get_extra_info('peername') or ('', 0)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_SECONDS)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return   # client closed, or idle too long
+                except asyncio.LimitOverrunError:
+                    writer.write(_error_response(431))
+                    return
+                request_line, _, header_block = head.partition(b"\r\n")
+                parts = request_line.decode('latin-1').split()
+                if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+                    writer.write(_error_response(400))
+                    return
+                command, path, version = parts
+                headers = http.client.parse_headers(io.BytesIO(header_block))
+                if headers.get('Transfer-Encoding'):
+                    writer.write(_error_response(411))   # the dashboard always sends Content-Length
+                    return
+                try:
+                    length = int(headers.get('Content-Length') or 0)
+                except ValueError:
+                    length = -1
+                if length < 0 or length > MAX_BODY_BYTES:
+                    writer.write(_error_response(400 if length < 0 else 413))
+                    return
+                if length and (headers.get('Expect') or '').lower() == '100-continue':
+                    writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                try:
+                    body = await reader.readexactly(length) if length else b""
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                request = _BufferedRequest(command, path, version, headers, body, peer)
+
+                if command == 'GET' and urlparse(path).path == '/api/events':
+                    if request._guard():
+                        writer.write(_frame(request.wfile.getvalue(), False))
+                    else:
+                        await self._stream_events(writer)
+                    return
+
+                raw = await asyncio.get_running_loop().run_in_executor(self._executor, request.run)
+                keep_alive = _wants_keep_alive(version, headers) and not request.close_connection
+                writer.write(_frame(raw, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    async def _stream_events(self, writer):
+        """GET /api/events: relay _EventHub messages from the loop (no thread per client)."""
+        wake = asyncio.Event()
+        q = _LoopQueue(asyncio.get_running_loop(), wake, _server._EventHub.QUEUE_SIZE)
+        _server._events.subscribe(q)
+        try:
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                         b"Cache-Control: no-store\r\nConnection: close\r\n\r\nretry: 3000\n\n")
+            await writer.drain()
+            while True:
+                try:
+                    await asyncio.wait_for(wake.wait(), SSE_PING_SECONDS)
+                except asyncio.TimeoutError:
+                    writer.write(b": keep-alive\n\n")   # also how a vanished client is noticed
+                    await writer.drain()
+                    continue
+                wake.clear()
+                while True:
+                    try:
+                        message = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if message is None:
+                        return
+                    writer.write(message)
+                await writer.drain()
+        finally:
+            _server._events.unsubscribe(q)
+
+
+def start_async_server(port: int, host: str = '127.0.0.1', workers: int = MAX_WORKERS):
+    """Start the asyncio dashboard server in a daemon thread; returns it (call .shutdown() to stop)."""
+    return AsyncDashboardServer(host, port, workers).start()
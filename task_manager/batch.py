@@ -0,0 +1,243 @@
+"""
+TaskFlow Batch
+--------------
+An ordered list of task operations applied under one load and one save.
+
+Used by POST /api/tasks/batch (dashboard multi-select, scripts) and `taskflow batch
+<file.jsonl>`. Each operation is a dict with an "op" key:
+
+    {"op": "create",   "title": ..., "priority", "tags", "duration", "deadline",
+                       "deadline_type", "description", "scheduled_date"}
+    {"op": "dump",     "text": "Call Sam #work !h", "force": false}   # frictionless capture
+    {"op": "patch",    "id": 12, "title", "priority", "tags", "duration", "description",
+                       "scheduled_date", "deadline" (ISO or phrase, "" clears), "deadline_type"}
+    {"op": "complete", "id": 12}
+    {"op": "drop",     "id": 12}
+    {"op": "delete",   "id": 12}
+
+The batch is all-or-nothing: the first operation that fails stops it, nothing is saved
+and the operations after it are reported as skipped. A dump that hits the duplicate
+guard is not a failure — it is reported with the existing task's id and adds nothing.
+Side effects outside tasks.json (behavior log, completion stats) happen only once the
+save succeeded.
+"""
+
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from task_manager.storage import storage
+from task_manager.models import Task, TaskManager
+from task_manager import commands
+
+MAX_OPERATIONS = 1000
+
+
+class BatchError(ValueError):
+    """A malformed batch, or the reason one operation failed."""
+
+
+def _task(manager: TaskManager, op: dict) -> Task:
+    task_id = op.get("id")
+    if isinstance(task_id, bool) or not isinstance(task_id, int):
+        raise BatchError("'id' must be an integer")
+    task = manager.find_task(task_id)
+    if task is None:
+        raise BatchError(f"Task {task_id} not found")
+    return task
+
+
+def _parse_deadline(raw) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(str(raw))
+    except ValueError:
+        parsed = commands.parse_deadline(str(raw))
+    if parsed is None:
+        raise BatchError(f"Could not understand deadline {raw!r}")
+    return parsed
+
+
+def _title(raw) -> str:
+    title = (raw or "").strip() if isinstance(raw, str) else ""
+    if not title:
+        raise BatchError("Title required")
+    if len(title) > 200:
+        raise BatchError("Title is too long (max 200 characters)")
+    return title
+
+
+def _tags(raw) -> List[str]:
+    if isinstance(raw, str):
+        raw = raw.split(',')
+    return [str(t).strip() for t in (raw or []) if str(t).strip()][:20]
+
+
+def _create(manager, op, effects):
+    task = Task(id=0, title=_title(op.get("title")),
+                priority=commands.normalize_priority(str(op.get("priority") or "medium")),
+                tags=_tags(op.get("tags")),
+                duration=commands.normalize_duration(op.get("duration")))
+    if op.get("description"):
+        task.description = op["description"]
+        task.description_updated_at = datetime.now().isoformat()
+    if op.get("scheduled_date"):
+        task.scheduled_date = op["scheduled_date"]
+    if op.get("deadline"):
+        task.deadline = _parse_deadline(op["deadline"]).isoformat()
+        task.deadline_type = "hard" if op.get("deadline_type") == "hard" else "soft"
+        commands.calculate_reminder_time(task)
+    manager.add_task(task)
+    return task
+
+
+def _dump(manager, op, effects):
+    text = (op.get("text") or op.get("title") or "").strip()
+    task, duplicate, _why = commands.build_dump_task(manager, text, force=bool(op.get("force")))
+    if duplicate is not None:
+        return {"id": duplicate.id, "duplicate": True}
+    if task is None:
+        raise BatchError("Nothing to capture")
+    manager.add_task(task)
+    return task
+
+
+def _patch(manager, op, effects):
+    task = _task(manager, op)
+    if "title" in op:
+        title = _title(op.get("title"))
+        if title != task.title:
+            commands._record_edit(task, "title", task.title, title)
+            task.title = title
+    if op.get("priority") is not None:
+        priority = commands.normalize_priority(str(op["priority"]))
+        if priority != task.priority:
+            commands._record_edit(task, "priority", task.priority, priority)
+            task.priority = priority
+    if "tags" in op:
+        tags = _tags(op.get("tags"))
+        if tags != list(task.tags or []):
+            commands._record_edit(task, "tags", list(task.tags or []), tags)
+            task.tags = tags
+    if "duration" in op:
+        duration = commands.normalize_duration(op.get("duration"))
+        if duration and duration != task.duration:
+            commands._record_edit(task, "duration", task.duration, duration)
+            task.duration = duration
+    if "description" in op:
+        description = op.get("description") or None
+        if description != task.description:
+            commands._record_edit(task, "description", "(set)" if task.description else None,
+                                  "(updated)" if description else "(cleared)")
+            task.description = description
+            task.description_updated_at = datetime.now().isoformat()
+    if "scheduled_date" in op:
+        task.scheduled_date = op.get("scheduled_date") or None
+    if "deadline" in op:
+        raw = op.get("deadline")
+        deadline = _parse_deadline(raw).isoformat() if raw else None
+        if deadline != task.deadline:
+            commands._record_edit(task, "deadline", task.deadline, deadline, always=True)
+            task.deadline = deadline
+            if deadline:
+                commands.calculate_reminder_time(task)
+            else:
+                task.reminder_time = None
+                task.reminder_time_2 = None
+    if task.deadline:
+        if "deadline_type" in op or not task.deadline_type:
+            deadline_type = "hard" if op.get("deadline_type", task.deadline_type) == "hard" else "soft"
+            if deadline_type != task.deadline_type:
+                commands._record_edit(task, "deadline_type", task.deadline_type, deadline_type)
+                task.deadline_type = deadline_type
+    else:
+        task.deadline_type = None
+    return task
+
+
+def _complete(manager, op, effects):
+    task = _task(manager, op)
+    if task.completed:
+        return {"id": task.id, "already_completed": True}
+    effects.append(commands._mark_completed(task))
+    return task
+
+
+def _drop(manager, op, effects):
+    task = _task(manager, op)
+    if task.completed or task.status == "dropped":
+        raise BatchError(f"Task {task.id} is already {'completed' if task.completed else 'dropped'}")
+    task.status = "dropped"
+    task.dropped_at = datetime.now().isoformat()
+    commands._record_edit(task, "status", "todo", "dropped", always=True)
+    return task
+
+
+def _delete(manager, op, effects):
+    task = _task(manager, op)
+    manager.delete_task(task.id)
+    return {"id": task.id}
+
+
+OPERATIONS = {
+    "create": _create,
+    "dump": _dump,
+    "patch": _patch,
+    "complete": _complete,
+    "drop": _drop,
+    "delete": _delete,
+}
+
+
+def apply_batch(operations: list, load: Optional[Callable[[], List[Task]]] = None,
+                save: Optional[Callable[[List[Task]], bool]] = None) -> dict:
+    """
+    Apply `operations` in order (see module doc) and save once.
+
+    load/save default to the global storage (load_tasks / commit); the dashboard server
+    passes its repository's checkout/commit. Raises BatchError when the batch itself is
+    malformed. Returns {"applied": bool, "results": [{"index", "op", "ok", "id" | "error"}]},
+    plus "error" when the save failed.
+    """
+    if not isinstance(operations, list) or not operations:
+        raise BatchError("'operations' must be a non-empty list")
+    if len(operations) > MAX_OPERATIONS:
+        raise BatchError(f"At most {MAX_OPERATIONS} operations per batch")
+
+    manager = TaskManager((load or storage.load_tasks)())
+    results = []
+    outcomes = []    # per result: the Task (its id is final only after the save) or a dict
+    effects = []     # task_completed behavior events, logged after the save
+    failed = False
+    for index, op in enumerate(operations):
+        name = op.get("op") if isinstance(op, dict) else None
+        result = {"index": index, "op": name, "ok": False}
+        results.append(result)
+        outcomes.append(None)
+        if failed:
+            result["error"] = "skipped"
+            continue
+        handler = OPERATIONS.get(name)
+        try:
+            if handler is None:
+                raise BatchError(f"Unknown op {name!r}")
+            outcomes[index] = handler(manager, op, effects)
+            result["ok"] = True
+        except Exception as e:
+            result["error"] = str(e)
+            failed = True
+
+    if failed:
+        return {"applied": False, "results": results}
+    if not (save or storage.commit)(manager.tasks):
+        for result in results:
+            result["ok"] = False
+        return {"applied": False, "error": "Failed to save tasks", "results": results}
+
+    for result, outcome in zip(results, outcomes):
+        if isinstance(outcome, Task):
+            result["id"] = outcome.id   # a new task's id may have moved on a concurrent add
+        else:
+            result.update(outcome)
+    for event in effects:
+        commands.log_behavior(event)
+        commands._generate_dopamine(event["task_id"], increment=True)
+    return {"applied": True, "results": results}
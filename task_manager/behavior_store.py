@@ -0,0 +1,323 @@
+"""
+TaskFlow Behavior Store
+-----------------------
+behavior_log.jsonl (the current month) plus monthly gzip segments of older months.
+
+The line format is unchanged: one JSON event per line, appended, never edited
+(Rule #3). Two sidecars keep reads cheap:
+
+  behavior_log.idx.json       maps each day (the event's `ts[:10]`) of the live file to
+                              the byte spans its lines occupy plus a per-event-type count,
+                              so date-range / event-type queries read only those slices.
+  behavior_log.manifest.json  lists the cold segments in behavior_log/ with the days
+                              (and per-day event counts) each covers, so a query opens
+                              only the segments overlapping its window.
+
+The index covers the first `indexed_bytes` of the live file. Every append and every
+read first indexes whatever lies beyond that (normally just the line it wrote), so
+lines appended by another process, an older TaskFlow or a crashed index write are
+picked up automatically; a log that shrank or was replaced is reindexed from scratch.
+
+When the first event of a new month is appended, the live file is renamed aside and
+split into one compressed segment per month it contains (a pre-rotation log holding a
+whole year is split the same way), then the manifest is updated. Rotation and
+appends hold behavior_log.lock (see file_lock), so the CLI, the daemon and the
+dashboard server never rotate the same file at once or write into one mid-rotation.
+"""
+
+import gzip
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from task_manager.file_lock import FileLock
+
+INDEX_VERSION = 1
+MANIFEST_VERSION = 1
+
+
+def _event_day(event: dict) -> Optional[str]:
+    ts = event.get('ts')
+    return ts[:10] if isinstance(ts, str) and len(ts) >= 10 else None
+
+
+class BehaviorStore:
+    """Append-only behavior event log with a day/event index."""
+
+    def __init__(self, data_dir):
+        self.data_dir = Path(data_dir)
+        self.log_path = self.data_dir / "behavior_log.jsonl"
+        self.index_path = self.data_dir / "behavior_log.idx.json"
+        self.segment_dir = self.data_dir / "behavior_log"
+        self.manifest_path = self.data_dir / "behavior_log.manifest.json"
+        # Where the live file is moved while it is being split into segments
+        self.rotating_path = self.data_dir / "behavior_log.rotating.jsonl"
+        self._index = None
+        self._lock = threading.RLock()
+        # Rotation renames and splits shared files: one process at a time (CLI, daemon, server)
+        self._rotate_lock = FileLock(self.data_dir / "behavior_log.lock")
+
+    # --- writing ---
+    def append(self, event: dict):
+        """Append one event (its `ts` must already be set) and index it."""
+        line = (json.dumps(event) + "\n").encode('utf-8')
+        day = _event_day(event)
+        with self._lock:
+            self.data_dir.mkdir(exist_ok=True)
+            # Held for the write too: a line appended while another process moves the live
+            # file aside would land in the file it is about to split and delete.
+            with self._rotate_lock:
+                live = self._refresh()["days"]
+                if day and live and min(live)[:7] < day[:7]:
+                    # First event of a new month: older months go cold
+                    self.rotate()
+                with open(self.log_path, 'ab') as f:
+                    f.write(line)
+                self._refresh()
+
+    # --- reading ---
+    def days(self) -> List[str]:
+        """Every day with at least one event, ascending — from the index and manifest alone."""
+        with self._lock:
+            days = set(self._refresh()["days"])
+            for segment in self._load_manifest()["segments"]:
+                days.update(segment["days"])
+        return sorted(days)
+
+    def entries(self, since: Optional[str] = None, until: Optional[str] = None,
+                events: Optional[Iterable[str]] = None) -> List[dict]:
+        """
+        Events whose day falls in [since, until] (YYYY-MM-DD, inclusive; None = open end),
+        optionally only the given event types. Reads only the matching byte spans of the
+        live file and only the cold segments whose days overlap the window.
+        """
+        wanted = set(events) if events is not None else None
+        out = []
+        with self._lock:
+            segments = self._load_manifest()["segments"]
+        for segment in segments:
+            # The manifest's per-day counts say whether opening the segment can pay off
+            if any(not ((since and d < since) or (until and d > until))
+                   and (wanted is None or any(e in counts for e in wanted))
+                   for d, counts in segment["days"].items()):
+                out.extend(self._filter(self._read_segment(segment), since, until, wanted))
+        with self._lock:
+            index = self._refresh()
+            spans = []
+            for day in sorted(index["days"]):
+                if (since and day < since) or (until and day > until):
+                    continue
+                entry = index["days"][day]
+                if wanted is not None and not any(e in entry["events"] for e in wanted):
+                    continue
+                spans.extend(entry["spans"])
+        if not spans:
+            return out
+        try:
+            with open(self.log_path, 'rb') as f:
+                for start, end in spans:
+                    f.seek(start)
+                    lines = f.read(end - start).splitlines()
+                    out.extend(self._filter((self._decode(line) for line in lines), since, until, wanted))
+        except OSError:
+            pass
+        return out
+
+    @staticmethod
+    def _filter(events, since, until, wanted):
+        for event in events:
+            if event is None:
+                continue
+            if wanted is not None and event.get('event') not in wanted:
+                continue
+            day = _event_day(event)
+            if day is None or (since and day < since) or (until and day > until):
+                continue
+            yield event
+
+    @staticmethod
+    def _decode(line: bytes):
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            event = json.loads(line)
+        except Exception:
+            return None
+        return event if isinstance(event, dict) else None
+
+    # --- cold segments ---
+    def _read_segment(self, segment: dict):
+        """Decoded events of one gzip segment (None for unparseable lines)."""
+        try:
+            with gzip.open(self.data_dir / segment["file"], 'rb') as f:
+                return [self._decode(line) for line in f]
+        except (OSError, EOFError):
+            return []
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION and isinstance(manifest.get("segments"), list):
+                return manifest
+        except Exception:
+            pass
+        return {"version": MANIFEST_VERSION, "segments": []}
+
+    def _save_manifest(self, manifest: dict):
+        temp_file = self.manifest_path.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
+        temp_file.replace(self.manifest_path)
+
+    def rotate(self):
+        """Move every event in the live file into monthly gzip segments (see module doc)."""
+        with self._lock, self._rotate_lock:
+            if not self.rotating_path.exists():
+                if not self.log_path.exists():
+                    return
+                # Atomic: appends from here on (any process) start a fresh live file
+                os.replace(self.log_path, self.rotating_path)
+            self._split_rotating()
+
+    def _resume_rotation(self):
+        """Finish a rotation another run was interrupted in (if nobody has meanwhile)."""
+        with self._lock, self._rotate_lock:
+            if self.rotating_path.exists():
+                self._split_rotating()
+
+    def _split_rotating(self):
+        """Split the renamed-aside live file into segments, then drop it (lock held)."""
+        st = self.rotating_path.stat()
+        source = [st.st_size, st.st_mtime_ns]
+        manifest = self._load_manifest()
+        # A crash after the manifest was written but before the cleanup leaves the
+        # already-split file behind; it must not be split (and duplicated) again.
+        if not any(seg.get("source") == source for seg in manifest["segments"]):
+            manifest["segments"].extend(self._split_into_segments(source, manifest))
+            self._save_manifest(manifest)
+        self.rotating_path.unlink()
+        self._index = self._empty_index()
+        self._save_index(self._index)
+
+    def _split_into_segments(self, source: list, manifest: dict) -> List[dict]:
+        months = {}   # "YYYY-MM" -> (lines, {day: {event: count}}), in first-seen order
+        month = None
+        with open(self.rotating_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                event = self._decode(line)
+                day = _event_day(event) if event is not None else None
+                if day:
+                    month = day[:7]
+                # Undated lines stay with their neighbours, so the segments keep file order
+                lines, days = months.setdefault(month or "undated", ([], {}))
+                lines.append(line if line.endswith(b"\n") else line + b"\n")
+                if day:
+                    counts = days.setdefault(day, {})
+                    name = str(event.get('event', ''))
+                    counts[name] = counts.get(name, 0) + 1
+        self.segment_dir.mkdir(exist_ok=True)
+        taken = {seg["file"] for seg in manifest["segments"]}
+        segments = []
+        for month, (lines, days) in months.items():
+            name, n = f"behavior_log/{month}.jsonl.gz", 1
+            while name in taken or (self.data_dir / name).exists():
+                n += 1
+                name = f"behavior_log/{month}.{n}.jsonl.gz"
+            taken.add(name)
+            temp_file = self.data_dir / (name + ".tmp")
+            with gzip.open(temp_file, 'wb') as f:
+                f.writelines(lines)
+            temp_file.replace(self.data_dir / name)
+            segments.append({"file": name, "month": month, "events": len(lines),
+                             "first_day": min(days) if days else None,
+                             "last_day": max(days) if days else None,
+                             "days": days, "source": source})
+        return segments
+
+    # --- index maintenance ---
+    def _empty_index(self) -> dict:
+        return {"version": INDEX_VERSION, "indexed_bytes": 0, "file_id": None, "days": {}}
+
+    def _file_id(self):
+        """Identity of the live file, so a replaced file of equal size is still noticed."""
+        try:
+            st = os.stat(self.log_path)
+            return [st.st_ino, st.st_dev]
+        except OSError:
+            return None
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION and isinstance(index.get("days"), dict):
+                return index
+        except Exception:
+            pass
+        return self._empty_index()
+
+    def _save_index(self, index: dict):
+        try:
+            temp_file = self.index_path.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(index, f, separators=(',', ':'))
+            temp_file.replace(self.index_path)
+        except Exception:
+            pass   # the index is derived data; the next refresh rebuilds what is missing
+
+    def _refresh(self) -> dict:
+        """Bring the index up to the current end of the log and return it."""
+        if self.rotating_path.exists():
+            self._resume_rotation()
+        try:
+            size = os.path.getsize(self.log_path)
+        except OSError:
+            size = 0
+        file_id = self._file_id() if size else None
+        index = self._index
+        if index is None or index["indexed_bytes"] != size or index.get("file_id", file_id) != file_id:
+            if index is None or index["indexed_bytes"] > size or index.get("file_id", file_id) != file_id:
+                index = self._load_index()   # another process may have indexed further
+            replaced = index["indexed_bytes"] and index.get("file_id", file_id) != file_id
+            if index["indexed_bytes"] > size or replaced:
+                index = self._empty_index()  # log was truncated or replaced: rebuild
+            if index["indexed_bytes"] < size:
+                index["file_id"] = file_id
+                self._index_tail(index)
+                self._save_index(index)
+            self._index = index
+        return index
+
+    def _index_tail(self, index: dict):
+        """Index complete lines from indexed_bytes to EOF (a torn last line waits)."""
+        days = index["days"]
+        offset = index["indexed_bytes"]
+        try:
+            f = open(self.log_path, 'rb')
+        except FileNotFoundError:
+            return   # rotated aside by another process since it was measured
+        with f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                start, offset = offset, offset + len(line)
+                event = self._decode(line)
+                day = _event_day(event) if event is not None else None
+                if day is None:
+                    continue
+                entry = days.setdefault(day, {"spans": [], "events": {}})
+                spans = entry["spans"]
+                if spans and spans[-1][1] == start:
+                    spans[-1][1] = offset
+                else:
+                    spans.append([start, offset])
+                name = str(event.get('event', ''))
+                entry["events"][name] = entry["events"].get(name, 0) + 1
+        index["indexed_bytes"] = offset
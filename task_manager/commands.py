@@ -15,20 +15,17 @@ from pathlib import Path
 import threading
 import time
 from datetime import datetime
-import dateparser
-import warnings
-warnings.filterwarnings("ignore", module="dateparser")
 from colorama import Fore, Style
-from .system_detector import SystemDetector
-from .blockers import GentleBlocker  # For fallback
-from .blockers.blocklist import blocklist_manager
+# dateparser (~0.4 s to import; task_manager.deadlines falls back to it for phrases its
+# grammar doesn't cover), the system detector / blockers and the blocklist manager (which
+# creates blocklist.json on import) are imported where they are used, so commands that
+# never need them don't pay for them at startup.
 
 def parse_deadline(raw_string: str):
     """Parse natural language date/time strings. Always returns timezone-naive datetime."""
     if not raw_string or not raw_string.strip():
         return None
         
-    import re
     raw = raw_string.strip()
 
     # FAST PATH — explicit / ISO numeric dates handled directly. Two reasons this must run
@@ -41,43 +38,18 @@ def parse_deadline(raw_string: str):
         return _iso.replace(tzinfo=None) if _iso.tzinfo else _iso
     except (ValueError, TypeError):
         pass
+    # Numeric dates only ("5pm" / "3 days" skip them): strptime costs ~20us per failed format
+    _numeric = raw[:1].isdigit() and ('-' in raw or '/' in raw)
     for _fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M",
-                 "%Y/%m/%d", "%d-%m-%Y", "%d/%m/%Y"):
+                 "%Y/%m/%d", "%d-%m-%Y", "%d/%m/%Y") if _numeric else ():
         try:
             return datetime.strptime(raw, _fmt)
         except ValueError:
             pass
 
-    processed = raw.lower()
-
-    # "monday 17h" -> "monday 17:00"
-    processed = re.sub(r'(?<!in )(?<!\+)\b(\d{1,2})h\b', r'\1:00', processed)
-
-    # exact matches
-    if processed == "tomorrow":
-        processed = "tomorrow 9am"
-    elif processed == "morning":
-        processed = "tomorrow 9am"
-    elif processed == "evening":
-        processed = "today 6pm"
-
-    # next day
-    processed = re.sub(r'\bnext\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', r'\1', processed)
-
-    dt = dateparser.parse(
-        processed,
-        settings={
-            'PREFER_DATES_FROM': 'future',
-            'PREFER_DAY_OF_MONTH': 'first',
-            'DATE_ORDER': 'DMY',
-            'RETURN_AS_TIMEZONE_AWARE': False,
-            'TIMEZONE': 'local'
-        },
-        languages=['en']  # constrain to English — skips the ~200-locale scan (the real hang)
-    )
-    if dt and dt.tzinfo is not None:
-        dt = dt.replace(tzinfo=None)
-    return dt
+    # Everything else: the native phrase grammar (cached), dateparser as the last resort
+    from task_manager.deadlines import parse_phrase
+    return parse_phrase(raw)
 
 def format_deadline_display(task: Task) -> str:
     if not getattr(task, 'deadline', None):
@@ -120,12 +92,9 @@ def format_deadline_display(task: Task) -> str:
         return f"{Fore.WHITE}{task.deadline}{Style.RESET_ALL}"
 
 def log_behavior(event_dict):
-    log_file = storage.data_dir / "behavior_log.jsonl"
     event_dict["ts"] = datetime.now().isoformat()
     try:
-        storage.data_dir.mkdir(exist_ok=True)
-        with open(log_file, "a") as f:
-            f.write(json.dumps(event_dict) + "\n")
+        storage.behavior.append(event_dict)   # appends to behavior_log.jsonl + updates its index
     except Exception:
         pass
 
@@ -231,7 +200,7 @@ def postpone_flow(task: Task, tasks: List[Task], original_deadline: datetime, to
         task.last_decision = "D"
         task.last_decision_at = now.isoformat()
         task.last_missed_prompt = today_str
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         print(Fore.WHITE + Style.DIM + "Task dropped. It's done with." + Style.RESET_ALL)
         
         hours_overdue = (now - original_deadline).total_seconds() / 3600.0
@@ -294,7 +263,7 @@ def postpone_flow(task: Task, tasks: List[Task], original_deadline: datetime, to
         task.reminder_fired = False
         task.reminder_fired_2 = False
         task.reminder_dismissed = False
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         
         print(f"Rescheduled to {new_dt.strftime('%A, %d %b at %I:%M %p')}.")
         new_count = task.postpone_count
@@ -372,7 +341,7 @@ def prompt_missed_task(task: Task, tasks: List[Task]) -> bool:
         task.last_decision = "E"
         task.last_decision_at = datetime.now().isoformat()
         task.last_missed_prompt = today_str
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         print(Fore.GREEN + Style.BRIGHT + "Execution started. Focus up." + Style.RESET_ALL)
         
         hours_overdue = (datetime.now() - original_deadline).total_seconds() / 3600.0
@@ -394,7 +363,7 @@ def prompt_missed_task(task: Task, tasks: List[Task]) -> bool:
         task.last_decision = "D"
         task.last_decision_at = datetime.now().isoformat()
         task.last_missed_prompt = today_str
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         print(Fore.WHITE + Style.DIM + "Task dropped. It's done with." + Style.RESET_ALL)
 
         hours_overdue = (datetime.now() - original_deadline).total_seconds() / 3600.0
@@ -417,7 +386,7 @@ def prompt_missed_task(task: Task, tasks: List[Task]) -> bool:
         task.last_missed_prompt = today_str
         note = get_valid_input("Brief note (who/why) [optional]: ").strip()
         task.offload_note = note
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         print(Fore.WHITE + Style.DIM + "Noted. Responsibility transferred." + Style.RESET_ALL)
 
         hours_overdue = (datetime.now() - original_deadline).total_seconds() / 3600.0
@@ -602,7 +571,7 @@ def command_postpone(task_id: int) -> bool:
             task.last_decision = "E"
             task.last_decision_at = datetime.now().isoformat()
             task.last_missed_prompt = today_str
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             print(Fore.GREEN + Style.BRIGHT + "Execution started. Focus up." + Style.RESET_ALL)
             hours_overdue = (datetime.now() - original_deadline).total_seconds() / 3600.0
             log_behavior({
@@ -622,7 +591,7 @@ def command_postpone(task_id: int) -> bool:
             task.last_decision = "D"
             task.last_decision_at = datetime.now().isoformat()
             task.last_missed_prompt = today_str
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             print(Fore.WHITE + Style.DIM + "Task dropped. It's done with." + Style.RESET_ALL)
             hours_overdue = (datetime.now() - original_deadline).total_seconds() / 3600.0
             log_behavior({
@@ -643,7 +612,7 @@ def command_postpone(task_id: int) -> bool:
             task.last_missed_prompt = today_str
             note = get_valid_input("Brief note (who/why) [optional]: ").strip()
             task.offload_note = note
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             print(Fore.WHITE + Style.DIM + "Noted. Responsibility transferred." + Style.RESET_ALL)
             hours_overdue = (datetime.now() - original_deadline).total_seconds() / 3600.0
             log_behavior({
@@ -763,7 +732,7 @@ def check_reminders(tasks: List[Task]) -> List[Task]:
             })
             
     if due:
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         if len(due) >= 3:
             print(Fore.YELLOW + f"You have {len(due)} reminders firing at once. Showing one at a time." + Style.RESET_ALL)
             
@@ -843,7 +812,7 @@ def check_reminders(tasks: List[Task]) -> List[Task]:
                 "response": task.reminder_response,
                 "response_delay_seconds": _delay
             })
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
 
     return due
 
@@ -863,7 +832,7 @@ def command_remind(task_id: int, set_str: str = None, clear: bool = False) -> bo
         task.reminder_fired = False
         task.reminder_fired_2 = False
         task.reminder_dismissed = False
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         print(f"Reminders cleared for task #{task_id}.")
         return True
         
@@ -875,7 +844,7 @@ def command_remind(task_id: int, set_str: str = None, clear: bool = False) -> bo
         task.reminder_time = parsed.isoformat()
         task.reminder_fired = False
         task.reminder_dismissed = False
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         print(f"Reminder updated: {parsed.strftime('%A %d %b at %I:%M %p')}")
         return True
         
@@ -1070,6 +1039,7 @@ class FocusManager:
             gentle_mode = (mode == "gentle")
             self.blocker.start_focus(sites, apps, gentle_mode=gentle_mode, interactive=interactive)
             
+            from .system_detector import SystemDetector
             if mode == "strict" and not SystemDetector.is_admin():
                 print("\n⚠️  Note: For strict blocking, run TaskFlow as Administrator")
                 print("   Currently running in gentle reminder mode")
@@ -1466,7 +1436,7 @@ class TimeTracker:
             for task in tasks:
                 if task.id == session.get('task_id'):
                     task.add_focus_minutes(session_minutes)
-                    storage.save_tasks(tasks)
+                    storage.commit(tasks)
                     break
             if completed:
                 self.increment_cycle()
@@ -1812,7 +1782,7 @@ def edit_note(task_id: int) -> bool:
         task.description = new_desc
         task.description_updated_at = datetime.now().isoformat()
         
-    storage.save_tasks(tasks)
+    storage.commit(tasks)
     if task.description:
         print(Fore.GREEN + f"→ Notes updated for task #{task_id}." + Style.RESET_ALL)
     else:
@@ -1859,7 +1829,7 @@ def manage_links(task_id: int, add_url: str = None, title: str = None) -> bool:
             "added_at": datetime.now().isoformat()
         })
         task.links_count = len(task.links)
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         print(Fore.GREEN + f"→ Link {link_id} added." + Style.RESET_ALL)
         return True
         
@@ -1919,7 +1889,7 @@ def manage_links(task_id: int, add_url: str = None, title: str = None) -> bool:
                 "added_at": datetime.now().isoformat()
             })
             task.links_count = len(task.links)
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             print(Fore.GREEN + f"→ Link added." + Style.RESET_ALL)
             
         elif choice == 'R':
@@ -1936,7 +1906,7 @@ def manage_links(task_id: int, add_url: str = None, title: str = None) -> bool:
             if confirm == 'y' or confirm == '':
                 task.links.remove(link_obj)
                 task.links_count = len(task.links)
-                storage.save_tasks(tasks)
+                storage.commit(tasks)
                 print(Fore.GREEN + "→ Link removed." + Style.RESET_ALL)
                 
         elif choice == 'O':
@@ -2010,7 +1980,7 @@ def manage_checklist(task_id: int, toggle_index: int = None) -> bool:
             
         task.checklist_total = len(task.checklist)
         task.checklist_done = sum(1 for x in task.checklist if x.get("done"))
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         return True
         
     # Interactive menu
@@ -2068,7 +2038,7 @@ def manage_checklist(task_id: int, toggle_index: int = None) -> bool:
             })
             task.checklist_total = len(task.checklist)
             task.checklist_done = sum(1 for x in task.checklist if x.get("done"))
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             print(Fore.GREEN + "→ Item added." + Style.RESET_ALL)
             
         elif choice.upper() == 'R':
@@ -2082,7 +2052,7 @@ def manage_checklist(task_id: int, toggle_index: int = None) -> bool:
                     task.checklist.pop(idx)
                     task.checklist_total = len(task.checklist)
                     task.checklist_done = sum(1 for x in task.checklist if x.get("done"))
-                    storage.save_tasks(tasks)
+                    storage.commit(tasks)
                     print(Fore.GREEN + "→ Item removed." + Style.RESET_ALL)
                 else:
                     print("Invalid item number.")
@@ -2105,7 +2075,7 @@ def manage_checklist(task_id: int, toggle_index: int = None) -> bool:
                         print(Fore.GREEN + f"→ Item {num} marked complete." + Style.RESET_ALL)
                     task.checklist_total = len(task.checklist)
                     task.checklist_done = sum(1 for x in task.checklist if x.get("done"))
-                    storage.save_tasks(tasks)
+                    storage.commit(tasks)
                 else:
                     print("Invalid item number.")
             except ValueError:
@@ -2307,8 +2277,8 @@ def add_task(is_hard: bool = False, preset_deadline: str = None, preset_duration
         calculate_reminder_time(task)
         
     try:
-        task_id = manager.add_task(task)
-        storage.save_tasks(manager.tasks)
+        manager.add_task(task)
+        storage.commit(manager.tasks)
         
         # E2 custom success message
         desc_notes = " · notes added" if task.description else ""
@@ -2323,33 +2293,28 @@ def add_task(is_hard: bool = False, preset_deadline: str = None, preset_duration
         
         if desc_notes or link_str or chk_str:
             dur_part = f". Est. {duration}" if duration else ""
-            print(f"→ Task #{task_id} added{dur_part}{desc_notes}{link_str}{chk_str}.")
+            print(f"→ Task #{task.id} added{dur_part}{desc_notes}{link_str}{chk_str}.")
         else:
             if duration:
-                print(f"→ Task #{task_id} added. Est. {duration}.")
+                print(f"→ Task #{task.id} added. Est. {duration}.")
             else:
-                print(f"→ Task #{task_id} added successfully.")
+                print(f"→ Task #{task.id} added successfully.")
         return True
     except Exception as e:
         Messenger.careful(f"Could not add task: {e}")
         return False
 
-def dump_task(title: str, duration: str = None, deadline: str = None, is_hard: bool = False, note: str = None, links: list = None, force: bool = False, is_event: bool = False, at: str = None) -> dict:
-    """Frictionless capture: instantly add a task without prompts.
-
-    note     : optional description string (E3 --note).
-    links    : optional list of {"url": str, "title": str|None} dicts (E3 --link/--link-title).
-    force    : skip the duplicate guard (BUG 2).
-    is_event : create a time-locked Event instead of a Task (BUG 5; uses `at`/deadline for the slot).
-    at       : event start ("2026-07-18 14:00" / "tomorrow 3pm"); only used when is_event.
+def build_dump_task(manager: TaskManager, title: str, duration: str = None, deadline: str = None,
+                    is_hard: bool = False, note: str = None, links: list = None, force: bool = False,
+                    is_event: bool = False, at: str = None):
+    """The parsing half of dump_task (same arguments), against `manager`'s tasks; saves nothing.
 
-    Returns the task dict on success, None when there's nothing to capture, or False when it
-    was skipped as a duplicate (so callers can tell the three cases apart).
+    Returns (task, None, None) — a new Task with id 0, not yet added — or (None, existing,
+    "title" | "link") when the duplicate guard matched an open task, or (None, None, None)
+    when there's nothing to capture.
     """
     import re
     from datetime import datetime
-    tasks = storage.load_tasks()
-    manager = TaskManager(tasks)
 
     # Frictionless Parser: Extract #tags and !priority
     tags = ["inbox"]
@@ -2409,7 +2374,7 @@ def dump_task(title: str, duration: str = None, deadline: str = None, is_hard: b
     clean_title = validate_title(clean_title)
 
     if not clean_title:
-        return None
+        return None, None, None
 
     # BUG 2: refuse exact duplicates — same normalized title OR same link URL — unless --force.
     # Keeps automated callers (e.g. Opportunity Hunter) from piling up identical tasks.
@@ -2423,20 +2388,12 @@ def dump_task(title: str, duration: str = None, deadline: str = None, is_hard: b
             if getattr(_t, 'completed', False) or getattr(_t, 'status', None) in ('completed', 'done', 'dropped', 'offloaded'):
                 continue
             if _new_title and _norm(getattr(_t, 'title', '')) == _new_title:
-                try:
-                    print(f"Looks like a duplicate of #{_t.id}: \"{_t.title}\". Use --force to add anyway.")
-                except Exception:
-                    pass
-                return False
+                return None, _t, "title"
             if _new_urls:
                 _existing = {(_lnk.get('url') or '').strip().lower().rstrip('/')
                              for _lnk in (getattr(_t, 'links', None) or []) if isinstance(_lnk, dict) and _lnk.get('url')}
                 if _new_urls & _existing:
-                    try:
-                        print(f"Looks like a duplicate of #{_t.id} (same link). Use --force to add anyway.")
-                    except Exception:
-                        pass
-                    return False
+                    return None, _t, "link"
 
     task = Task(
         id=0,
@@ -2447,6 +2404,7 @@ def dump_task(title: str, duration: str = None, deadline: str = None, is_hard: b
     
     task.duration = normalize_duration(duration)  # D1-01: bucket free text → valid enum (or None)
 
+    parsed_dl = None
     if deadline:
         parsed_dl = parse_deadline(deadline)
         if parsed_dl:
@@ -2475,7 +2433,7 @@ def dump_task(title: str, duration: str = None, deadline: str = None, is_hard: b
         task.mission_type = "Event"
         _evt_dt = parse_deadline(at) if at else None
         if not _evt_dt and deadline:
-            _evt_dt = parse_deadline(deadline)
+            _evt_dt = parsed_dl
         elif not _evt_dt and inline_deadline_dt:
             _evt_dt = inline_deadline_dt
         if _evt_dt:
@@ -2502,9 +2460,41 @@ def dump_task(title: str, duration: str = None, deadline: str = None, is_hard: b
         task.links = assembled
         task.links_count = len(assembled)
 
+    return task, None, None
+
+
+def dump_task(title: str, duration: str = None, deadline: str = None, is_hard: bool = False, note: str = None, links: list = None, force: bool = False, is_event: bool = False, at: str = None) -> dict:
+    """Frictionless capture: instantly add a task without prompts.
+
+    note     : optional description string (E3 --note).
+    links    : optional list of {"url": str, "title": str|None} dicts (E3 --link/--link-title).
+    force    : skip the duplicate guard (BUG 2).
+    is_event : create a time-locked Event instead of a Task (BUG 5; uses `at`/deadline for the slot).
+    at       : event start ("2026-07-18 14:00" / "tomorrow 3pm"); only used when is_event.
+
+    Returns the task dict on success, None when there's nothing to capture, or False when it
+    was skipped as a duplicate (so callers can tell the three cases apart).
+    """
+    tasks = storage.load_tasks()
+    manager = TaskManager(tasks)
+    task, duplicate, why = build_dump_task(manager, title, duration=duration, deadline=deadline, is_hard=is_hard,
+                                           note=note, links=links, force=force, is_event=is_event, at=at)
+    if duplicate is not None:
+        try:
+            if why == "link":
+                print(f"Looks like a duplicate of #{duplicate.id} (same link). Use --force to add anyway.")
+            else:
+                print(f"Looks like a duplicate of #{duplicate.id}: \"{duplicate.title}\". Use --force to add anyway.")
+        except Exception:
+            pass
+        return False
+    if task is None:
+        return None
+    clean_title, tags = task.title, task.tags
+
     try:
-        task_id = manager.add_task(task)
-        storage.save_tasks(manager.tasks)
+        manager.add_task(task)
+        storage.commit(manager.tasks)
         try:
             prin_tags = ", ".join(f"#{t}" for t in tags)
             print(f"\nCaptured: {clean_title} | [{task.priority}] {prin_tags}")
@@ -2616,8 +2606,11 @@ def kill_web_ui():
         print(f"⚠️  Error during cleanup: {e}")
         return False
 
-def open_web_ui(force=False):
-    """Launch the System Control Web Dashboard (Quantum Resolve)."""
+def open_web_ui(force=False, async_server=False):
+    """Launch the System Control Web Dashboard (Quantum Resolve).
+
+    async_server: start the asyncio server (HTTP/1.1 keep-alive) instead of the threaded one.
+    """
     import subprocess
     import time
     import webbrowser
@@ -2661,12 +2654,13 @@ def open_web_ui(force=False):
         # (it used to go to DEVNULL, which is why a failed server looked like "nothing happened").
         server_log = storage.data_dir / "server.log"
         logf = open(server_log, "a", buffering=1)
+        server_cmd = [sys.executable, str(server_path)] + (["--async"] if async_server else [])
         if sys.platform == "win32":
-            subprocess.Popen([sys.executable, str(server_path)],
+            subprocess.Popen(server_cmd,
                              creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS,
                              stdout=logf, stderr=logf)
         else:
-            subprocess.Popen([sys.executable, str(server_path)],
+            subprocess.Popen(server_cmd,
                              stdout=logf, stderr=logf, start_new_session=True)
 
         # Wait for the server to ACTUALLY bind (don't just sleep and hope).
@@ -2834,11 +2828,15 @@ def _enrichment_indicators(t) -> str:
     parts = []
     if getattr(t, 'description', None):
         parts.append("📝" if supports_emoji else "[note]")
-    if getattr(t, 'links', None):
-        parts.append(f"🔗 ×{len(t.links)}" if supports_emoji else f"[{len(t.links)} links]")
-    if getattr(t, 'checklist', None):
-        done = sum(1 for x in t.checklist if x.get('done'))
-        parts.append(f"☑ {done}/{len(t.checklist)}" if supports_emoji else f"[{done}/{len(t.checklist)}]")
+    # Counters, not the lists themselves (Rule #2 keeps them in sync): a list row must not
+    # pull a TaskHeader's links/checklist off disk.
+    n_links = getattr(t, 'links_count', 0) or 0
+    if n_links:
+        parts.append(f"🔗 ×{n_links}" if supports_emoji else f"[{n_links} links]")
+    total = getattr(t, 'checklist_total', 0) or 0
+    if total:
+        done = getattr(t, 'checklist_done', 0) or 0
+        parts.append(f"☑ {done}/{total}" if supports_emoji else f"[{done}/{total}]")
     return " · ".join(parts)
 
 
@@ -3009,7 +3007,7 @@ def list_tasks(filter_status: Optional[str] = None,
     x dropped / → offloaded (--all). OVERDUE is capped at 10 in the default view (full via
     --overdue) and shows DATES, never crushing hour counts. Filters apply within groups.
     """
-    tasks = storage.load_tasks()
+    tasks = storage.load_task_headers()   # read-only: heavy fields stay on disk
     print_list_missed_banner(tasks)  # PASSIVE notice only — never prompts (see: taskflow missed)
     if not tasks:
         Messenger.empty_list()
@@ -3243,6 +3241,99 @@ def _generate_dopamine(task_id: int = None, increment: bool = True) -> dict:
     }
 
 
+def _mark_completed(task) -> dict:
+    """Apply a completion to `task` in memory; returns its task_completed behavior event (not logged)."""
+    # Calculate pressure level BEFORE marking completed
+    level = get_pressure_level(task)
+    task.pressure_level_at_completion = level
+    task.completed_under_pressure = (level >= 2)
+
+    # S4-D Now Window tracking
+    if getattr(task, 'deadline', None):
+        try:
+            deadline_dt = datetime.fromisoformat(task.deadline)
+            if deadline_dt.tzinfo is not None:
+                deadline_dt = deadline_dt.replace(tzinfo=None)
+            
+            completion_time = datetime.now()
+            window_start = completion_time - timedelta(minutes=45)
+            window_end = completion_time + timedelta(minutes=45)
+            
+            if window_start <= deadline_dt <= window_end:
+                task.executed_in_window = True
+            else:
+                task.executed_in_window = False
+            
+            drift = (completion_time - deadline_dt).total_seconds() / 60.0
+            task.window_drift_minutes = int(drift)
+        except ValueError:
+            task.executed_in_window = None
+            task.window_drift_minutes = None
+    else:
+        task.executed_in_window = None
+        task.window_drift_minutes = None
+
+    task.completed = True
+    task.status = "completed"
+    _record_edit(task, "status", "todo", "completed", always=True)
+    task.completed_at = datetime.now().strftime("%Y-%m-%d %H:%M")
+    task.actual_end_time = datetime.now().isoformat()
+    
+    if task.actual_start_time and task.duration:
+        try:
+            start_dt = datetime.fromisoformat(task.actual_start_time)
+            end_dt = datetime.fromisoformat(task.actual_end_time)
+            actual_min = (end_dt - start_dt).total_seconds() / 60.0
+            
+            # Parse duration string to minutes
+            dur_str = task.duration.lower()
+            est_min = None
+            if dur_str == "15m": est_min = 15
+            elif dur_str == "30m": est_min = 30
+            elif dur_str == "1h": est_min = 60
+            elif dur_str == "2h": est_min = 120
+            elif dur_str == "3h": est_min = 180
+            elif dur_str == "4h+": est_min = 240
+            
+            if est_min:
+                task.duration_accuracy_ratio = round(actual_min / est_min, 2)
+        except Exception:
+            pass
+    elif not task.actual_start_time:
+        task.duration_accuracy_ratio = None
+
+    # S8-H: behavior log on completion
+    _actual_min = None
+    _est_min = None
+    try:
+        if task.actual_start_time and task.actual_end_time:
+            _s = datetime.fromisoformat(task.actual_start_time)
+            _e = datetime.fromisoformat(task.actual_end_time)
+            _actual_min = round((_e - _s).total_seconds() / 60.0, 1)
+        if task.duration:
+            _est_min = {"15m": 15, "30m": 30, "1h": 60, "2h": 120, "3h": 180, "4h+": 240}.get(task.duration.lower())
+    except Exception:
+        pass
+
+    event = {
+        "event": "task_completed",
+        "task_id": task.id,
+        "pressure_level": getattr(task, 'pressure_level_at_completion', None),
+        "completed_under_pressure": getattr(task, 'completed_under_pressure', None),
+        "duration_actual_minutes": _actual_min,
+        "duration_estimated_minutes": _est_min,
+        "accuracy_ratio": getattr(task, 'duration_accuracy_ratio', None)
+    }
+
+    # S10-E: Daily Execution Path adherence — record which slot this was actually done in
+    if getattr(task, 'planned_slot', None):
+        _now_slot = datetime.now()
+        task.actual_slot = _time_bucket(_now_slot.hour)
+        task.slot_drift = _slot_drift_minutes(task.planned_slot, _now_slot)
+
+    return event
+
+
 def complete_task(task_id: int):
     """Mark a task as completed and trigger Dopamine Engine."""
     tasks = storage.load_tasks()
@@ -3263,94 +3354,9 @@ def complete_task(task_id: int):
                 except: pass
                 return dopamine
 
-            # Calculate pressure level BEFORE marking completed
-            level = get_pressure_level(task)
-            task.pressure_level_at_completion = level
-            task.completed_under_pressure = (level >= 2)
-
-            # S4-D Now Window tracking
-            if getattr(task, 'deadline', None):
-                try:
-                    deadline_dt = datetime.fromisoformat(task.deadline)
-                    if deadline_dt.tzinfo is not None:
-                        deadline_dt = deadline_dt.replace(tzinfo=None)
-                    
-                    completion_time = datetime.now()
-                    window_start = completion_time - timedelta(minutes=45)
-                    window_end = completion_time + timedelta(minutes=45)
-                    
-                    if window_start <= deadline_dt <= window_end:
-                        task.executed_in_window = True
-                    else:
-                        task.executed_in_window = False
-                    
-                    drift = (completion_time - deadline_dt).total_seconds() / 60.0
-                    task.window_drift_minutes = int(drift)
-                except ValueError:
-                    task.executed_in_window = None
-                    task.window_drift_minutes = None
-            else:
-                task.executed_in_window = None
-                task.window_drift_minutes = None
-
-            task.completed = True
-            task.status = "completed"
-            _record_edit(task, "status", "todo", "completed", always=True)
-            task.completed_at = datetime.now().strftime("%Y-%m-%d %H:%M")
-            task.actual_end_time = datetime.now().isoformat()
-            
-            if task.actual_start_time and task.duration:
-                try:
-                    start_dt = datetime.fromisoformat(task.actual_start_time)
-                    end_dt = datetime.fromisoformat(task.actual_end_time)
-                    actual_min = (end_dt - start_dt).total_seconds() / 60.0
-                    
-                    # Parse duration string to minutes
-                    dur_str = task.duration.lower()
-                    est_min = None
-                    if dur_str == "15m": est_min = 15
-                    elif dur_str == "30m": est_min = 30
-                    elif dur_str == "1h": est_min = 60
-                    elif dur_str == "2h": est_min = 120
-                    elif dur_str == "3h": est_min = 180
-                    elif dur_str == "4h+": est_min = 240
-                    
-                    if est_min:
-                        task.duration_accuracy_ratio = round(actual_min / est_min, 2)
-                except Exception:
-                    pass
-            elif not task.actual_start_time:
-                task.duration_accuracy_ratio = None
-
-            # S8-H: behavior log on completion
-            _actual_min = None
-            _est_min = None
-            try:
-                if task.actual_start_time and task.actual_end_time:
-                    _s = datetime.fromisoformat(task.actual_start_time)
-                    _e = datetime.fromisoformat(task.actual_end_time)
-                    _actual_min = round((_e - _s).total_seconds() / 60.0, 1)
-                if task.duration:
-                    _est_min = {"15m": 15, "30m": 30, "1h": 60, "2h": 120, "3h": 180, "4h+": 240}.get(task.duration.lower())
-            except Exception:
-                pass
-            log_behavior({
-                "event": "task_completed",
-                "task_id": task.id,
-                "pressure_level": getattr(task, 'pressure_level_at_completion', None),
-                "completed_under_pressure": getattr(task, 'completed_under_pressure', None),
-                "duration_actual_minutes": _actual_min,
-                "duration_estimated_minutes": _est_min,
-                "accuracy_ratio": getattr(task, 'duration_accuracy_ratio', None)
-            })
-
-            # S10-E: Daily Execution Path adherence — record which slot this was actually done in
-            if getattr(task, 'planned_slot', None):
-                _now_slot = datetime.now()
-                task.actual_slot = _time_bucket(_now_slot.hour)
-                task.slot_drift = _slot_drift_minutes(task.planned_slot, _now_slot)
+            log_behavior(_mark_completed(task))
 
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
 
             dopamine = _generate_dopamine(task_id, increment=True)
             streak = dopamine['streak']
@@ -3378,7 +3384,7 @@ def delete_task(task_id: int) -> bool:
     for task in tasks:
         if task.id == task_id:
             tasks.remove(task)
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             Messenger.success(f"Task #{task_id} removed successfully.")
             return True
     
@@ -3398,7 +3404,7 @@ def rename_task(task_id: int) -> bool:
                 return False
             
             task.title = new_title
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             Messenger.success(f"Task #{task_id} renamed.")
             return True
     
@@ -3489,7 +3495,7 @@ def undo_task(task_id: int) -> bool:
             
             task.completed = False
             task.completed_at = None
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             Messenger.success(f"Task #{task_id} moved back to TODO.")
             return True
     
@@ -3791,19 +3797,20 @@ def edit_task(task_id: int) -> bool:
         task.description = new_desc
         task.description_updated_at = datetime.now().isoformat()
 
-    storage.save_tasks(tasks)
+    storage.commit(tasks)
     Messenger.success(f"Mission #{task_id} updated.")
     return True
 
 
-def search_tasks(keyword: str) -> None:
-    """Search tasks by keyword."""
-    tasks = storage.load_tasks()
-    
-    matches = [
-        task for task in tasks
-        if keyword.lower() in task.title.lower()
-    ]
+def search_tasks(keyword: str, status: Optional[str] = None, priority: Optional[str] = None,
+                 tag: Optional[str] = None, limit: int = 20, reindex: bool = False) -> None:
+    """Search tasks by keyword (title, notes, description, tags, checklist, links), best match first."""
+    try:
+        matches = storage.search_tasks(keyword, status=status, priority=priority, tag=tag,
+                                       limit=limit, reindex=reindex)
+    except Exception as e:
+        print(f"Error: Search failed: {e}")
+        return
     
     if not matches:
         Messenger.note("No matching tasks found.")
@@ -3812,18 +3819,22 @@ def search_tasks(keyword: str) -> None:
     print(f"\n{'ID':<{COL_WIDTHS['id']}} | "
           f"{'STATUS':<{COL_WIDTHS['status']}} | "
           f"{'TITLE':<{COL_WIDTHS['title']}} | "
-          f"{'PRIORITY':<{COL_WIDTHS['priority']}}")
+          f"{'PRIORITY':<{COL_WIDTHS['priority']}} | "
+          f"MATCHED IN")
     
     separator = "-" * (COL_WIDTHS['id'] + COL_WIDTHS['status'] + 
-                      COL_WIDTHS['title'] + COL_WIDTHS['priority'] + 15)
+                      COL_WIDTHS['title'] + COL_WIDTHS['priority'] + 15 + 14)
     print(separator)
     
-    for task in matches:
-        status = "DONE" if task.completed else "TODO"
-        print(f"{task.id:<{COL_WIDTHS['id']}} | "
-              f"{status:<{COL_WIDTHS['status']}} | "
-              f"{task.title:<{COL_WIDTHS['title']}} | "
-              f"{task.priority:<{COL_WIDTHS['priority']}}")
+    for match in matches:
+        title = match['title']
+        if len(title) > COL_WIDTHS['title']:
+            title = title[:COL_WIDTHS['title'] - 3] + "..."
+        print(f"{match['id']:<{COL_WIDTHS['id']}} | "
+              f"{match['status'].upper():<{COL_WIDTHS['status']}} | "
+              f"{title:<{COL_WIDTHS['title']}} | "
+              f"{match['priority']:<{COL_WIDTHS['priority']}} | "
+              f"{', '.join(match['fields'])}")
 
 
 def clear_completed_tasks() -> bool:
@@ -3840,7 +3851,7 @@ def clear_completed_tasks() -> bool:
         return False
     
     tasks = [t for t in tasks if not t.completed]
-    storage.save_tasks(tasks)
+    storage.commit(tasks)
     Messenger.success(f"Cleared {len(completed)} completed task(s).")
     return True
 
@@ -3883,7 +3894,7 @@ def reset_tasks() -> bool:
         Messenger.info("Reset cancelled.")
         return False
     
-    storage.save_tasks([])
+    storage.commit([])
     Messenger.success("All tasks have been cleared.")
     Messenger.note("Fresh start. Nothing lost — only space created.")
     return True
@@ -3943,7 +3954,7 @@ def command_fresh_start(scope: str = "red") -> bool:
         t.reminder_time = None
         t.reminder_time_2 = None
         _record_edit(t, "deadline", old, None, reason_text="fresh start — lifted overdue", always=True)
-    storage.save_tasks(tasks)
+    storage.commit(tasks)
     Messenger.success(f"Cleared the red on {len(overdue)} task(s). The board is calm.")
     Messenger.note("They're still here when you want them — just no longer overdue. Pick one to begin.")
     return True
@@ -4292,14 +4303,14 @@ def command_ai(goal: str, auto_confirm: bool = False) -> None:
         except Exception:
             pass
     if new_tasks:
-        storage.save_tasks(existing + new_tasks)
+        storage.commit(existing + new_tasks)
 
     Messenger.success(f"Created {created}/{len(tasks)} tasks. Run 'taskflow today' to see them.")
 
 
 def view_task(task_id: int) -> None:
     """View detailed MISSION BRIEF for a task with enrichment (E4)."""
-    tasks = storage.load_tasks()
+    tasks = storage.load_task_headers()   # only this task's heavy fields get loaded
     
     task = next((t for t in tasks if t.id == task_id), None)
     if not task:
@@ -4512,7 +4523,7 @@ def change_priority(task_id: int, level: str) -> bool:
     for task in tasks:
         if task.id == task_id:
             task.priority = priority
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             Messenger.success(f"Priority updated to {priority}.")
             return True
     
@@ -4521,13 +4532,17 @@ def change_priority(task_id: int, level: str) -> bool:
 
 def list_ids() -> None:
     """Display only task IDs (power-user helper)."""
-    tasks = storage.load_tasks()
+    # Streamed: with the rows format the first ids print before the whole file is decoded
+    printed = False
+    for task in storage.iter_tasks():
+        sys.stdout.write((" " if printed else "") + str(task.id))
+        printed = True
 
-    if not tasks:
+    if not printed:
         Messenger.empty_list()
         return
 
-    print(" ".join(str(task.id) for task in tasks))
+    print()
 
 
 
@@ -4562,9 +4577,10 @@ def focus_task(task_id: int, minutes: int = 25,
                 
             if not task.actual_start_time:
                 task.actual_start_time = datetime.now().isoformat()
-                storage.save_tasks(tasks)
+                storage.commit(tasks)
                 
             # --- BLOCKLIST INTEGRATION ---
+            from .blockers.blocklist import blocklist_manager
             # `force` = non-interactive (the web server / scripts). NEVER call input() then, or the
             # request thread blocks on stdin and the session never starts (real bug for web strict).
             if (mode in ["strict", "gentle"]) and not block_sites and not force:
@@ -4740,6 +4756,7 @@ def focus_blocking_status():
         print("=" * 40)
         
         # System info
+        from .system_detector import SystemDetector
         sys_info = SystemDetector.get_system_info()
         print(f"Platform: {sys_info['os'].upper()}")
         print(f"Admin rights: {'✅ Yes' if sys_info['admin'] else '❌ No'}")
@@ -4805,6 +4822,7 @@ def test_blocking(mode="gentle"):
     print(f"✅ Blocking active: {status['active']}")
     print(f"   Mode: {'Gentle' if status.get('gentle_mode') else 'Strict'}")
     
+    from .system_detector import SystemDetector
     if mode == "strict" and not SystemDetector.is_admin():
         print("\n⚠️  Note: Strict mode requires administrator privileges.")
         print("   Run 'taskflow' as Administrator for full blocking.")
@@ -5050,7 +5068,7 @@ def schedule_task(task_id: int, date_str: str) -> bool:
         storage.save_timeline(mapping)
         
         task.scheduled_date = scheduled_date
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         
         Messenger.success(f"Task #{task_id} logically deployed to {scheduled_date}")
         return True
@@ -5083,7 +5101,7 @@ def set_prime_target(task_id: int, date_str: str = 'today') -> bool:
         storage.save_timeline(mapping)
         
         task.prime_target_date = scheduled_date
-        storage.save_tasks(tasks)
+        storage.commit(tasks)
         
         Messenger.success(f"🎯 Task #{task_id} is now your [PRIME TARGET] for {scheduled_date}")
         return True
@@ -5180,7 +5198,7 @@ def add_note(task_id: int) -> bool:
             print(f"\nCurrent notes: {task.notes or 'None'}")
             new_note = get_valid_input("New notes: ")
             task.notes = new_note
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             Messenger.success(f"Notes updated for task #{task_id}.")
             return True
     
@@ -5197,7 +5215,7 @@ def tag_task(task_id: int, tags: List[str]) -> bool:
             for tag in tags:
                 if tag not in task.tags:
                     task.tags.append(tag)
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             Messenger.success(f"Tags added to task #{task_id}.")
             return True
     
@@ -5208,7 +5226,7 @@ def tag_task(task_id: int, tags: List[str]) -> bool:
 def backup_tasks() -> bool:
     """Create a manual backup."""
     backups = storage.get_backup_list()
-    if storage.save_tasks(storage.load_tasks()):  # Triggers backup
+    if storage.create_backup():
         Messenger.success(f"Backup created. Total backups: {len(backups) + 1}")
         return True
     return False
@@ -5220,6 +5238,7 @@ def backup_tasks() -> bool:
 
 def manage_blocklist(action: str, sites: list = None, indices: list = None):
     """Manage the persistent blocklist."""
+    from .blockers.blocklist import blocklist_manager
     if action == "list":
         saved = blocklist_manager.load_sites()
         if not saved:
@@ -5562,7 +5581,7 @@ def generate_and_persist_path(compute_prev_adherence: bool = True):
 
     Returns (sections, total_minutes). Used by `taskflow path` and POST /api/path/generate.
     """
-    tasks = storage.load_tasks()
+    tasks = storage.load_task_headers()
     config = storage.load_config()
     today_str = datetime.now().strftime('%Y-%m-%d')
 
@@ -5599,7 +5618,7 @@ def generate_and_persist_path(compute_prev_adherence: bool = True):
             slot_of[i] = s
     for t in tasks:
         t.planned_slot = slot_of.get(t.id)
-    storage.save_tasks(tasks)
+    storage.commit(tasks)
 
     config['path_generated_date'] = today_str
     config['path_tasks'] = (sections['prime'] + sections['secondary']
@@ -5958,7 +5977,7 @@ def _flush_focus_queue(lock=None):
                 added.append((t.title, tid))
             except Exception:
                 continue
-        storage.save_tasks(manager.tasks)
+        storage.commit(manager.tasks)
 
     # S11-D step 4: update the focused task's focus stats
     if task_id is not None and started:
@@ -5978,7 +5997,7 @@ def _flush_focus_queue(lock=None):
                         pass
                     t.last_focus_at = datetime.now().isoformat()
                     break
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
         except Exception:
             pass
 
@@ -6165,35 +6184,14 @@ def enqueue_focus_task(data):
 # S12: TIME INTEGRITY SCORE + BEHAVIOR DATA STORE
 # =========================================================
 
-def _behavior_log_path():
-    return storage.data_dir / "behavior_log.jsonl"
-
-
-def _all_behavior_entries():
-    """Read every behavior_log.jsonl entry (read-only — Rule #3)."""
-    out = []
-    f = _behavior_log_path()
-    if not f.exists():
-        return out
-    try:
-        with open(f, 'r', encoding='utf-8') as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    out.append(json.loads(line))
-                except Exception:
-                    continue
-    except Exception:
-        pass
-    return out
-
-
 def get_behavior_log_entries(date):
     """All behavior_log entries whose timestamp falls on `date` (YYYY-MM-DD)."""
-    return [e for e in _all_behavior_entries()
-            if isinstance(e.get('ts'), str) and e.get('ts', '')[:10] == date]
+    return storage.behavior.entries(since=date, until=date)
+
+
+def _completion_events_since(cutoff):
+    """task_completed events on or after `cutoff` (a date) — reads only those days' slices."""
+    return storage.behavior.entries(since=cutoff.strftime('%Y-%m-%d'), events=('task_completed',))
 
 
 def _parse_dt_any(s):
@@ -6228,24 +6226,76 @@ def calculate_time_integrity_score(s) -> int:
     return max(0, min(100, round(deadline_pts + exec_pts + postpone_pts + rec_pts)))
 
 
+def _deadline_naive(t):
+    dl = _parse_dt_any(getattr(t, 'deadline', None))
+    if dl is not None and dl.tzinfo is not None:
+        dl = dl.replace(tzinfo=None)
+    return dl
+
+
+def _recovery_sessions():
+    """recovery_log.json sessions (read once per summary run, not once per day)."""
+    try:
+        if storage.recovery_log_file.exists():
+            with open(storage.recovery_log_file, 'r') as rf:
+                return [s for s in json.load(rf) if isinstance(s, dict)]
+    except Exception:
+        pass
+    return []
+
+
 def compute_daily_summary(date, tasks, behavior_log_entries) -> dict:
     """Aggregate one day's behavior into the S12-A schema."""
+    return compute_daily_summaries([date], tasks, behavior_log_entries)[0]
+
+
+def compute_daily_summaries(dates, tasks, behavior_log_entries) -> list:
+    """S12-A summaries for many days in ONE pass over tasks, events and recovery sessions.
+
+    Everything is bucketed by day first (each deadline parsed once), so backfilling a year
+    is linear in tasks + events instead of days × tasks. Returned in date order.
+    """
+    from collections import defaultdict
+    wanted = set(dates)
+
     def d10(v):
         return (v or "")[:10]
 
-    completed = [t for t in tasks if t.completed and d10(getattr(t, 'completed_at', None)) == date]
-    dropped = [t for t in tasks if d10(getattr(t, 'dropped_at', None)) == date]
-    offloaded = [t for t in tasks if d10(getattr(t, 'offloaded_at', None)) == date]
+    completed, dropped, offloaded = defaultdict(list), defaultdict(int), defaultdict(int)
+    deadlines, events, recovery = defaultdict(list), defaultdict(list), defaultdict(list)
+    for t in tasks:
+        if t.completed:
+            d = d10(getattr(t, 'completed_at', None))
+            if d in wanted:
+                completed[d].append(t)
+        d = d10(getattr(t, 'dropped_at', None))
+        if d in wanted:
+            dropped[d] += 1
+        d = d10(getattr(t, 'offloaded_at', None))
+        if d in wanted:
+            offloaded[d] += 1
+        dl = _deadline_naive(t)
+        if dl:
+            d = dl.strftime('%Y-%m-%d')
+            if d in wanted:
+                deadlines[d].append((t, dl))
+    for e in behavior_log_entries:
+        ts = e.get('ts')
+        if isinstance(ts, str) and ts[:10] in wanted:
+            events[ts[:10]].append(e)
+    for s in _recovery_sessions():
+        if s.get('date') in wanted:
+            recovery[s.get('date')].append(s)
+
+    return [_summarize_day(d, completed[d], deadlines[d], dropped[d], offloaded[d], events[d], recovery[d])
+            for d in sorted(wanted)]
+
 
+def _summarize_day(date, completed, deadline_pairs, dropped_count, offloaded_count,
+                   behavior_log_entries, recovery_sessions) -> dict:
+    """One day's S12-A summary from that day's pre-bucketed inputs."""
     deadlines_met = deadlines_missed = hard_missed = 0
-    for t in tasks:
-        dl = _parse_dt_any(getattr(t, 'deadline', None))
-        if not dl:
-            continue
-        if dl.tzinfo is not None:
-            dl = dl.replace(tzinfo=None)
-        if dl.strftime('%Y-%m-%d') != date:
-            continue
+    for t, dl in deadline_pairs:
         met = False
         if t.completed and getattr(t, 'completed_at', None):
             cdt = _parse_dt_any(t.completed_at)
@@ -6282,25 +6332,16 @@ def compute_daily_summary(date, tasks, behavior_log_entries) -> dict:
         from collections import Counter
         best_hour = Counter(hours).most_common(1)[0][0]
 
-    rec_activated = rec_success = False
-    try:
-        if storage.recovery_log_file.exists():
-            with open(storage.recovery_log_file, 'r') as rf:
-                for s in json.load(rf):
-                    if isinstance(s, dict) and s.get('date') == date:
-                        rec_activated = True
-                        if s.get('was_successful'):
-                            rec_success = True
-    except Exception:
-        pass
+    rec_activated = bool(recovery_sessions)
+    rec_success = any(s.get('was_successful') for s in recovery_sessions)
 
     summary = {
         "date": date,
         "tasks_completed": len(completed),
         "tasks_missed": deadlines_missed,
         "tasks_postponed": tasks_postponed,
-        "tasks_dropped": len(dropped),
-        "tasks_offloaded": len(offloaded),
+        "tasks_dropped": dropped_count,
+        "tasks_offloaded": offloaded_count,
         "focus_sessions": focus_sessions,
         "focus_minutes_total": focus_minutes_total,
         "deadlines_met": deadlines_met,
@@ -6322,11 +6363,10 @@ def _most_productive_hour(n_days=7):
     cutoff = (datetime.now() - timedelta(days=n_days)).date()
     from collections import Counter
     c = Counter()
-    for e in _all_behavior_entries():
-        if e.get('event') == 'task_completed':
-            dt = _parse_dt_any(e.get('ts'))
-            if dt and dt.date() >= cutoff:
-                c[dt.hour] += 1
+    for e in _completion_events_since(cutoff):
+        dt = _parse_dt_any(e.get('ts'))
+        if dt and dt.date() >= cutoff:
+            c[dt.hour] += 1
     return c.most_common(1)[0][0] if c else None
 
 
@@ -6489,7 +6529,12 @@ def compute_day_of_week_stats(daily_summaries) -> dict:
 
 
 def ensure_daily_summaries(force=False):
-    """Backfill/append daily summaries for completed days. Runs once per new day."""
+    """Backfill/append daily summaries for completed days. Runs once per new day.
+
+    Incremental: config's `summaries_watermark` is the last day already considered, so a
+    normal run only looks at activity after it (force=True rescans all history for gaps).
+    All missing days are then computed together in one pass (compute_daily_summaries).
+    """
     config = storage.load_config()
     today = datetime.now().strftime('%Y-%m-%d')
     if not force and config.get('last_summary_date') == today:
@@ -6497,7 +6542,8 @@ def ensure_daily_summaries(force=False):
 
     summaries = storage.load_daily_summaries()
     existing = {s.get('date') for s in summaries if isinstance(s, dict)}
-    tasks = storage.load_tasks()
+    watermark = None if force else config.get('summaries_watermark')
+    tasks = storage.load_task_headers()   # only header fields are summarized
 
     dates = set()
     for t in tasks:
@@ -6505,20 +6551,18 @@ def ensure_daily_summaries(force=False):
             v = getattr(t, attr, None)
             if v:
                 dates.add(v[:10])
-    for e in _all_behavior_entries():
-        ts = e.get('ts', '')
-        if isinstance(ts, str) and len(ts) >= 10:
-            dates.add(ts[:10])
+    dates.update(storage.behavior.days())   # from the index: no log read
 
-    for d in sorted(dates):
-        if d >= today or d in existing:
-            continue
-        summaries.append(compute_daily_summary(d, tasks, get_behavior_log_entries(d)))
-        existing.add(d)
+    missing = sorted(d for d in dates
+                     if d < today and d not in existing and (watermark is None or d > watermark))
+    if missing:
+        events = storage.behavior.entries(since=missing[0], until=missing[-1])
+        summaries.extend(compute_daily_summaries(missing, tasks, events))
 
     summaries.sort(key=lambda s: s.get('date', ''))
     storage.save_daily_summaries(summaries)
     config['last_summary_date'] = today
+    config['summaries_watermark'] = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
     storage.save_config(config)
     recalc_streak()
     return summaries
@@ -6548,9 +6592,10 @@ def recalc_streak():
     return streak
 
 
-def check_momentum_warning():
-    """Brainstorm #3 — gentle re-entry nudge after 2+ days with no completions."""
-    tasks = storage.load_tasks()
+def check_momentum_warning(tasks=None) -> bool:
+    """Brainstorm #3 — gentle re-entry nudge after 2+ days with no completions. True if shown."""
+    if tasks is None:
+        tasks = storage.load_tasks()
     last = None
     for t in tasks:
         if t.completed and getattr(t, 'completed_at', None):
@@ -6558,13 +6603,13 @@ def check_momentum_warning():
             if last is None or d > last:
                 last = d
     if last is None:
-        return
+        return False
     last_dt = _parse_dt_any(last)
     if not last_dt:
-        return
+        return False
     gap = (datetime.now().date() - last_dt.date()).days
     if gap < 2:
-        return
+        return False
     pend = [t for t in tasks if not t.completed and not getattr(t, 'dropped_at', None)
             and not getattr(t, 'offloaded_at', None)]
     order = {'15m': 1, '30m': 2, '1h': 3, '2h': 4, '3h': 5, '4h+': 6}
@@ -6573,6 +6618,7 @@ def check_momentum_warning():
     if pend:
         dur = f" [{pend[0].duration}]" if pend[0].duration else ""
         print(f"{Fore.CYAN}  → {pend[0].title}{dur}  ·  taskflow complete {pend[0].id}{Style.RESET_ALL}")
+    return True
 
 
 # ---- S12-D rendering helpers ----
@@ -6848,11 +6894,10 @@ def render_heatmap():
     from collections import Counter
     cutoff = (datetime.now() - timedelta(days=30)).date()
     by_hour = Counter()
-    for e in _all_behavior_entries():
-        if e.get('event') == 'task_completed':
-            dt = _parse_dt_any(e.get('ts'))
-            if dt and dt.date() >= cutoff:
-                by_hour[dt.hour] += 1
+    for e in _completion_events_since(cutoff):
+        dt = _parse_dt_any(e.get('ts'))
+        if dt and dt.date() >= cutoff:
+            by_hour[dt.hour] += 1
     bar = Fore.CYAN + ("━" * 52) + Style.RESET_ALL
     print(f"\n{bar}\n{Fore.CYAN + Style.BRIGHT}⚡  PRODUCTIVITY HEATMAP · last 30 days{Style.RESET_ALL}\n{bar}\n")
     if not by_hour:
@@ -6997,7 +7042,7 @@ def maybe_weekly_review():
 
 def run_today_view():
     """Show today's tasks chronologically with Now Window."""
-    tasks = storage.load_tasks()
+    tasks = storage.load_task_headers()
     timeline = storage.load_timeline()
     config = storage.load_config()
     
@@ -7092,7 +7137,7 @@ def run_today_view():
         task.today_view_shown_count += 1
     for task in completed_today:
         task.today_view_shown_count += 1
-    storage.save_tasks(tasks)
+    storage.commit(tasks)
     
     # Calculate Now window
     window_start = now - timedelta(minutes=45)
@@ -7423,7 +7468,7 @@ def _task_deadline_dt(t):
 def should_trigger_recovery(tasks=None) -> bool:
     """S9-B: decide if the day has collapsed. Also auto-clears stale recovery state."""
     if tasks is None:
-        tasks = storage.load_tasks()
+        tasks = storage.load_task_headers()
     now = datetime.now()
     today_str = now.strftime('%Y-%m-%d')
     state = storage.load_recovery_state()
@@ -7629,7 +7674,7 @@ def run_recovery_view():
 
         if choice == 'F':
             target.actual_start_time = datetime.now().isoformat()
-            storage.save_tasks(tasks)
+            storage.commit(tasks)
             print(Fore.CYAN + f"\nStarting focus: {target.title}" + R)
             print(Fore.CYAN + f"Run: taskflow focus --id {target.id} to begin." + R)
         elif choice == 'C':
@@ -7715,13 +7760,14 @@ def command_recover(trigger: bool = False, exit_mode: bool = False, status: bool
     run_recovery_view()
 
 
-def check_recovery_mode() -> bool:
+def check_recovery_mode(tasks=None) -> bool:
     """Auto-activate recovery if the day has collapsed (S9-D). Returns True if active."""
     state = storage.load_recovery_state()
     if state.get('active'):
         return True
 
-    tasks = storage.load_tasks()
+    if tasks is None:
+        tasks = storage.load_task_headers()
     if should_trigger_recovery(tasks):
         recovery_tasks = select_recovery_tasks(tasks)
         if recovery_tasks:
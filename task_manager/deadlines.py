@@ -0,0 +1,217 @@
+"""
+TaskFlow Deadlines
+------------------
+Natural-language deadline phrases ("friday 5pm", "in 3 days", "tomorrow morning",
+"oct 20") turned into naive datetimes without dateparser for the common cases.
+
+parse_phrase() looks up the phrase's *plan* in an LRU cache keyed on (phrase, today's
+date). A plan is what the phrase means independently of the clock time; resolving it
+against datetime.now() is a few arithmetic operations:
+
+    ("at", datetime)        a fixed moment  ("friday 5pm", "tomorrow", "today 6pm")
+    ("after", timedelta)    now + delta     ("in 2 hours", "3 days", "today")
+    ("clock", hour, minute) that time today, or tomorrow once it has passed ("5pm",
+                            "tonight", "this evening")
+    ("date", datetime)      a month-day; next year's once it has passed ("oct 20")
+
+The grammar covers the phrases TaskFlow's own prompts and `dump` produce:
+- today / tomorrow / tonight / this <part of day>, each with an optional time
+- [next] <weekday> [at] [time]
+- in N minutes|hours|days|weeks (also bare "3 days")
+- clock times (5pm, 11:30pm, 17:00)
+- month-day with an optional year and time (oct 20, 20th october 2027 5pm)
+
+The results are the same as dateparser gives with the settings below; parts of the
+day, which dateparser can't read, mean 9am, 2pm, 6pm and 9pm. Anything else falls back
+to dateparser, which is imported on first use, and its answer is cached the same way.
+"""
+
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
+
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3, "apr": 4,
+    "april": 4, "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7, "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9, "oct": 10, "october": 10, "nov": 11,
+    "november": 11, "dec": 12, "december": 12,
+}
+_PARTS_OF_DAY = {"morning": 9, "afternoon": 14, "evening": 18, "night": 21}
+_UNITS = {"m": "minutes", "min": "minutes", "mins": "minutes", "minute": "minutes",
+          "minutes": "minutes", "h": "hours", "hr": "hours", "hrs": "hours", "hour": "hours",
+          "hours": "hours", "d": "days", "day": "days", "days": "days", "w": "weeks",
+          "wk": "weeks", "wks": "weeks", "week": "weeks", "weeks": "weeks"}
+
+# A time needs am/pm or a colon: "friday 9" stays with dateparser
+_TIME = r"(?:(?P<h>\d{1,2})(?::(?P<mi>\d{2}))? ?(?P<ap>am|pm)|(?P<h24>\d{1,2}):(?P<mi24>\d{2}))"
+_AT_TIME = rf"(?: at)?(?: {_TIME})?"
+_MONTH = "|".join(sorted(_MONTHS, key=len, reverse=True))
+_WEEKDAY = "|".join(_WEEKDAYS + tuple(d[:3] for d in _WEEKDAYS))
+
+_DAY_RE = re.compile(rf"^(?P<day>today|tomorrow|tonight|this)(?: (?P<part>{'|'.join(_PARTS_OF_DAY)}))?{_AT_TIME}$")
+_WEEKDAY_RE = re.compile(rf"^(?:next )?(?P<wd>{_WEEKDAY}){_AT_TIME}$")
+_OFFSET_RE = re.compile(r"^(?P<in>in )?(?P<n>\d{1,4}) ?(?P<unit>[a-z]+)$")
+_CLOCK_RE = re.compile(rf"^(?:at )?{_TIME}$")
+_MONTH_DAY_RE = re.compile(
+    rf"^(?P<mon>{_MONTH}) (?P<d>\d{{1,2}})(?:st|nd|rd|th)?,?(?: (?P<y>\d{{4}}))?{_AT_TIME}$")
+_DAY_MONTH_RE = re.compile(
+    rf"^(?P<d>\d{{1,2}})(?:st|nd|rd|th)? (?P<mon>{_MONTH}),?(?: (?P<y>\d{{4}}))?{_AT_TIME}$")
+
+_DATEPARSER_SETTINGS = {
+    'PREFER_DATES_FROM': 'future',
+    'PREFER_DAY_OF_MONTH': 'first',
+    'DATE_ORDER': 'DMY',
+    'RETURN_AS_TIMEZONE_AWARE': False,
+    'TIMEZONE': 'local'
+}
+
+
+def _normalise(raw: str) -> str:
+    phrase = re.sub(r'\s+', ' ', raw.strip().lower())
+    # "monday 17h" -> "monday 17:00"
+    phrase = re.sub(r'(?<!in )(?<!\+)\b(\d{1,2})h\b', r'\1:00', phrase)
+    # exact matches
+    if phrase in ("tomorrow", "morning"):
+        return "tomorrow 9am"
+    if phrase == "evening":
+        return "today 6pm"
+    # next day
+    return re.sub(r'\bnext\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', r'\1', phrase)
+
+
+def _clock(m) -> Optional[tuple]:
+    """(hour, minute) from a match of _TIME, None when the phrase has no time."""
+    if m.group("h24") is not None:
+        hour, minute = int(m.group("h24")), int(m.group("mi24"))
+        if hour > 23 or minute > 59:
+            raise ValueError("not a clock time")
+        return hour, minute
+    if m.group("h") is None:
+        return None
+    hour, minute = int(m.group("h")), int(m.group("mi") or 0)
+    if not 1 <= hour <= 12 or minute > 59:
+        raise ValueError("not a clock time")
+    return hour % 12 + (12 if m.group("ap") == "pm" else 0), minute
+
+
+def _native_plan(phrase: str, day) -> Optional[tuple]:
+    """The plan for a phrase the grammar covers, else None (see module doc)."""
+    midnight = datetime(day.year, day.month, day.day)
+
+    m = _DAY_RE.match(phrase)
+    if m:
+        which, part, clock = m.group("day"), m.group("part"), _clock(m)
+        if which == "this" and not part:
+            return None
+        if which == "tonight":
+            if part:
+                return None
+            part = "night"
+        if part and not clock:
+            clock = (_PARTS_OF_DAY[part], 0)
+        if which == "tomorrow":
+            if clock:
+                return ("at", (midnight + timedelta(days=1)).replace(hour=clock[0], minute=clock[1]))
+            return ("after", timedelta(days=1))   # "tomorrow at": this time tomorrow
+        if part:
+            # "tonight" at 22:00 means tomorrow's 21:00, not one already overdue
+            return ("clock", clock[0], clock[1])
+        if clock:
+            return ("at", midnight.replace(hour=clock[0], minute=clock[1]))
+        return ("after", timedelta(0))   # bare "today": now
+
+    m = _WEEKDAY_RE.match(phrase)
+    if m:
+        target = next(i for i, name in enumerate(_WEEKDAYS) if name.startswith(m.group("wd")))
+        # The same weekday means next week's, as with dateparser
+        ahead = (target - day.weekday()) % 7 or 7
+        clock = _clock(m) or (0, 0)
+        return ("at", (midnight + timedelta(days=ahead)).replace(hour=clock[0], minute=clock[1]))
+
+    m = _OFFSET_RE.match(phrase)
+    unit = _UNITS.get(m.group("unit")) if m else None
+    # Bare "5m" / "2d" are too terse to trust without the "in"
+    if unit and (m.group("in") or len(m.group("unit")) > 1):
+        return ("after", timedelta(**{unit: int(m.group("n"))}))
+
+    m = _CLOCK_RE.match(phrase)
+    if m:
+        hour, minute = _clock(m)
+        return ("clock", hour, minute)
+
+    m = _MONTH_DAY_RE.match(phrase) or _DAY_MONTH_RE.match(phrase)
+    if m:
+        clock = _clock(m) or (0, 0)
+        year = int(m.group("y")) if m.group("y") else day.year
+        moment = datetime(year, _MONTHS[m.group("mon")], int(m.group("d")), clock[0], clock[1])
+        return ("at", moment) if m.group("y") else ("date", moment)
+
+    return None
+
+
+def _dateparser_plan(phrase: str) -> Optional[tuple]:
+    import warnings
+    import dateparser
+    warnings.filterwarnings("ignore", module="dateparser")
+    now = datetime.now()
+    dt = dateparser.parse(
+        phrase,
+        settings=_DATEPARSER_SETTINGS,
+        languages=['en']  # constrain to English — skips the ~200-locale scan (the real hang)
+    )
+    if dt is None:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    # Relative answers ("next week", "tomorrow at 9") carry the current time down to
+    # the microsecond; anchored ones are whole minutes
+    if dt.microsecond:
+        return ("after", dt - now)
+    return ("at", dt)
+
+
+@lru_cache(maxsize=512)
+def _plan(raw: str, day) -> Optional[tuple]:
+    phrase = _normalise(raw)
+    if not phrase:
+        return None
+    try:
+        plan = _native_plan(phrase, day)
+    except (ValueError, OverflowError):
+        plan = None
+    return plan if plan is not None else _dateparser_plan(phrase)
+
+
+def _resolve(plan: tuple, now: datetime) -> Optional[datetime]:
+    kind = plan[0]
+    if kind == "at":
+        return plan[1]
+    if kind == "after":
+        return now + plan[1]
+    if kind == "clock":
+        moment = now.replace(hour=plan[1], minute=plan[2], second=0, microsecond=0)
+        return moment if moment > now else moment + timedelta(days=1)
+    moment = plan[1]
+    if moment >= now:
+        return moment
+    try:
+        return moment.replace(year=moment.year + 1)
+    except ValueError:   # Feb 29 with no Feb 29 next year
+        return None
+
+
+def parse_phrase(raw: str) -> Optional[datetime]:
+    """A naive datetime for a deadline phrase, or None when nothing understands it."""
+    now = datetime.now()
+    try:
+        plan = _plan(raw.strip().lower(), now.date())
+        return _resolve(plan, now) if plan else None
+    except OverflowError:
+        return None
+
+
+def cache_info():
+    """functools cache statistics for the plan cache (hits, misses, maxsize, currsize)."""
+    return _plan.cache_info()
@@ -0,0 +1,57 @@
+"""
+TaskFlow File Cache
+-------------------
+Process-wide cache of parsed storage files, keyed on each file's (mtime_ns, size).
+
+One `taskflow today` runs half a dozen startup hooks that each reload tasks and
+config; with this in TaskStorage only the first load reads and parses. Any change
+on disk (another process, a text editor) changes the signature and forces a reread;
+writes through TaskStorage store the new contents directly.
+"""
+
+import os
+import threading
+
+
+class FileCache:
+    """Values keyed by name, each valid only while its files' signature is unchanged."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def signature(paths) -> tuple:
+        """(mtime_ns, size) per path, None for a missing file.
+
+        Take it BEFORE reading: if the file changes mid-read, the next lookup sees a
+        different signature and rereads instead of trusting a half-stale value.
+        """
+        sig = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                sig.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def get(self, key, sig, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == sig:
+            return entry[1]
+        return default
+
+    def put(self, key, sig, value):
+        with self._lock:
+            self._entries[key] = (sig, value)
+
+    def invalidate(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,83 @@
+"""
+TaskFlow File Lock
+------------------
+An exclusive lock shared by every TaskFlow process on the machine: the CLI, the warm
+daemon and the dashboard server all write to the same ~/.taskflow.
+
+The lock is an OS advisory lock on a small lock file (fcntl.flock on POSIX,
+msvcrt.locking on Windows), so it is released when its holder exits, even by a
+crash. It is reentrant within a thread and serialises threads of one process too.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """`with lock:` holds `path`'s lock against other threads and processes."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o600)
+                try:
+                    self._lock_fd(fd)
+                except BaseException:
+                    os.close(fd)
+                    raise
+            except BaseException:
+                self._thread_lock.release()
+                raise
+            self._fd = fd
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                self._unlock_fd(fd)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+
+    @staticmethod
+    def _lock_fd(fd):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            return
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)   # gives up after ~10s: keep waiting
+                return
+            except OSError:
+                continue
+
+    @staticmethod
+    def _unlock_fd(fd):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
@@ -1,9 +1,30 @@
-from dataclasses import dataclass, field, fields as dataclass_fields
+from dataclasses import MISSING, dataclass, field, fields as dataclass_fields
 from datetime import datetime
-from typing import Optional, List
+from operator import attrgetter
+from typing import Callable, Optional, List
 import re
 
 
+def _add_slots(*extra):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10+)."""
+    def wrap(cls):
+        cls_dict = dict(cls.__dict__)
+        names = tuple(f.name for f in dataclass_fields(cls))
+        cls_dict['__slots__'] = names + extra
+        # Class-level defaults would shadow the slot descriptors; __init__ already has them
+        for name in names:
+            cls_dict.pop(name, None)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+        slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
+    return wrap
+
+
+# Slotted: no per-instance __dict__, so a 50k-task board (CLI or dashboard server) costs far
+# less RAM. Only declared fields can be assigned; `_snapshot` holds the mark_clean() state.
+@_add_slots('_snapshot')
 @dataclass
 class Task:
     """Task model with validation and default values."""
@@ -135,164 +156,66 @@ class Task:
         """Add focus minutes to task."""
         self.focus_minutes_spent += minutes
     
+    # --- Dirty tracking (TaskStorage.commit writes only tasks that changed since load) ---
+    def mark_clean(self):
+        """Record the current field values as the persisted state."""
+        values = list(_FIELD_GETTER(self))
+        # Copy lists so in-place edits show up as changes; checklist/link items are also
+        # edited in place (toggle, retitle), so those dicts are copied one level deeper.
+        for i in _LIST_FIELD_INDEXES:
+            values[i] = list(values[i])
+        for i in _NESTED_FIELD_INDEXES:
+            values[i] = [dict(x) if type(x) is dict else x for x in values[i]]
+        self._snapshot = tuple(values)
+
+    def is_dirty(self) -> bool:
+        """True if any field differs from the last mark_clean() (always True for new tasks)."""
+        snap = getattr(self, '_snapshot', None)
+        return snap is None or snap != _FIELD_GETTER(self)
+
+    def dirty_fields(self) -> List[str]:
+        """Names of the fields modified since the task was loaded or last saved."""
+        snap = getattr(self, '_snapshot', None)
+        if snap is None:
+            return list(_FIELD_NAMES)
+        return [name for name, old, new in zip(_FIELD_NAMES, snap, _FIELD_GETTER(self)) if old != new]
+
+    def is_new(self) -> bool:
+        """True for a task that was never loaded or saved (no mark_clean() yet)."""
+        return getattr(self, '_snapshot', None) is None
+
+    def rebase(self, current: 'Task') -> List[str]:
+        """
+        Three-way merge onto `current`, the stored version someone else changed since
+        this task was loaded: fields only they changed are taken over, fields only we
+        changed are kept. Returns the fields both sides changed to different values
+        (those keep our value). No-op for new tasks.
+        """
+        snap = getattr(self, '_snapshot', None)
+        if snap is None:
+            return []
+        conflicts = []
+        for name, base, mine in zip(_FIELD_NAMES, snap, _FIELD_GETTER(self)):
+            theirs = getattr(current, name)
+            if theirs == base or theirs == mine:
+                continue
+            if mine == base:
+                setattr(self, name, theirs)
+            else:
+                conflicts.append(name)
+        return conflicts
+
     def to_dict(self):
         """Convert task to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "priority": self.priority,
-            "completed": self.completed,
-            "created_at": self.created_at,
-            "completed_at": self.completed_at,
-            "tags": self.tags,
-            "notes": self.notes,
-            "focus_minutes_spent": self.focus_minutes_spent,
-            "duration": self.duration,
-            "actual_start_time": self.actual_start_time,
-            "actual_end_time": self.actual_end_time,
-            "duration_accuracy_ratio": self.duration_accuracy_ratio,
-            "deadline": self.deadline,
-            "deadline_raw": self.deadline_raw,
-            "deadline_type": self.deadline_type,
-            "deadline_set_advance_hours": self.deadline_set_advance_hours,
-            "postpone_count": self.postpone_count,
-            "last_missed_prompt": self.last_missed_prompt,
-            "executed_late": self.executed_late,
-            "dropped_at": self.dropped_at,
-            "drop_reason": self.drop_reason,
-            "offloaded_at": self.offloaded_at,
-            "offload_note": self.offload_note,
-            "postpone_history": self.postpone_history,
-            "reminder_time": self.reminder_time,
-            "reminder_time_2": self.reminder_time_2,
-            "reminder_fired": self.reminder_fired,
-            "reminder_fired_2": self.reminder_fired_2,
-            "reminder_dismissed": self.reminder_dismissed,
-            "reminder_response": self.reminder_response,
-            "reminder_to_action_gap_minutes": self.reminder_to_action_gap_minutes,
-            "mission_type": self.mission_type,
-            "date": self.date,
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "pressure_level_at_completion": self.pressure_level_at_completion,
-            "completed_under_pressure": self.completed_under_pressure,
-            "scheduled_date": self.scheduled_date,
-            "prime_target_date": self.prime_target_date,
-            "today_view_shown_count": self.today_view_shown_count,
-            "executed_in_window": self.executed_in_window,
-            "window_drift_minutes": self.window_drift_minutes,
-            "last_decision": self.last_decision,
-            "last_decision_at": self.last_decision_at,
-            "average_postpone_gap_hours": self.average_postpone_gap_hours,
-            "postpone_velocity": self.postpone_velocity,
-            "status": self.status,
-            
-            # Enrichment fields
-            "description": self.description,
-            "links": self.links,
-            "checklist": self.checklist,
-            "description_updated_at": self.description_updated_at,
-            "links_count": self.links_count,
-            "checklist_total": self.checklist_total,
-            "checklist_done": self.checklist_done,
-
-            # S10 fields
-            "planned_slot": self.planned_slot,
-            "actual_slot": self.actual_slot,
-            "slot_drift": self.slot_drift,
-
-            # S11 fields
-            "focus_session_count": self.focus_session_count,
-            "focus_total_minutes": self.focus_total_minutes,
-            "last_focus_at": self.last_focus_at,
-
-            # Edit system
-            "edit_history": self.edit_history,
-            "nova_data_enabled": self.nova_data_enabled
-        }
+        return dict(zip(_DICT_KEYS, _DICT_GETTER(self)))
     
     @classmethod
     def from_dict(cls, data: dict):
         """Create task from dictionary."""
-        # Handle legacy tasks without new fields
-        if "tags" not in data:
-            data["tags"] = []
-        if "notes" not in data:
-            data["notes"] = ""
-        if "focus_minutes_spent" not in data:
-            data["focus_minutes_spent"] = 0
-            
-        # Get optional new fields with safe defaults
-        data["duration"] = data.get("duration")
-        data["actual_start_time"] = data.get("actual_start_time")
-        data["actual_end_time"] = data.get("actual_end_time")
-        data["duration_accuracy_ratio"] = data.get("duration_accuracy_ratio")
-        
-        data["deadline"] = data.get("deadline")
-        data["deadline_raw"] = data.get("deadline_raw")
-        data["deadline_type"] = data.get("deadline_type")
-        data["deadline_set_advance_hours"] = data.get("deadline_set_advance_hours")
-        data["postpone_count"] = data.get("postpone_count", 0)
-        data["last_missed_prompt"] = data.get("last_missed_prompt")
-        data["executed_late"] = data.get("executed_late")
-        data["dropped_at"] = data.get("dropped_at")
-        data["drop_reason"] = data.get("drop_reason")
-        data["offloaded_at"] = data.get("offloaded_at")
-        data["offload_note"] = data.get("offload_note")
-        data["postpone_history"] = data.get("postpone_history", [])
-        data["reminder_time"] = data.get("reminder_time")
-        data["reminder_time_2"] = data.get("reminder_time_2")
-        data["reminder_fired"] = data.get("reminder_fired", False)
-        data["reminder_fired_2"] = data.get("reminder_fired_2", False)
-        data["reminder_dismissed"] = data.get("reminder_dismissed", False)
-        data["reminder_response"] = data.get("reminder_response")
-        data["reminder_to_action_gap_minutes"] = data.get("reminder_to_action_gap_minutes")
-        
-        data["mission_type"] = data.get("mission_type", "Task")
-        data["date"] = data.get("date")
-        data["start_time"] = data.get("start_time")
-        data["end_time"] = data.get("end_time")
-        
-        data["pressure_level_at_completion"] = data.get("pressure_level_at_completion")
-        data["completed_under_pressure"] = data.get("completed_under_pressure")
-        data["scheduled_date"] = data.get("scheduled_date")
-        data["prime_target_date"] = data.get("prime_target_date")
-        data["today_view_shown_count"] = data.get("today_view_shown_count", 0)
-        data["executed_in_window"] = data.get("executed_in_window")
-        data["window_drift_minutes"] = data.get("window_drift_minutes")
-        data["last_decision"] = data.get("last_decision")
-        data["last_decision_at"] = data.get("last_decision_at")
-        data["average_postpone_gap_hours"] = data.get("average_postpone_gap_hours")
-        data["postpone_velocity"] = data.get("postpone_velocity")
-        data["status"] = data.get("status", "todo")
-        
-        # Enrichment fields
-        data["description"] = data.get("description", None)
-        data["links"] = data.get("links", [])
-        data["checklist"] = data.get("checklist", [])
-        data["description_updated_at"] = data.get("description_updated_at", None)
-        data["links_count"] = data.get("links_count", 0)
-        data["checklist_total"] = data.get("checklist_total", 0)
-        data["checklist_done"] = data.get("checklist_done", 0)
-
-        # S10 fields
-        data["planned_slot"] = data.get("planned_slot")
-        data["actual_slot"] = data.get("actual_slot")
-        data["slot_drift"] = data.get("slot_drift")
-
-        # S11 fields
-        data["focus_session_count"] = data.get("focus_session_count", 0)
-        data["focus_total_minutes"] = data.get("focus_total_minutes", 0)
-        data["last_focus_at"] = data.get("last_focus_at")
-
-        # Edit system
-        data["edit_history"] = data.get("edit_history", [])
-        data["nova_data_enabled"] = data.get("nova_data_enabled", True)
-
+        # Legacy tasks lack most fields: missing keys take the dataclass defaults.
         # D1-02: drop any unknown/stale keys so one renamed field can't TypeError the whole
         # task into the "skipped" bin during load_tasks().
-        known = {f.name for f in dataclass_fields(cls)}
-        return cls(**{k: v for k, v in data.items() if k in known})
+        return cls(**{k: v for k, v in data.items() if k in _FIELD_SET})
 
     def __str__(self):
         """Human-readable string representation."""
@@ -300,11 +223,133 @@ class Task:
         return f"[{status}] {self.id:3d} | {self.title[:30]:30.30} | {self.priority:8}"
 
 
+_FIELD_NAMES = tuple(f.name for f in dataclass_fields(Task))
+_FIELD_SET = frozenset(_FIELD_NAMES)
+_FIELD_GETTER = attrgetter(*_FIELD_NAMES)
+
+# Serialized key order (kept stable so tasks.json diffs stay readable across versions)
+_DICT_KEYS = (
+    "id", "title", "priority", "completed", "created_at", "completed_at", "tags", "notes",
+    "focus_minutes_spent", "duration",
+    "actual_start_time", "actual_end_time", "duration_accuracy_ratio",
+    "deadline", "deadline_raw", "deadline_type", "deadline_set_advance_hours",
+    "postpone_count", "last_missed_prompt", "executed_late", "dropped_at", "drop_reason",
+    "offloaded_at", "offload_note", "postpone_history",
+    "reminder_time", "reminder_time_2", "reminder_fired", "reminder_fired_2",
+    "reminder_dismissed", "reminder_response", "reminder_to_action_gap_minutes",
+    "mission_type", "date", "start_time", "end_time",
+    "pressure_level_at_completion", "completed_under_pressure",
+    "scheduled_date", "prime_target_date", "today_view_shown_count",
+    "executed_in_window", "window_drift_minutes",
+    "last_decision", "last_decision_at", "average_postpone_gap_hours", "postpone_velocity", "status",
+    # Enrichment fields
+    "description", "links", "checklist", "description_updated_at",
+    "links_count", "checklist_total", "checklist_done",
+    # S10 fields
+    "planned_slot", "actual_slot", "slot_drift",
+    # S11 fields
+    "focus_session_count", "focus_total_minutes", "last_focus_at",
+    # Edit system
+    "edit_history", "nova_data_enabled",
+)
+assert set(_DICT_KEYS) == _FIELD_SET, "Task fields and _DICT_KEYS are out of sync"
+_DICT_GETTER = attrgetter(*_DICT_KEYS)
+_LIST_FIELD_INDEXES = tuple(_FIELD_NAMES.index(n) for n in ("tags", "postpone_history", "edit_history"))
+_NESTED_FIELD_INDEXES = tuple(_FIELD_NAMES.index(n) for n in ("links", "checklist"))
+
+# Fields most views never read but that dominate a task's size on long-lived boards.
+# TaskHeader defers them; the rows format and the SQLite store keep them apart (see task_codec).
+# description stays a header field: the list view shows a notes marker for it.
+HEAVY_FIELDS = ("links", "checklist", "edit_history", "postpone_history")
+HEADER_FIELDS = tuple(name for name in _FIELD_NAMES if name not in HEAVY_FIELDS)
+_HEADER_FIELD_SET = frozenset(HEADER_FIELDS)
+_FIELD_DEFAULTS = {f.name: (f.default, f.default_factory) for f in dataclass_fields(Task)}
+
+
+class TaskHeader:
+    """
+    Slim stand-in for a Task, built from a stored record without constructing the Task.
+    
+    Header fields (id, title, priority, deadline, status, timestamps...) are read straight
+    from the record; list fields such as tags come back as copies, so change them by
+    assignment (`h.tags = h.tags + ["x"]`), not in place. Touching a heavy field, calling a Task method or assigning anything
+    materializes the full Task once (via `fetch` when the record only holds the header)
+    and delegates to it from then on, so commit() sees edits exactly as for a loaded Task.
+    Returned by TaskStorage.load_task_headers().
+    """
+
+    __slots__ = ("_data", "_fetch", "_full")
+
+    def __init__(self, data: dict, fetch: Optional[Callable[[], dict]] = None):
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_fetch", fetch)
+        object.__setattr__(self, "_full", None)
+
+    def full(self) -> Task:
+        """The complete Task for this header (loaded on first call, then reused)."""
+        task = self._full
+        if task is None:
+            record = self._fetch() if self._fetch is not None else self._data
+            task = Task.from_dict(record)
+            task.mark_clean()
+            object.__setattr__(self, "_full", task)
+        return task
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._full is not None
+
+    def __getattr__(self, name):
+        if self._full is not None:
+            return getattr(self._full, name)
+        if name in _HEADER_FIELD_SET:
+            data = self._data
+            if name not in data:
+                default, factory = _FIELD_DEFAULTS[name]
+                return factory() if default is MISSING else default
+            value = data[name]
+            # The record is shared with the storage cache: containers go out as copies
+            if type(value) is list:
+                return [dict(x) if type(x) is dict else x for x in value]
+            if type(value) is dict:
+                return dict(value)
+            return value
+        if name in _FIELD_DEFAULTS or hasattr(Task, name):
+            return getattr(self.full(), name)
+        raise AttributeError(f"'TaskHeader' object has no attribute '{name}'")
+
+    def __setattr__(self, name, value):
+        # Re-assigning a header field its current value (e.g. restamping planned_slot on
+        # every task) is a no-op and should not cost a full load.
+        if self._full is None and name in _HEADER_FIELD_SET and name in self._data \
+                and self._data[name] == value:
+            return
+        setattr(self.full(), name, value)
+
+    # Unmaterialized headers cannot have changed, so commit() skips them without a load
+    def is_dirty(self) -> bool:
+        return self._full is not None and self._full.is_dirty()
+
+    def mark_clean(self):
+        if self._full is not None:
+            self._full.mark_clean()
+
+    def to_dict(self) -> dict:
+        return self.full().to_dict()
+
+    def __str__(self):
+        status = "✓" if self.completed else "○"
+        return f"[{status}] {self.id:3d} | {self.title[:30]:30.30} | {self.priority:8}"
+
+    def __repr__(self):
+        return f"TaskHeader(id={self.id!r}, title={self.title!r})"
+
+
 class TaskManager:
     """Manages collection of tasks with utility methods."""
     
     def __init__(self, tasks: List[Task] = None):
-        self.tasks = tasks or []
+        self.tasks = tasks if tasks is not None else []
         self._task_by_id = {task.id: task for task in self.tasks}  # Index for O(1) lookup
     
     def get_next_id(self) -> int:
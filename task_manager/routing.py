@@ -0,0 +1,187 @@
+"""
+TaskFlow Routing
+----------------
+Method + path-pattern dispatch for the dashboard server.
+
+A pattern is literal segments and parameters:
+
+    /api/tasks/{task_id:int}/checklist/{chk_id}/toggle
+    /static/{name:path}
+
+`{name}` matches one segment, `{name:int}` one all-digit segment (passed as int) and
+`{name:path}` the rest of the path. Patterns are compiled into one segment tree per
+HTTP method, so a lookup costs a dict probe per path segment however many routes
+exist; a literal segment wins over a parameter.
+
+Every call runs through the registered middleware (outermost first) and is counted
+per route: calls, 5xx responses, total and slowest time (Router.stats()).
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+_CONVERTERS = ("str", "int", "path")
+
+
+class RouteStats:
+    """Per-route counters; updated under a lock, read via snapshot()."""
+
+    __slots__ = ("calls", "errors", "total", "slowest", "_lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0      # 5xx responses and uncaught exceptions
+        self.total = 0.0
+        self.slowest = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, failed: bool):
+        with self._lock:
+            self.calls += 1
+            self.errors += failed
+            self.total += elapsed
+            if elapsed > self.slowest:
+                self.slowest = elapsed
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "avg_ms": round(self.total / self.calls * 1000, 3) if self.calls else 0.0,
+                "max_ms": round(self.slowest * 1000, 3),
+            }
+
+
+class Route:
+    """One registered endpoint: handler(request, **params) plus free-form options."""
+
+    __slots__ = ("method", "pattern", "handler", "options", "stats")
+
+    def __init__(self, method: str, pattern: str, handler: Callable, options: dict):
+        self.method = method
+        self.pattern = pattern
+        self.handler = handler
+        self.options = options
+        self.stats = RouteStats()
+
+
+class _Node:
+    __slots__ = ("literals", "params", "route")
+
+    def __init__(self):
+        self.literals: Dict[str, "_Node"] = {}
+        self.params: List[Tuple[str, str, "_Node"]] = []   # (name, converter, child)
+        self.route: Optional[Route] = None
+
+
+def _segments(path: str) -> List[str]:
+    return [s for s in path.split('/') if s]
+
+
+class Router:
+    """Compiled route table (see module doc)."""
+
+    def __init__(self):
+        self._trees: Dict[str, _Node] = {}
+        self._middleware: List[Callable] = []
+        self.routes: List[Route] = []
+
+    def route(self, method: str, pattern: str, **options):
+        """Decorator: register the function for `method pattern` (stackable)."""
+        def register(handler):
+            self.add(method, pattern, handler, **options)
+            return handler
+        return register
+
+    def add(self, method: str, pattern: str, handler: Callable, **options) -> Route:
+        route = Route(method, pattern, handler, options)
+        node = self._trees.setdefault(method, _Node())
+        parts = _segments(pattern)
+        for i, part in enumerate(parts):
+            if part.startswith('{') and part.endswith('}'):
+                name, _, kind = part[1:-1].partition(':')
+                kind = kind or "str"
+                if kind not in _CONVERTERS:
+                    raise ValueError(f"Unknown converter {kind!r} in route {pattern!r}")
+                if kind == "path" and i != len(parts) - 1:
+                    raise ValueError(f"{{{name}:path}} must be last in route {pattern!r}")
+                child = next((c for n, k, c in node.params if n == name and k == kind), None)
+                if child is None:
+                    child = _Node()
+                    node.params.append((name, kind, child))
+                node = child
+            else:
+                node = node.literals.setdefault(part, _Node())
+        if node.route is not None:
+            raise ValueError(f"Duplicate route {method} {pattern}")
+        node.route = route
+        self.routes.append(route)
+        return route
+
+    def middleware(self, fn: Callable) -> Callable:
+        """Register fn(request, route, call_next); the first registered runs outermost."""
+        self._middleware.append(fn)
+        return fn
+
+    def match(self, method: str, path: str) -> Optional[Tuple[Route, dict]]:
+        """(route, params) for a request path (no query string), or None."""
+        tree = self._trees.get(method)
+        if tree is None:
+            return None
+        params = {}
+        route = self._walk(tree, _segments(path), 0, params)
+        return (route, params) if route is not None else None
+
+    def _walk(self, node: _Node, segments: List[str], i: int, params: dict) -> Optional[Route]:
+        if i == len(segments):
+            return node.route
+        segment = segments[i]
+        child = node.literals.get(segment)
+        if child is not None:
+            route = self._walk(child, segments, i + 1, params)
+            if route is not None:
+                return route
+        for name, kind, child in node.params:
+            if kind == "path":
+                if child.route is not None:
+                    params[name] = '/'.join(segments[i:])
+                    return child.route
+                continue
+            if kind == "int":
+                if not segment.isdigit():
+                    continue
+                params[name] = int(segment)
+            else:
+                params[name] = segment
+            route = self._walk(child, segments, i + 1, params)
+            if route is not None:
+                return route
+            del params[name]
+        return None
+
+    def dispatch(self, request, route: Route, params: dict):
+        """Run route.handler(request, **params) inside the middleware chain and time it.
+
+        A 5xx is counted as an error when the request exposes `response_status`.
+        """
+        middleware = self._middleware
+
+        def call(i):
+            if i == len(middleware):
+                return route.handler(request, **params)
+            return middleware[i](request, route, lambda: call(i + 1))
+
+        start = time.perf_counter()
+        failed = True
+        try:
+            call(0)
+            failed = (getattr(request, "response_status", None) or 0) >= 500
+        finally:
+            route.stats.record(time.perf_counter() - start, failed)
+
+    def stats(self) -> List[dict]:
+        """Counters for every route that has been called, busiest first."""
+        rows = [{"method": r.method, "route": r.pattern, **r.stats.snapshot()} for r in self.routes]
+        return sorted((row for row in rows if row["calls"]), key=lambda row: -row["calls"])
@@ -0,0 +1,467 @@
+"""
+TaskFlow Search Index
+---------------------
+Full-text index over the task list for `taskflow search` and /api/search.
+
+Every task is tokenized per field (title, notes, description, tags, checklist item
+text, link titles and urls) into an inverted index: term -> (task, field, count).
+A query word matches the terms it is a prefix of, every word has to match, and the
+matches are ranked with BM25 over field-weighted counts (a title hit outweighs a
+link hit). `field:word` (or `#tag`) restricts a word to one field.
+
+The index lives in search.db (stdlib sqlite3) next to tasks.json. It is derived data
+and can always be rebuilt from the tasks:
+
+- meta "source" holds the task files' signature (FileCache.signature) the index
+  matches. TaskStorage's writes call apply() with the signature before and after the
+  write: if the index matched the old files, the changed tasks are re-indexed in the
+  same breath and the index matches the new ones. The writes hold tasks.lock (see
+  file_lock) from the first signature to apply(), so no other process's write can
+  fall between the two and be stamped as seen.
+- A query whose signature differs (another writer, a restore, a hand edit) first
+  syncs: each task's fingerprint is compared and only changed tasks are re-indexed.
+- The index is built on the first search, so nobody pays for it before then.
+
+Python builds without sqlite3 get the same search from an in-memory index, rebuilt
+whenever the task files change.
+"""
+
+import bisect
+import hashlib
+import json
+import math
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+try:
+    import sqlite3
+except ImportError:  # some minimal Python builds ship without _sqlite3
+    sqlite3 = None
+
+FIELD_WEIGHTS = {"title": 3.0, "notes": 1.0, "description": 1.0, "tags": 2.0,
+                 "checklist": 1.0, "links": 0.5}
+FIELD_ALIASES = {
+    "title": "title", "note": "notes", "notes": "notes", "desc": "description",
+    "description": "description", "tag": "tags", "tags": "tags", "check": "checklist",
+    "checklist": "checklist", "link": "links", "links": "links",
+}
+
+# BM25 parameters; a word that only matches as a prefix of a longer term counts half
+K1 = 1.2
+B = 0.75
+PREFIX_DISCOUNT = 0.5
+# Candidate count under which the remaining query words are looked up per task
+NARROW_BELOW = 500
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_STOPWORDS = frozenset((
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of",
+    "on", "or", "the", "to", "with", "http", "https", "www", "com", "html",
+))
+_TOP = "\U0010ffff"   # sorts after every term: [w, w + _TOP) is the prefix range of w
+
+
+def tokenize(text) -> List[str]:
+    """Lowercase word tokens of `text`, stopwords dropped."""
+    if not text:
+        return []
+    return [t for t in _TOKEN_RE.findall(str(text).lower()) if t not in _STOPWORDS]
+
+
+def task_status(record: dict) -> str:
+    """todo / done / dropped / offloaded, as the task list shows it."""
+    if record.get("completed"):
+        return "done"
+    if record.get("dropped_at") or record.get("status") == "dropped":
+        return "dropped"
+    if record.get("offloaded_at") or record.get("status") == "offloaded":
+        return "offloaded"
+    return "todo"
+
+
+def _field_texts(record: dict) -> Dict[str, list]:
+    return {
+        "title": [record.get("title")],
+        "notes": [record.get("notes")],
+        "description": [record.get("description")],
+        "tags": list(record.get("tags") or ()),
+        "checklist": [item.get("text") for item in record.get("checklist") or () if isinstance(item, dict)],
+        "links": [part for item in record.get("links") or () if isinstance(item, dict)
+                  for part in (item.get("title"), item.get("url"))],
+    }
+
+
+class _Doc:
+    """One task's index entry: its term counts per field and what results show."""
+
+    __slots__ = ("id", "fp", "length", "status", "priority", "title", "tags", "terms")
+
+    def __init__(self, record: dict):
+        texts = _field_texts(record)
+        self.id = record["id"]
+        self.title = str(record.get("title") or "")
+        self.status = task_status(record)
+        self.priority = str(record.get("priority") or "")
+        self.tags = [str(t).lower() for t in record.get("tags") or ()]
+        self.fp = hashlib.sha1(repr((texts, self.status, self.priority)).encode("utf-8")).hexdigest()[:16]
+        self.terms = {}   # (term, field) -> count
+        length = 0.0
+        for name, parts in texts.items():
+            for part in parts:
+                for term in tokenize(part):
+                    self.terms[(term, name)] = self.terms.get((term, name), 0) + 1
+                    length += FIELD_WEIGHTS[name]
+        self.length = length
+
+    def row(self) -> tuple:
+        return (self.id, self.fp, self.length, self.status, self.priority, self.title,
+                json.dumps(self.tags, ensure_ascii=False))
+
+
+def _encode_signature(sig) -> str:
+    return json.dumps([list(s) if s else None for s in sig or ()])
+
+
+def _parse_query(query: str) -> List[tuple]:
+    """[(word, field or None)]: `field:word` and `#tag` restrict a word to a field."""
+    words = []
+    for raw in str(query or "").split():
+        field = None
+        if raw.startswith("#") and len(raw) > 1:
+            field, raw = "tags", raw[1:]
+        elif ":" in raw:
+            name, _, rest = raw.partition(":")
+            if name.lower() in FIELD_ALIASES and rest:
+                field, raw = FIELD_ALIASES[name.lower()], rest
+        words.extend((token, field) for token in tokenize(raw))
+    return words
+
+
+class _MemoryIndex:
+    """The index as Python dicts (no sqlite3): same lookups as the database."""
+
+    def __init__(self, records: Iterable[dict]):
+        self.docs = {}
+        self.postings = {}   # term -> [(doc, field, count)]
+        for record in records:
+            doc = _Doc(record)
+            self.docs[doc.id] = doc
+            for (term, name), count in doc.terms.items():
+                self.postings.setdefault(term, []).append((doc.id, name, count))
+        self.terms = sorted(self.postings)
+        # id -> (length, status, priority, tags): what expand() joins onto each posting
+        self.ranking = {i: d.row()[2:5] + d.row()[6:] for i, d in self.docs.items()}
+
+    def _terms(self, word: str) -> List[str]:
+        if len(word) < 2:
+            return [word] if word in self.postings else []
+        return self.terms[bisect.bisect_left(self.terms, word):bisect.bisect_left(self.terms, word + _TOP)]
+
+    def expand(self, word: str, within: Optional[list] = None) -> List[tuple]:
+        keep = set(within) if within is not None else None
+        return [(term, doc_id, name, count) + self.ranking[doc_id]
+                for term in self._terms(word) for doc_id, name, count in self.postings[term]
+                if keep is None or doc_id in keep]
+
+    def count(self, word: str) -> int:
+        return sum(len(self.postings[term]) for term in self._terms(word))
+
+    def df(self, word: str) -> Dict[str, int]:
+        return {term: len({doc_id for doc_id, _, _ in self.postings[term]}) for term in self._terms(word)}
+
+    def stats(self) -> tuple:
+        n = len(self.docs)
+        return n, (sum(d.length for d in self.docs.values()) / n if n else 0.0)
+
+    def heads(self, ids) -> Dict[int, tuple]:
+        return {i: (self.docs[i].title, self.docs[i].status, self.docs[i].priority)
+                for i in ids if i in self.docs}
+
+
+class SearchIndex:
+    """search.db: postings(term, doc, field, tf), docs(id, fp, length, ...), meta."""
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self._conn = None
+        self._lock = threading.RLock()
+        self._memory = None   # (signature, _MemoryIndex) without sqlite3
+
+    def connect(self):
+        """Open (and on first use create) the database. Raises sqlite3.Error on failure."""
+        if sqlite3 is None:
+            raise RuntimeError("sqlite3 module is not available in this Python build")
+        if self._conn is None:
+            try:
+                self._conn = self._open()
+            except sqlite3.DatabaseError:
+                # Derived data: a damaged index is thrown away and rebuilt by the next query
+                self._discard()
+                self._conn = self._open()
+        return self._conn
+
+    def _discard(self):
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                Path(str(self.db_path) + suffix).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _open(self):
+        conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            row = None
+            try:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            except sqlite3.OperationalError:   # no meta table yet
+                pass
+            if row is not None and row[0] != str(self.SCHEMA_VERSION):
+                # An index from another version is rebuilt, not migrated
+                with conn:
+                    for table in ("postings", "docs", "meta"):
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS postings (term TEXT NOT NULL, doc INTEGER NOT NULL, "
+                             "field TEXT NOT NULL, tf INTEGER NOT NULL, "
+                             "PRIMARY KEY (term, doc, field)) WITHOUT ROWID")
+                conn.execute("CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc)")
+                conn.execute("CREATE TABLE IF NOT EXISTS docs (id INTEGER PRIMARY KEY, fp TEXT NOT NULL, "
+                             "length REAL NOT NULL, status TEXT, priority TEXT, title TEXT, tags TEXT)")
+                conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+                conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                             (str(self.SCHEMA_VERSION),))
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- maintenance ---
+    @staticmethod
+    def _source(conn) -> Optional[str]:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _write(conn, docs: List[_Doc], deleted: Iterable[int], source: str):
+        """Re-index `docs`, drop `deleted` and record the files the index now matches."""
+        gone = [(i,) for i in set(deleted) | {d.id for d in docs}]
+        conn.executemany("DELETE FROM postings WHERE doc = ?", gone)
+        conn.executemany("DELETE FROM docs WHERE id = ?", gone)
+        conn.executemany("INSERT INTO docs (id, fp, length, status, priority, title, tags) "
+                         "VALUES (?, ?, ?, ?, ?, ?, ?)", [d.row() for d in docs])
+        conn.executemany("INSERT INTO postings (term, doc, field, tf) VALUES (?, ?, ?, ?)",
+                         [(term, d.id, name, count) for d in docs for (term, name), count in d.terms.items()])
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('source', ?)", (source,))
+
+    def _sync(self, conn, records: Iterable[dict], source: str) -> int:
+        """Make the index match `records` (every task), re-indexing only changed ones."""
+        stored = dict(conn.execute("SELECT id, fp FROM docs"))
+        changed = []
+        for record in records:
+            doc = _Doc(record)
+            if stored.pop(doc.id, None) != doc.fp:
+                changed.append(doc)
+        self._write(conn, changed, list(stored), source)
+        return len(changed) + len(stored)
+
+    def apply(self, before, after, puts: Iterable[dict] = (), deleted: Iterable[int] = (),
+              replace: Optional[List[dict]] = None):
+        """Follow a task write (see module doc). `replace` is the full list a save wrote.
+
+        Does nothing until the first search has built the index, or when the index was
+        already behind; never raises, a query catches up instead.
+        """
+        if sqlite3 is None or not self.db_path.exists():
+            return
+        try:
+            with self._lock:
+                conn = self.connect()
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    if replace is not None:
+                        self._sync(conn, replace, _encode_signature(after))
+                    elif self._source(conn) == _encode_signature(before):
+                        self._write(conn, [_Doc(r) for r in puts], deleted, _encode_signature(after))
+        except Exception:
+            pass
+
+    def rebuild(self, records: Iterable[dict], sig):
+        """Drop everything and index `records` from scratch."""
+        if sqlite3 is None:
+            self._memory = (sig, _MemoryIndex(records))
+            return
+        with self._lock:
+            conn = self.connect()
+            with conn:
+                conn.execute("DELETE FROM postings")
+                conn.execute("DELETE FROM docs")
+                self._write(conn, [_Doc(r) for r in records], (), _encode_signature(sig))
+
+    def _current(self, sig, records: Callable[[], dict]):
+        """A lookup source matching `sig`, synced from records() if it is behind."""
+        if sqlite3 is None:
+            if self._memory is None or self._memory[0] != sig:
+                self._memory = (sig, _MemoryIndex(records().values()))
+            return self._memory[1]
+        conn = self.connect()
+        source = _encode_signature(sig)
+        if self._source(conn) != source:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                if self._source(conn) != source:   # another process may have just synced
+                    self._sync(conn, records().values(), source)
+        return _SQLiteLookup(conn)
+
+    # --- queries ---
+    def search(self, query: str, sig, records: Callable[[], dict], status: Optional[str] = None,
+               priority: Optional[str] = None, tag: Optional[str] = None,
+               limit: Optional[int] = 20) -> List[dict]:
+        """
+        Ranked matches for `query`, best first.
+
+        Args:
+            query: Words (prefixes) that must all match; `field:word` / `#tag` narrow one
+            sig: The task files' current signature
+            records: Returns {id: task dict}; called only when the index is behind `sig`
+            status, priority, tag: Keep only tasks with this status / priority / tag
+            limit: At most this many results (None: all)
+
+        Returns:
+            [{"id", "title", "status", "priority", "score", "fields"}]
+        """
+        words = _parse_query(query)
+        if not words:
+            return []
+        wanted = (status.lower() if status else None, priority.lower() if priority else None,
+                  tag.lower().lstrip("#") if tag else None)
+        with self._lock:
+            lookup = self._current(sig, records)
+            n, avgdl = lookup.stats()
+            scores = None   # doc -> [score, fields]
+            # Rarest word first; once few tasks are left, later words only read theirs
+            for word, only in sorted(words, key=lambda w: lookup.count(w[0])):
+                within = list(scores) if scores is not None and len(scores) <= NARROW_BELOW else None
+                hits = self._score_word(word, only, lookup, n, avgdl, wanted, within)
+                if scores is None:
+                    scores = hits
+                else:
+                    scores = {d: [scores[d][0] + hits[d][0], scores[d][1] | hits[d][1]]
+                              for d in scores if d in hits}
+                if not scores:
+                    return []
+            ranked = sorted(scores.items(), key=lambda item: (-item[1][0], item[0]))
+            if limit is not None:
+                ranked = ranked[:max(0, limit)]
+            heads = lookup.heads([d for d, _ in ranked])
+        return [{"id": d, "title": heads[d][0], "status": heads[d][1], "priority": heads[d][2],
+                 "score": round(score, 4), "fields": sorted(names)}
+                for d, (score, names) in ranked if d in heads]
+
+    @staticmethod
+    def _score_word(word: str, only: Optional[str], lookup, n: int, avgdl: float,
+                    wanted: tuple, within: Optional[list] = None) -> Dict[int, list]:
+        """doc -> [BM25 score, fields] for one query word: its best-scoring matched term.
+
+        `within` limits the postings read to those tasks; df then comes from the index.
+        """
+        status, priority, tag = wanted
+        per_term = {}   # term -> doc -> [weighted tf, fields, length]
+        for term, doc, name, count, length, doc_status, doc_priority, tags in lookup.expand(word, within):
+            docs = per_term.setdefault(term, {})
+            entry = docs.get(doc)
+            if entry is None:
+                # Filtered-out tasks still count towards df, so filters don't change ranks
+                keep = ((status is None or doc_status == status)
+                        and (priority is None or (doc_priority or "").lower() == priority)
+                        and (tag is None or tag in json.loads(tags or "[]")))
+                entry = docs[doc] = [0.0, set(), length] if keep else None
+                if entry is None:
+                    docs[doc] = False
+                    continue
+            elif entry is False:
+                continue
+            if only is None or name == only:
+                entry[0] += FIELD_WEIGHTS[name] * count
+                entry[1].add(name)
+        dfs = lookup.df(word) if within is not None else {}
+        hits = {}
+        for term, docs in per_term.items():
+            df = dfs.get(term, len(docs))
+            weight = math.log(1 + (n - df + 0.5) / (df + 0.5)) * (K1 + 1)
+            if term != word:
+                weight *= PREFIX_DISCOUNT
+            for doc, entry in docs.items():
+                if not entry or not entry[0]:
+                    continue
+                wtf, names, length = entry
+                norm = K1 * (1 - B + B * (length / avgdl if avgdl else 1.0))
+                score = weight * wtf / (wtf + norm)
+                best = hits.get(doc)
+                if best is None or score > best[0]:
+                    hits[doc] = [score, names]
+        return hits
+
+
+class _SQLiteLookup:
+    """Lookups against search.db for one query."""
+
+    _EXPAND = ("SELECT p.term, p.doc, p.field, p.tf, d.length, d.status, d.priority, d.tags "
+               "FROM postings p JOIN docs d ON d.id = p.doc ")
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    @staticmethod
+    def _range(word: str) -> tuple:
+        if len(word) < 2:
+            return "p.term = ?", (word,)
+        return "p.term >= ? AND p.term < ?", (word, word + _TOP)
+
+    def expand(self, word: str, within: Optional[list] = None) -> List[tuple]:
+        """(term, doc, field, tf, length, status, priority, tags) for every term `word` matches."""
+        where, args = self._range(word)
+        if within is None:
+            return self.conn.execute(self._EXPAND + "WHERE " + where, args).fetchall()
+        rows = []
+        for start in range(0, len(within), 500):
+            chunk = within[start:start + 500]
+            rows += self.conn.execute(
+                self._EXPAND + f"WHERE {where} AND p.doc IN ({','.join('?' * len(chunk))})",
+                args + tuple(chunk)).fetchall()
+        return rows
+
+    def count(self, word: str) -> int:
+        where, args = self._range(word)
+        return self.conn.execute("SELECT COUNT(*) FROM postings p WHERE " + where, args).fetchone()[0]
+
+    def df(self, word: str) -> Dict[str, int]:
+        where, args = self._range(word)
+        return dict(self.conn.execute(
+            "SELECT p.term, COUNT(DISTINCT p.doc) FROM postings p WHERE " + where + " GROUP BY p.term", args))
+
+    def stats(self) -> tuple:
+        n, avgdl = self.conn.execute("SELECT COUNT(*), AVG(length) FROM docs").fetchone()
+        return n, avgdl or 0.0
+
+    def heads(self, ids) -> Dict[int, tuple]:
+        """id -> (title, status, priority)."""
+        found = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                    f"SELECT id, title, status, priority FROM docs WHERE id IN ({marks})", chunk):
+                found[row[0]] = row[1:]
+        return found
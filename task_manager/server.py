@@ -1,5 +1,13 @@
+import gzip
+import hashlib
+import io
 import json
 import logging
+import os
+import queue
+import time
+from datetime import datetime as _dt, timedelta
+from email.utils import formatdate, parsedate_to_datetime
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import threading
 from urllib.parse import urlparse, parse_qs
@@ -7,40 +15,355 @@ from task_manager import storage, commands
 from task_manager.commands import normalize_priority
 from task_manager.web_ui import HTML_TEMPLATE
 from task_manager import models
+from task_manager.routing import Router
+from task_manager.task_repository import TaskRepository
 
-# D7-03: ThreadingHTTPServer runs each request in its own thread, and task mutations are
-# read-modify-write against tasks.json. Serialise all writes so concurrent requests can't
-# lose updates (atomic file replace prevents corruption, not lost writes).
+# D7-03: ThreadingHTTPServer runs each request in its own thread, and mutations are
+# read-modify-write. Task-only routes (lock="optimistic") run in parallel with per-task
+# compare-and-swap and retry (see _mutate); every other mutation — routes that go through
+# commands.* and touch config, focus or recovery files — is still serialised here.
 _WRITE_LOCK = threading.Lock()
+_MUTATION_ATTEMPTS = 3   # the last one runs exclusive, so it cannot conflict again
+
+# Reads are served from this resident list; writes check out a copy and commit through it.
+_repo = TaskRepository(storage.storage)
+
+# Endpoints are TaskFlowHandler methods decorated with @_route(method, pattern, lock=...).
+# lock: None for GETs; mutations default to "write" (_WRITE_LOCK), task-only ones say
+# "optimistic". Counters per route: GET /api/debug_routes.
+_router = Router()
+_route = _router.route
+
+
+@_router.middleware
+def _guard_middleware(handler, route, call_next):
+    # SEC-07 on every route (foreign Host / DNS rebinding); SEC-02 on mutations (CSRF)
+    if handler._guard(mutating=route.method != 'GET'):
+        return
+    call_next()
+
+
+@_router.middleware
+def _lock_middleware(handler, route, call_next):
+    lock = route.options.get("lock", None if route.method == 'GET' else "write")
+    if lock is None:
+        call_next()
+    else:
+        handler._mutate(call_next, lock == "optimistic")
+
+# GET path (with query) -> (etag, unix second it was first served): the Last-Modified
+# validator. A change within the same second still gets a later stamp, so a client's
+# If-Modified-Since can never match a newer payload.
+_LAST_MODIFIED = {}
+_LAST_MODIFIED_LOCK = threading.Lock()
+
+
+def _last_modified(path, etag):
+    with _LAST_MODIFIED_LOCK:
+        seen = _LAST_MODIFIED.get(path)
+        if seen is not None and seen[0] == etag:
+            return seen[1]
+        stamp = int(time.time())
+        if seen is not None and stamp <= seen[1]:
+            stamp = seen[1] + 1
+        if len(_LAST_MODIFIED) > 256:   # e.g. many distinct ?limit= values
+            _LAST_MODIFIED.clear()
+        _LAST_MODIFIED[path] = (etag, stamp)
+        return stamp
+
+
+# --- Compression / static assets ---
+_GZIP_MIN_BYTES = 1024   # below this gzip's framing eats the saving
+_GZIP_LEVEL = 6          # per-response (JSON); static assets are compressed once at 9
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+_STATIC_TYPES = {'.js': 'application/javascript', '.css': 'text/css', '.svg': 'image/svg+xml',
+                 '.png': 'image/png', '.woff2': 'font/woff2', '.json': 'application/json'}
+_COMPRESSIBLE = ('.js', '.css', '.svg', '.json')
+# Static assets, read and precompressed once at startup: name -> {
+#   "type", "body", "gzip" (None if not worth it), "etag", "hashed" (name.<hash>.ext) }
+# The HTML shell links the hashed names, which are served immutable for a year: a
+# changed file gets a new name, so a browser never keeps a stale copy.
+_STATIC = {}
+_STATIC_BY_HASHED = {}
+
+
+def _gzip_if_smaller(body, level):
+    if len(body) < _GZIP_MIN_BYTES:
+        return None
+    packed = gzip.compress(body, compresslevel=level)
+    return packed if len(packed) < len(body) else None
+
+
+def _load_static_assets():
+    try:
+        names = sorted(os.listdir(_STATIC_DIR))
+    except OSError:
+        names = []
+    for name in names:
+        full_path = os.path.join(_STATIC_DIR, name)
+        stem, ext = os.path.splitext(name)
+        if ext not in _STATIC_TYPES or not os.path.isfile(full_path):
+            continue
+        with open(full_path, 'rb') as f:
+            body = f.read()
+        digest = hashlib.blake2b(body, digest_size=6).hexdigest()
+        asset = {
+            "type": _STATIC_TYPES[ext],
+            "body": body,
+            "gzip": _gzip_if_smaller(body, 9) if ext in _COMPRESSIBLE else None,
+            "etag": '"%s"' % digest,
+            "hashed": f"{stem}.{digest}{ext}",
+        }
+        _STATIC[name] = asset
+        _STATIC_BY_HASHED[asset["hashed"]] = asset
+
+
+def _render_shell():
+    """HTML_TEMPLATE with /static/ links pointing at the content-hashed names."""
+    html = HTML_TEMPLATE
+    for name, asset in _STATIC.items():
+        html = html.replace(f'"/static/{name}"', f'"/static/{asset["hashed"]}"')
+    body = html.encode('utf-8', errors='replace')
+    return body, _gzip_if_smaller(body, 9)
+
+
+_load_static_assets()
+_SHELL_BODY, _SHELL_GZIP = _render_shell()
+
+
+class _EventHub:
+    """
+    Fan-out behind GET /api/events (Server-Sent Events).
+
+    A watcher thread runs while at least one dashboard is subscribed. Every second (or
+    at once after a server-side commit) it checks whether the tasks changed — server
+    commits and CLI edits alike, via the repository's file-signature check and change
+    sequence — whether the focus session moved (new minute, pause/resume, decision, end)
+    and whether recovery state changed, and pushes only what did:
+
+      tasks     {"changed": [task payloads], "deleted": [ids], "version": sync token}
+      resync    {} — the delta could not be computed; refetch /api/tasks
+      focus     the /api/focus_state payload
+      recovery  the /api/recovery-status payload
+
+    New subscribers get `hello` once the watcher holds a baseline, so a change after
+    their resync fetch is never lost. Each subscriber has a bounded queue; one that
+    falls behind is closed, and EventSource reconnects and resyncs on its own.
+    """
+
+    POLL_SECONDS = 1.0
+    QUEUE_SIZE = 256
+
+    def __init__(self):
+        self._subscribers = set()
+        self._pending = set()   # subscribed, waiting for a baseline + hello
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def subscribe(self, q=None):
+        """Register a subscriber queue (a new bounded one unless given) and return it."""
+        q = q if q is not None else queue.Queue(self.QUEUE_SIZE)
+        with self._lock:
+            self._pending.add(q)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._watch, name="taskflow-events", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return q
+
+    def unsubscribe(self, q):
+        with self._lock:
+            self._subscribers.discard(q)
+            self._pending.discard(q)
+
+    def notify(self):
+        """Something changed in-process: check now instead of at the next tick."""
+        self._wake.set()
+
+    def _send(self, q, message):
+        try:
+            q.put_nowait(message)
+        except queue.Full:
+            # Too slow to keep up: close its stream (None) and let it reconnect
+            self._subscribers.discard(q)
+            with q.mutex:
+                q.queue.clear()
+            q.put_nowait(None)
+
+    def publish(self, event, data):
+        message = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode('utf-8')
+        with self._lock:
+            for q in list(self._subscribers):
+                self._send(q, message)
+
+    def _watch(self):
+        tasks_seq = None
+        focus_key = recovery = None
+        while True:
+            with self._lock:
+                if not self._subscribers and not self._pending:
+                    self._thread = None
+                    return
+            try:
+                if tasks_seq is None:
+                    _repo.tasks()
+                    tasks_seq = _repo.seq
+                delta = _repo.changes_since(tasks_seq)
+                if delta is None:
+                    self.publish("resync", {})
+                    tasks_seq = None
+                elif delta[0] != tasks_seq:
+                    tasks_seq, changed, deleted = delta
+                    self.publish("tasks", {
+                        "changed": [_task_payload(t) for t in changed if _is_listed(t)],
+                        "deleted": sorted(deleted + [t.id for t in changed if not _is_listed(t)]),
+                        "version": _repo.token(tasks_seq),
+                    })
+
+                status = commands.focus_manager.get_focus_status()
+                # The client counts seconds down itself; push minutes and state changes only
+                key = json.dumps({k: v for k, v in status.items() if k != 'remaining_seconds'}, sort_keys=True)
+                if focus_key is not None and key != focus_key:
+                    self.publish("focus", status)
+                focus_key = key
+
+                state = storage.storage.load_recovery_state()
+                if recovery is not None and state != recovery:
+                    self.publish("recovery", state)
+                recovery = state
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"event watcher: {e}")
+
+            with self._lock:
+                for q in self._pending:
+                    self._subscribers.add(q)
+                    self._send(q, b"event: hello\ndata: {}\n\n")
+                self._pending.clear()
+            self._wake.wait(self.POLL_SECONDS)
+            self._wake.clear()
+
+
+_events = _EventHub()
+_repo.add_listener(_events.notify)
+
 
+# Derived-field cache: task id -> (inputs, fields, valid_until). The values only depend on
+# the inputs below and, for a task with a deadline, on which side of a few fixed
+# deadline-relative instants "now" is — so each entry is reused until its inputs change
+# or the clock reaches the next such instant. Races between handler threads only cost
+# a recompute.
+_COMPUTED = {}
+_COMPUTED_MAX = 50000
+# Seconds before the deadline at which get_pressure_level() steps up (0 = is_overdue flips)
+_PRESSURE_STEPS = (10800, 3600, 900, 0)
 
-def _computed_task_fields(t):
+
+def _computed_inputs(t):
+    return (t.deadline, t.completed, t.dropped_at, t.offloaded_at, t.status, t.duration, t.priority)
+
+
+def _next_boundary(t, now):
+    """The first instant >= now at which pressure_level / is_overdue can change, or None."""
+    if not t.deadline or t.completed:
+        return None
+    try:
+        dl = _dt.fromisoformat(t.deadline)
+    except Exception:
+        return None
+    if dl.tzinfo is not None:
+        dl = dl.replace(tzinfo=None)
+    for seconds in _PRESSURE_STEPS:
+        boundary = dl - timedelta(seconds=seconds)
+        if boundary >= now:
+            return boundary
+    return None
+
+
+def _computed_task_fields(t, now=None):
     """CODE-HEALTH single source of truth: derive the values the dashboard used to
     re-implement in JS (pressure level, duration→minutes, priority tier, overdue) here in
     Python and ship them in the task payload. Time-relative fields (pressure_level, is_overdue)
-    are recomputed on every fetch — the dashboard re-polls, so the JS consumes, never derives."""
-    from task_manager import commands as _c
-    from datetime import datetime as _dt
+    stay exact: a cached entry expires at the task's next pressure/overdue boundary.
+    The returned dict is shared — splat it, don't mutate it."""
+    now = now or _dt.now()
+    inputs = _computed_inputs(t)
+    entry = _COMPUTED.get(t.id)
+    if entry is not None and entry[0] == inputs and (entry[2] is None or now < entry[2]):
+        return entry[1]
     try:
-        pl = _c.get_pressure_level(t)
+        pl = commands.get_pressure_level(t)
     except Exception:
         pl = 0
-    dur = (getattr(t, 'duration', None) or '').lower()
+    dur = (t.duration or '').lower()
     is_overdue = False
     try:
-        if getattr(t, 'deadline', None) and not getattr(t, 'completed', False):
+        if t.deadline and not t.completed:
             dl = _dt.fromisoformat(t.deadline)
             if dl.tzinfo is not None:
                 dl = dl.replace(tzinfo=None)
-            is_overdue = dl < _dt.now()
+            is_overdue = dl < now
     except Exception:
         is_overdue = False
-    return {
+    fields = {
         "pressure_level": pl,
-        "duration_minutes": _c.DURATION_MINUTES.get(dur) if dur else None,
-        "priority_tier": _c._priority_tier(t),
+        "duration_minutes": commands.DURATION_MINUTES.get(dur) if dur else None,
+        "priority_tier": commands._priority_tier(t),
         "is_overdue": is_overdue,
     }
+    if len(_COMPUTED) >= _COMPUTED_MAX:
+        _COMPUTED.clear()
+    _COMPUTED[t.id] = (inputs, fields, _next_boundary(t, now))
+    return fields
+
+
+def _task_payload(t, now=None):
+    """One task as /api/tasks and the /api/events task deltas ship it (ALL fields + computed)."""
+    return {
+        "id": t.id,
+        "title": t.title,
+        "priority": t.priority,
+        "tags": t.tags,
+        "notes": t.notes,
+        "completed": t.completed,
+        "created_at": t.created_at,
+        # Phase 1 new fields
+        "duration": getattr(t, 'duration', None),
+        "deadline": getattr(t, 'deadline', None),
+        "deadline_type": getattr(t, 'deadline_type', None),
+        "postpone_count": getattr(t, 'postpone_count', 0),
+        "postpone_history": getattr(t, 'postpone_history', []),
+        "reminder_time": getattr(t, 'reminder_time', None),
+        "reminder_time_2": getattr(t, 'reminder_time_2', None),
+        "reminder_fired": getattr(t, 'reminder_fired', False),
+        "reminder_fired_2": getattr(t, 'reminder_fired_2', False),
+        "reminder_dismissed": getattr(t, 'reminder_dismissed', False),
+        "dropped_at": getattr(t, 'dropped_at', None),
+        "offloaded_at": getattr(t, 'offloaded_at', None),
+        "offload_note": getattr(t, 'offload_note', None),
+        "executed_late": getattr(t, 'executed_late', None),
+        # Event system fields
+        "mission_type": getattr(t, 'mission_type', 'Task'),
+        "date": getattr(t, 'date', None),
+        "start_time": getattr(t, 'start_time', None),
+        "end_time": getattr(t, 'end_time', None),
+        "status": getattr(t, 'status', None),
+        # Enrichment fields (E13)
+        "description": getattr(t, 'description', None),
+        "links": getattr(t, 'links', []) or [],
+        "checklist": getattr(t, 'checklist', []) or [],
+        "description_updated_at": getattr(t, 'description_updated_at', None),
+        "links_count": getattr(t, 'links_count', 0),
+        "checklist_total": getattr(t, 'checklist_total', 0),
+        "checklist_done": getattr(t, 'checklist_done', 0),
+        # CODE-HEALTH single-source: server-computed values (JS consumes, never re-derives)
+        **_computed_task_fields(t, now),
+    }
+
+
+def _is_listed(t):
+    """/api/tasks lists every task that is neither dropped nor offloaded."""
+    return getattr(t, 'dropped_at', None) is None and getattr(t, 'offloaded_at', None) is None
 
 
 class TaskFlowHandler(BaseHTTPRequestHandler):
@@ -98,9 +421,90 @@ class TaskFlowHandler(BaseHTTPRequestHandler):
 
     # --- Enrichment helpers (E13) ---
     def _send_json(self, code, payload):
-        self.send_response(code)
-        self.end_headers_json()
-        self.wfile.write(json.dumps(payload).encode('utf-8'))
+        body = json.dumps(payload).encode('utf-8')
+        use_gzip = len(body) >= _GZIP_MIN_BYTES and self._accepts_gzip()
+        if code == 200 and self.command == 'GET':
+            # Conditional GET: an unchanged payload costs the dashboard a bodiless 304
+            etag = '"%s"' % hashlib.blake2b(body, digest_size=12).hexdigest()
+            last_modified = _last_modified(self.path, etag)
+            # The gzip variant's bytes differ, so its validator is the weak form of the same tag
+            sent_etag = 'W/' + etag if use_gzip else etag
+            if self._not_modified(etag, last_modified):
+                self.send_response(304)
+                self.send_header('ETag', sent_etag)
+                self.send_header('Last-Modified', formatdate(last_modified, usegmt=True))
+                self.send_header('Vary', 'Accept-Encoding')
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('ETag', sent_etag)
+            self.send_header('Last-Modified', formatdate(last_modified, usegmt=True))
+            # Cache, but revalidate every time: polled data must never be served stale
+            self.send_header('Cache-Control', 'no-cache')
+        else:
+            self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self._send_body(body, gzip.compress(body, compresslevel=_GZIP_LEVEL) if use_gzip else None)
+
+    def _accepts_gzip(self):
+        """True if Accept-Encoding allows gzip (present and not q=0)."""
+        for coding in (self.headers.get('Accept-Encoding') or '').lower().split(','):
+            name, _, params = coding.partition(';')
+            if name.strip() in ('gzip', '*'):
+                q = params.strip()
+                try:
+                    return float(q[2:]) > 0 if q.startswith('q=') else True
+                except ValueError:
+                    return True
+        return False
+
+    def _send_body(self, body, packed=None):
+        """End the headers and write `body`, or its gzip form `packed` (None = not compressible)."""
+        if packed is not None:
+            self.send_header('Content-Encoding', 'gzip')
+            body = packed
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_events(self):
+        """GET /api/events: hold the connection open and relay _EventHub messages."""
+        q = _events.subscribe()
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(b"retry: 3000\n\n")
+            while True:
+                try:
+                    message = q.get(timeout=15)
+                except queue.Empty:
+                    message = b": keep-alive\n\n"   # also how a vanished client is noticed
+                if message is None:
+                    return
+                self.wfile.write(message)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            pass
+        finally:
+            _events.unsubscribe(q)
+
+    def _not_modified(self, etag, last_modified):
+        """True if the request's validators (If-None-Match, else If-Modified-Since) match."""
+        inm = self.headers.get('If-None-Match')
+        if inm is not None:
+            # Weak comparison (RFC 7232): W/"x" matches "x" — see the gzip variant in _send_json
+            tags = [t.strip() for t in inm.split(',')]
+            return '*' in tags or etag in [t[2:] if t.startswith('W/') else t for t in tags]
+        ims = self.headers.get('If-Modified-Since')
+        if ims and last_modified is not None:
+            try:
+                return parsedate_to_datetime(ims).timestamp() >= last_modified
+            except (TypeError, ValueError):
+                return False
+        return False
 
     def _read_body(self):
         try:
@@ -137,7 +541,7 @@ class TaskFlowHandler(BaseHTTPRequestHandler):
         else:
             sections = cfg.get('path_sections') or {}
 
-        tasks = storage.load_tasks()
+        tasks = _repo.tasks()
         by_id = {t.id: t for t in tasks}
 
         def pack(idlist):
@@ -199,1245 +603,1267 @@ class TaskFlowHandler(BaseHTTPRequestHandler):
             "has_path": bool(packed["prime"] or packed["secondary"] or packed["low_effort"]),
         }
 
-    def do_GET(self):
+    # --- Dispatch: every endpoint below is a method registered on _router with @_route ---
+    def send_response(self, code, message=None):
+        self.response_status = code   # read by the router's per-route error counter
+        super().send_response(code, message)
+
+    def _dispatch(self):
         parsed = urlparse(self.path)
-        path = parsed.path
-        if self._guard():   # SEC-07: reject foreign Host (DNS-rebinding)
+        found = _router.match(self.command, parsed.path)
+        if found is None:
+            if self.command in ('PATCH', 'DELETE'):
+                self._send_json(404, {"error": "Not found"})
+            else:
+                self.send_response(404)
+                self.end_headers()
             return
+        route, params = found
+        self.query = parse_qs(parsed.query)
+        _router.dispatch(self, route, params)
 
-        if path == "/":
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html; charset=utf-8')
-            self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate, max-age=0')
-            self.send_header('Pragma', 'no-cache')
-            self.send_header('Expires', '0')
-            # SEC-01: CSP blocks the XSS *exfiltration* channel even if a payload slips escaping —
-            # connect-src/img-src 'self' means a script can't phone home to evil.com.
-            self.send_header('Content-Security-Policy',
-                             "default-src 'self'; script-src 'self' 'unsafe-inline'; "
-                             "style-src 'self' 'unsafe-inline'; img-src 'self' data:; "
-                             "font-src 'self'; connect-src 'self'; base-uri 'none'; form-action 'none'")
-            self.send_header('X-Content-Type-Options', 'nosniff')
-            self.send_header('Referrer-Policy', 'no-referrer')
+    do_GET = do_POST = do_PATCH = do_DELETE = _dispatch
+
+    @_route("GET", "/")
+    def _get_shell(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate, max-age=0')
+        self.send_header('Pragma', 'no-cache')
+        self.send_header('Expires', '0')
+        # SEC-01: CSP blocks the XSS *exfiltration* channel even if a payload slips escaping —
+        # connect-src/img-src 'self' means a script can't phone home to evil.com.
+        self.send_header('Content-Security-Policy',
+                         "default-src 'self'; script-src 'self' 'unsafe-inline'; "
+                         "style-src 'self' 'unsafe-inline'; img-src 'self' data:; "
+                         "font-src 'self'; connect-src 'self'; base-uri 'none'; form-action 'none'")
+        self.send_header('X-Content-Type-Options', 'nosniff')
+        self.send_header('Referrer-Policy', 'no-referrer')
+        self._send_body(_SHELL_BODY, _SHELL_GZIP if self._accepts_gzip() else None)
+
+    @_route("GET", "/api/tasks")
+    def _get_tasks(self):
+        # ?since=<version>: only what changed after that version, plus tombstones
+        since = self.query.get('since', [None])[0]
+        seq = _repo.parse_token(since) if since else None
+        delta = _repo.changes_since(seq) if seq is not None else None
+        if delta is not None:
+            seq, changed, deleted = delta
+            self._send_json(200, {
+                "tasks": [_task_payload(t) for t in changed if _is_listed(t)],
+                # dropped/offloaded tasks leave the list just like deleted ones
+                "deleted": sorted(deleted + [t.id for t in changed if not _is_listed(t)]),
+                "version": _repo.token(seq),
+                "full": False,
+            })
+            return
+        # No (usable) version: the full list. The token is read first, so at worst the
+        # client's next delta repeats a change it already has.
+        version = _repo.token()
+        tasks = _repo.tasks()
+        # Return ALL fields (including Phase 1 fields) for pending tasks
+        now = _dt.now()
+        pending_tasks = [_task_payload(t, now) for t in tasks if _is_listed(t)]
+        self._send_json(200, {"tasks": pending_tasks, "version": version, "full": True})
+
+    @_route("GET", "/api/events")
+    def _get_events(self):
+        # Push channel: task deltas, focus and recovery changes (see _EventHub)
+        self._stream_events()
+
+    @_route("GET", "/api/debug_tasks")
+    def _get_debug_tasks(self):
+        tasks = _repo.tasks()
+        self._send_json(200, {"len_tasks": len(tasks), "file": str(storage.TaskStorage().tasks_file)})
+
+    @_route("GET", "/api/debug_routes")
+    def _get_debug_routes(self):
+        # Per-route call counts and timings (routing.RouteStats), busiest first
+        self._send_json(200, {"routes": _router.stats()})
+
+    @_route("GET", "/api/search")
+    def _get_search(self):
+        # ?q=<words>[&status=&priority=&tag=&limit=]: ranked full-text matches (search_index)
+        q = (self.query.get('q', [''])[0] or '').strip()
+        if not q:
+            self._send_json(400, {"error": "Missing query parameter q"})
+            return
+        try:
+            limit = int(self.query.get('limit', ['20'])[0])
+        except ValueError:
+            self._send_json(400, {"error": "limit must be a number"})
+            return
+        try:
+            results = storage.storage.search_tasks(
+                q, status=self.query.get('status', [None])[0],
+                priority=self.query.get('priority', [None])[0],
+                tag=self.query.get('tag', [None])[0], limit=limit)
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        self._send_json(200, {"query": q, "results": results})
+
+    @_route("GET", "/api/stats")
+    def _get_stats(self):
+        tasks = _repo.tasks()
+        total = len(tasks)
+        completed = sum(1 for t in tasks if t.completed)
+        rate = (completed / total * 100) if total > 0 else 0
+        try:
+            cfg = storage.storage.load_config()
+        except Exception:
+            cfg = {}
+        streak = cfg.get('execution_streak', 0)
+        self._send_json(200, {
+            "completion_rate": round(rate, 1),
+            "total": total,
+            "completed": completed,
+            "execution_streak": streak,
+        })
+
+    @_route("GET", "/api/timeline")
+    def _get_timeline(self):
+        mapping = storage.load_timeline()
+        self._send_json(200, mapping)
+
+    @_route("GET", "/api/recovery-status")
+    def _get_recovery_status(self):
+        try:
+            state = storage.storage.load_recovery_state()
+            self._send_json(200, state)
+        except Exception as e:
+            self._send_json(200, {"active": False})
+
+    @_route("GET", "/api/recovery-preview")
+    def _get_recovery_preview(self):
+        try:
+            from task_manager import commands as _cmds
+            preview = _cmds.select_recovery_tasks()
+            self._send_json(200, {"preview_tasks": [t.to_dict() for t in preview]})
+        except Exception:
+            self._send_json(200, {"preview_tasks": []})
+
+    @_route("GET", "/api/tasks/completed-today")
+    def _get_completed_today(self):
+        try:
+            today = _dt.now().strftime('%Y-%m-%d')
+            tasks = _repo.tasks()
+            count = sum(1 for t in tasks if t.completed and getattr(t, 'completed_at', None) and str(t.completed_at).startswith(today))
+            self._send_json(200, {"count": count})
+        except Exception:
+            self._send_json(200, {"count": 0})
+
+    @_route("GET", "/api/stats-full")
+    def _get_stats_full(self):
+        # Extended stats including overdue + deferred counts
+        tasks = _repo.tasks()
+        from datetime import datetime
+        now = datetime.now()
+        total = len(tasks)
+        completed = sum(1 for t in tasks if t.completed)
+        pending = [t for t in tasks if not t.completed]
+        overdue = sum(1 for t in pending if t.deadline and datetime.fromisoformat(t.deadline) < now)
+        deferred = sum(1 for t in pending if getattr(t, 'postpone_count', 0) >= 2)
+        rate = (completed / total * 100) if total > 0 else 0
+        self._send_json(200, {
+            "completion_rate": round(rate, 1),
+            "total": total,
+            "completed": completed,
+            "pending": len(pending),
+            "overdue": overdue,
+            "deferred": deferred
+        })
+
+    @_route("GET", "/api/stats/weekly")
+    def _get_stats_weekly(self):
+        # S12-F: weekly Time Integrity aggregates (+ streak + recent recovery)
+        try:
+            from task_manager import commands as _cmds
+            _cmds.ensure_daily_summaries()
+            summaries = storage.storage.load_daily_summaries()
+            w = _cmds.compute_weekly_stats(summaries) or {}
+            cfg = storage.storage.load_config()
+            w['execution_streak'] = cfg.get('execution_streak', 0)
+            rlog = []
+            try:
+                if storage.storage.recovery_log_file.exists():
+                    with open(storage.storage.recovery_log_file) as rf:
+                        rlog = json.load(rf)
+            except Exception:
+                rlog = []
+            w['recovery_history'] = (rlog or [])[-5:][::-1]
+            self._send_json(200, w)
+        except Exception as e:
+            self._send_json(200, {"error": str(e)})
+
+    @_route("GET", "/api/stats/daily-summaries")
+    def _get_daily_summaries(self):
+        # S12-F: last 7 computed daily summaries
+        try:
+            from task_manager import commands as _cmds
+            _cmds.ensure_daily_summaries()
+            summaries = storage.storage.load_daily_summaries()
+            self._send_json(200, {"summaries": summaries[-7:]})
+        except Exception:
+            self._send_json(200, {"summaries": []})
+
+    @_route("GET", "/api/stats/day-of-week")
+    def _get_day_of_week(self):
+        # S14-F: per-weekday performance aggregates for the Analytics "DAY OF WEEK" card
+        try:
+            from task_manager import commands as _cmds
+            _cmds.ensure_daily_summaries()
+            summaries = storage.storage.load_daily_summaries()
+            self._send_json(200, _cmds.compute_day_of_week_stats(summaries))
+        except Exception as e:
+            self._send_json(200, {"by_day": {}, "best_day": None, "worst_day": None,
+                                  "best_day_name": None, "worst_day_name": None,
+                                  "best_day_avg_tis": None, "worst_day_avg_tis": None,
+                                  "recommendation": "", "error": str(e)})
+
+    @_route("GET", "/api/focus_state")
+    def _get_focus_state(self):
+        try:
+            from task_manager.commands import focus_manager
+            status = focus_manager.get_focus_status()
+            # e.g. {"focus_active": True, "task_id": X, "task_title": "...", "minutes_left": 25, ...}
+            self._send_json(200, status)
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+
+    @_route("GET", "/api/intelligence")
+    def _get_intelligence(self):
+        # Local, honest behavioral insights (no network/LLM) for the Intelligence tab.
+        try:
+            from task_manager import commands
+            self._send_json(200, commands.get_intelligence_insights())
+        except Exception as e:
+            self._send_json(200, {"insights": [], "have_data": False, "error": str(e)})
+
+    @_route("GET", "/api/focus/next")
+    def _get_focus_next(self):
+        # Ranked next-targets for the post-completion momentum modal (Zeigarnik-in-reverse).
+        try:
+            from task_manager import commands
+            limit = int(self.query.get('limit', ['3'])[0])
+            self._send_json(200, {"targets": commands.get_momentum_targets(limit=limit)})
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+
+    @_route("GET", "/api/focus-status")
+    def _get_focus_status(self):
+        # S11-F: focus lock status for the UI (active / task_id / ends_at / queued_count)
+        try:
+            from task_manager import commands as _cmds
+            self._send_json(200, _cmds.focus_status_payload())
+        except Exception:
+            self._send_json(200, {"active": False, "task_id": None, "ends_at": None, "queued_count": 0})
+
+    @_route("GET", "/api/focus/preflight")
+    def _get_focus_preflight(self):
+        # Honest answer for the Focus Setup modal: can strict blocking actually engage?
+        # (Editing the hosts file / killing apps needs Administrator on Windows.)
+        try:
+            from task_manager.system_detector import SystemDetector
+            self._send_json(200, {"is_admin": bool(SystemDetector.is_admin()),
+                                  "platform": SystemDetector.get_os()})
+        except Exception:
+            self._send_json(200, {"is_admin": False, "platform": "unknown"})
+
+    @_route("GET", "/api/user-profile")
+    def _get_user_profile(self):
+        # Shared user_profile.json — read basics for OPERATOR M "About You" panel
+        import pathlib as _pl
+        _up = _pl.Path.home() / ".taskflow" / "user_profile.json"
+        try:
+            _data = json.loads(_up.read_text(encoding="utf-8")) if _up.exists() else {}
+        except Exception:
+            _data = {}
+        self._send_json(200, {"profile": _data})
+
+    @_route("GET", "/api/blocklist")
+    def _get_blocklist(self):
+        try:
+            from task_manager.blockers.blocklist import blocklist_manager
+            saved = blocklist_manager.load_sites()
+            self._send_json(200, {"blocklist": saved})
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+
+    @_route("GET", "/api/path")
+    def _get_path(self):
+        # S10-F: current day's Daily Execution Path (auto-generates if stale)
+        try:
+            self._send_json(200, self._path_payload(regenerate=False))
+        except Exception as e:
+            self._send_json(200, {
+                "generated_date": None,
+                "sections": {"prime": [], "secondary": [], "low_effort": [], "unscheduled": []},
+                "section_minutes": {"prime": 0, "secondary": 0, "low_effort": 0, "unscheduled": 0},
+                "total_minutes": 0, "adherence": None, "error": str(e),
+                "overdue_candidates": [], "overdue_total": 0, "evening": False, "has_path": False
+            })
+
+    @_route("GET", "/static/{name:path}")
+    def _get_static(self, name):
+        # Served from memory (_STATIC). SEC-05: only names loaded from static/ at startup
+        # exist here, so there is no path to traverse.
+        asset = _STATIC_BY_HASHED.get(name)
+        immutable = asset is not None
+        asset = asset or _STATIC.get(name)
+        if asset is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        packed = asset["gzip"] if self._accepts_gzip() else None
+        etag = 'W/' + asset["etag"] if packed is not None else asset["etag"]
+        if self._not_modified(asset["etag"], None):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Vary', 'Accept-Encoding')
             self.end_headers()
-            self.wfile.write(HTML_TEMPLATE.encode('utf-8', errors='replace'))
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', asset["type"])
+        self.send_header('ETag', etag)
+        # Hashed names never change content; plain names (old pages, direct links) revalidate
+        self.send_header('Cache-Control', 'public, max-age=31536000, immutable' if immutable else 'no-cache')
+        self._send_body(asset["body"], packed)
+
+    def _mutate(self, handler, optimistic):
+        """
+        Run a mutating handler. Optimistic ones run unlocked inside _repo.attempt(); if a
+        commit hit a same-field conflict, the buffered response is discarded and the
+        handler re-runs on fresh state (the request body is replayed), the final time
+        exclusively. The rest run under _WRITE_LOCK as before.
+        """
+        if not optimistic:
+            with _WRITE_LOCK:   # D7-03: serialise writes
+                handler()
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except (TypeError, ValueError):
+            length = 0
+        body = self.rfile.read(length) if length > 0 else b""
+        wfile = self.wfile
+        response = io.BytesIO()
+        try:
+            for attempt in range(_MUTATION_ATTEMPTS):
+                self.rfile = io.BytesIO(body)
+                self.wfile = response = io.BytesIO()
+                with _repo.attempt(exclusive=attempt == _MUTATION_ATTEMPTS - 1):
+                    handler()
+                    if not _repo.conflicted():
+                        break
+        finally:
+            self.wfile = wfile
+            wfile.write(response.getvalue())
 
+    @_route("POST", "/api/tasks", lock="optimistic")
+    def _post_tasks(self):
+        data = self._read_body()
+        try:
+            title = data.get("title")
+            priority_raw = data.get("priority", "medium")
+            priority = normalize_priority(priority_raw)
+            tags = data.get("tags", [])
 
-        elif path == "/api/tasks":
-            tasks = storage.load_tasks()
-            # Return ALL fields (including Phase 1 fields) for pending tasks
-            pending_tasks = [
-                {
-                    "id": t.id,
-                    "title": t.title,
-                    "priority": t.priority,
-                    "tags": t.tags,
-                    "notes": t.notes,
-                    "completed": t.completed,
-                    "created_at": t.created_at,
-                    # Phase 1 new fields
-                    "duration": getattr(t, 'duration', None),
-                    "deadline": getattr(t, 'deadline', None),
-                    "deadline_type": getattr(t, 'deadline_type', None),
-                    "postpone_count": getattr(t, 'postpone_count', 0),
-                    "postpone_history": getattr(t, 'postpone_history', []),
-                    "reminder_time": getattr(t, 'reminder_time', None),
-                    "reminder_time_2": getattr(t, 'reminder_time_2', None),
-                    "reminder_fired": getattr(t, 'reminder_fired', False),
-                    "reminder_fired_2": getattr(t, 'reminder_fired_2', False),
-                    "reminder_dismissed": getattr(t, 'reminder_dismissed', False),
-                    "dropped_at": getattr(t, 'dropped_at', None),
-                    "offloaded_at": getattr(t, 'offloaded_at', None),
-                    "offload_note": getattr(t, 'offload_note', None),
-                    "executed_late": getattr(t, 'executed_late', None),
-                    # Event system fields
-                    "mission_type": getattr(t, 'mission_type', 'Task'),
-                    "date": getattr(t, 'date', None),
-                    "start_time": getattr(t, 'start_time', None),
-                    "end_time": getattr(t, 'end_time', None),
-                    "status": getattr(t, 'status', None),
-                    # Enrichment fields (E13)
-                    "description": getattr(t, 'description', None),
-                    "links": getattr(t, 'links', []) or [],
-                    "checklist": getattr(t, 'checklist', []) or [],
-                    "description_updated_at": getattr(t, 'description_updated_at', None),
-                    "links_count": getattr(t, 'links_count', 0),
-                    "checklist_total": getattr(t, 'checklist_total', 0),
-                    "checklist_done": getattr(t, 'checklist_done', 0),
-                    # CODE-HEALTH single-source: server-computed values (JS consumes, never re-derives)
-                    **_computed_task_fields(t),
-                }
-                for t in tasks if getattr(t, 'dropped_at', None) is None and getattr(t, 'offloaded_at', None) is None
-            ]
+            if not title:
+                self.send_response(400)
+                self.end_headers_json()
+                self.wfile.write(json.dumps({"error": "Title is required"}).encode('utf-8'))
+                return
+
+            tasks = _repo.checkout()
+            manager = models.TaskManager(tasks)
+
+            new_task = models.Task(
+                id=0,
+                title=title,
+                priority=priority,
+                tags=tags
+            )
+
+            manager.add_task(new_task)
+            _repo.commit(manager.tasks)
+
+            # Read after the commit: a concurrent add may have moved ours to another id
+            self.send_response(201)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"success": True, "id": new_task.id}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+
+    @_route("POST", "/api/tasks/dump")
+    def _post_dump(self):
+        data = self._read_body()
+        try:
+            title = data.get("title", "").strip()
+            if not title:
+                self.send_response(400)
+                self.end_headers_json()
+                self.wfile.write(json.dumps({"error": "Empty title"}).encode('utf-8'))
+                return
+
+            from task_manager import commands
+            task_dict = commands.dump_task(title)
+            if task_dict:
+                self.send_response(201)
+                self.end_headers_json()
+                self.wfile.write(json.dumps({"success": True, "task": task_dict}).encode('utf-8'))
+            else:
+                self.send_response(500)
+                self.end_headers_json()
+                self.wfile.write(json.dumps({"error": "Failed to dump task"}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+
+    @_route("POST", "/api/tasks/batch")
+    def _post_batch(self):
+        # Ordered create/dump/patch/complete/drop/delete under one load and one save
+        # (task_manager.batch). Not optimistic: completions also write the stats file.
+        data = self._read_body()
+        from task_manager.batch import apply_batch, BatchError
+        try:
+            operations = data.get("operations") if isinstance(data, dict) else None
+            outcome = apply_batch(operations, load=_repo.checkout, save=_repo.commit)
+        except BatchError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        if outcome["applied"]:
+            self._send_json(200, outcome)
+        else:
+            self._send_json(500 if "error" in outcome else 409, outcome)
+
+    @_route("POST", "/api/timeline")
+    def _post_timeline(self):
+        data = self._read_body()
+        try:
+            # Expect dict {"mapping": {"1": "2026-03-31_prime"}}
+            mapping = data.get("mapping", {})
+            storage.save_timeline(mapping)
+            self.send_response(200)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+
+    @_route("POST", "/api/focus_end")
+    @_route("POST", "/api/focus/end")
+    def _post_focus_end(self):
+        from task_manager import commands
+        try:
+            commands.end_focus(force=True)        # graceful end (blocker cleanup, queue flush)
+        except Exception:
+            pass
+        # ALWAYS tear down blocking, even if the session was already cleared (expiry/poll race)
+        # so end_focus skipped it — this is what left the proxy/hosts stuck after a focus ended.
+        try:
+            commands.focus_manager.deactivate_blocking()
+        except Exception:
+            pass
+        # GUARANTEE the session is gone in memory AND on disk, regardless of what end_focus
+        # did — otherwise check_focus() reloads the old session and the overlay resurrects.
+        try:
+            commands.time_tracker.active_session = None
+            commands.time_tracker.start_time = None
+            commands.time_tracker._save_state({'active_session': None, 'start_time': None})
+        except Exception:
+            pass
+        self._send_json(200, {"success": True})
+
+    @_route("POST", "/api/focus/pause")
+    def _post_focus_pause(self):
+        try:
+            from task_manager import commands
+            commands.time_tracker.pause_focus()
             self.send_response(200)
             self.end_headers_json()
-            self.wfile.write(json.dumps({"tasks": pending_tasks}).encode('utf-8'))
+            self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/debug_tasks":
-            tasks = storage.load_tasks()
+    @_route("POST", "/api/focus/resume")
+    def _post_focus_resume(self):
+        try:
+            from task_manager import commands
+            commands.time_tracker.resume_focus()
             self.send_response(200)
             self.end_headers_json()
-            self.wfile.write(json.dumps({"len_tasks": len(tasks), "file": str(storage.TaskStorage().tasks_file)}).encode('utf-8'))
+            self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/stats":
-            tasks = storage.load_tasks()
-            total = len(tasks)
-            completed = sum(1 for t in tasks if t.completed)
-            rate = (completed / total * 100) if total > 0 else 0
+    @_route("POST", "/api/focus/extend")
+    def _post_focus_extend(self):
+        # "Need more time" — re-arm the clock without re-blocking (blocking stays active).
+        data = self._read_body()
+        from task_manager import commands
+        try:
+            mins = int(data.get("minutes", 10))
+        except (ValueError, TypeError):
+            mins = 10
+        ok = commands.extend_focus(mins)
+        self._send_json(200, {"success": bool(ok), "minutes": mins})
+
+    @_route("POST", "/api/focus/complete")
+    def _post_focus_complete(self):
+        data = self._read_body()
+        try:
+            from task_manager import commands
+            efficiency_score = data.get("efficiency_score", 0)
+            time_saved = data.get("time_saved", 0)
+            time_used = data.get("time_used", 0)
+
+            # Update task in storage via unified complete_task (triggers Dopamine Engine)
+            status = commands.focus_manager.get_focus_status()
+            dopamine = {}
+            if status and status.get("focus_active"):
+                task_id = status.get("task_id")
+                if task_id:
+                    # Generate dopamine via unified engine (marks complete + tracks streak)
+                    result = commands.complete_task(task_id)
+                    if isinstance(result, dict):
+                        dopamine = result
+
+                    # Also track the focus time (this was handled before mark_complete)
+                    tasks = _repo.checkout()
+                    for task in tasks:
+                        if task.id == task_id:
+                            task.add_focus_minutes(time_used)
+                            _repo.commit(tasks)
+                            break
+
+            # Sync focus state
+            try:
+                commands.complete_focus(efficiency_score, time_saved, time_used)
+            except Exception as ex:
+                try:
+                    commands.time_tracker.end_focus()
+                    commands.time_tracker._save_state({'active_session': None, 'start_time': None})
+                except: pass
+            # ALWAYS release blocking on complete, regardless of session state (expiry race).
             try:
-                cfg = storage.storage.load_config()
+                commands.focus_manager.deactivate_blocking()
             except Exception:
-                cfg = {}
-            streak = cfg.get('execution_streak', 0)
+                pass
+
             self.send_response(200)
             self.end_headers_json()
-            self.wfile.write(json.dumps({
-                "completion_rate": round(rate, 1),
-                "total": total,
-                "completed": completed,
-                "execution_streak": streak,
-            }).encode('utf-8'))
-            
-        elif path == "/api/timeline":
-            mapping = storage.load_timeline()
-            self.send_response(200)
+            response = {"success": True}
+            response.update(dopamine)
+            self.wfile.write(json.dumps(response).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
             self.end_headers_json()
-            self.wfile.write(json.dumps(mapping).encode('utf-8'))
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/recovery-status":
-            try:
-                state = storage.storage.load_recovery_state()
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps(state).encode('utf-8'))
-            except Exception as e:
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"active": False}).encode('utf-8'))
+    @_route("POST", "/api/tasks/{task_id:int}/complete")
+    def _post_complete(self, task_id):
+        try:
+            from task_manager import commands
+            dopamine = commands.complete_task(task_id)
 
-        elif path == "/api/recovery-preview":
-            try:
-                from task_manager import commands as _cmds
-                preview = _cmds.select_recovery_tasks()
+            if dopamine is not False:
                 self.send_response(200)
                 self.end_headers_json()
-                self.wfile.write(json.dumps({"preview_tasks": [t.to_dict() for t in preview]}).encode('utf-8'))
-            except Exception:
-                self.send_response(200)
+                response_data = {"success": True}
+                if isinstance(dopamine, dict):
+                    response_data.update(dopamine)
+                self.wfile.write(json.dumps(response_data).encode('utf-8'))
+            else:
+                self.send_response(404)
                 self.end_headers_json()
-                self.wfile.write(json.dumps({"preview_tasks": []}).encode('utf-8'))
+                self.wfile.write(json.dumps({"error": "Task not found"}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/tasks/completed-today":
-            try:
-                from datetime import datetime as _dt
-                today = _dt.now().strftime('%Y-%m-%d')
-                tasks = storage.load_tasks()
-                count = sum(1 for t in tasks if t.completed and getattr(t, 'completed_at', None) and str(t.completed_at).startswith(today))
+    @_route("POST", "/api/tasks/{task_id:int}/delete", lock="optimistic")
+    def _post_delete(self, task_id):
+        try:
+            tasks = _repo.checkout()
+            manager = models.TaskManager(tasks)
+            if manager.delete_task(task_id):
+                _repo.commit(manager.tasks)
                 self.send_response(200)
                 self.end_headers_json()
-                self.wfile.write(json.dumps({"count": count}).encode('utf-8'))
-            except Exception:
-                self.send_response(200)
+                self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
+            else:
+                self.send_response(404)
                 self.end_headers_json()
-                self.wfile.write(json.dumps({"count": 0}).encode('utf-8'))
+                self.wfile.write(json.dumps({"error": "Task not found"}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/stats-full":
-            # Extended stats including overdue + deferred counts
-            tasks = storage.load_tasks()
-            from datetime import datetime
+    @_route("POST", "/api/tasks/{task_id:int}/postpone", lock="optimistic")
+    def _post_postpone(self, task_id):
+        data = self._read_body()
+        try:
+            increment = data.get("increment", "+1h")
+            tasks = _repo.checkout()
+            task = None
+            for t in tasks:
+                if t.id == task_id:
+                    task = t
+                    break
+            if not task:
+                self.send_response(404)
+                self.end_headers_json()
+                self.wfile.write(json.dumps({"error": "Task not found"}).encode('utf-8'))
+                return
+            from datetime import datetime, timedelta
             now = datetime.now()
-            total = len(tasks)
-            completed = sum(1 for t in tasks if t.completed)
-            pending = [t for t in tasks if not t.completed]
-            overdue = sum(1 for t in pending if t.deadline and datetime.fromisoformat(t.deadline) < now)
-            deferred = sum(1 for t in pending if getattr(t, 'postpone_count', 0) >= 2)
-            rate = (completed / total * 100) if total > 0 else 0
+            # Calculate new deadline based on increment
+            increment_map = {
+                "+15m": timedelta(minutes=15),
+                "+1h": timedelta(hours=1),
+                "+3h": timedelta(hours=3),
+                "tomorrow": None  # Special case
+            }
+            if increment == "tomorrow":
+                tomorrow = now + timedelta(days=1)
+                new_deadline = tomorrow.replace(hour=9, minute=0, second=0, microsecond=0)
+            elif increment in increment_map:
+                base = datetime.fromisoformat(task.deadline) if task.deadline else now
+                if base < now:
+                    base = now  # Don't postpone from an overdue date
+                new_deadline = base + increment_map[increment]
+            else:
+                try:
+                    # Attempt to parse as ISO string
+                    new_deadline = datetime.fromisoformat(increment.replace('Z', '+00:00'))
+                except ValueError:
+                    new_deadline = now + timedelta(hours=1)
+
+            reason = data.get("reason", "").strip()
+            history_entry = json.dumps({
+                "date": now.isoformat(),
+                "increment": increment,
+                "reason": reason
+            })
+
+            task.deadline = new_deadline.isoformat()
+            task.postpone_count += 1
+            task.postpone_history.append(history_entry)
+            _repo.commit(tasks)
+
             self.send_response(200)
             self.end_headers_json()
             self.wfile.write(json.dumps({
-                "completion_rate": round(rate, 1),
-                "total": total,
-                "completed": completed,
-                "pending": len(pending),
-                "overdue": overdue,
-                "deferred": deferred
+                "success": True,
+                "postpone_count": task.postpone_count,
+                "new_deadline": task.deadline
             }).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/stats/weekly":
-            # S12-F: weekly Time Integrity aggregates (+ streak + recent recovery)
-            try:
-                from task_manager import commands as _cmds
-                _cmds.ensure_daily_summaries()
-                summaries = storage.storage.load_daily_summaries()
-                w = _cmds.compute_weekly_stats(summaries) or {}
-                cfg = storage.storage.load_config()
-                w['execution_streak'] = cfg.get('execution_streak', 0)
-                rlog = []
-                try:
-                    if storage.storage.recovery_log_file.exists():
-                        with open(storage.storage.recovery_log_file) as rf:
-                            rlog = json.load(rf)
-                except Exception:
-                    rlog = []
-                w['recovery_history'] = (rlog or [])[-5:][::-1]
-                self._send_json(200, w)
-            except Exception as e:
-                self._send_json(200, {"error": str(e)})
+    @_route("POST", "/api/tasks/{task_id:int}/offload", lock="optimistic")
+    def _post_offload(self, task_id):
+        data = self._read_body()
+        try:
+            note = data.get("note", "Delegated")
+            tasks = _repo.checkout()
+            task = None
+            for t in tasks:
+                if t.id == task_id:
+                    task = t
+                    break
+            if not task:
+                self.send_response(404)
+                self.end_headers_json()
+                self.wfile.write(json.dumps({"error": "Task not found"}).encode('utf-8'))
+                return
+            from datetime import datetime
+            task.offloaded_at = datetime.now().isoformat()
+            task.offload_note = note
+            _repo.commit(tasks)
+
+            self.send_response(200)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/stats/daily-summaries":
-            # S12-F: last 7 computed daily summaries
+    @_route("POST", "/api/user-profile")
+    def _post_user_profile(self):
+        # POST: update basics fields in user_profile.json
+        import pathlib as _pl2
+        try:
+            body = self._read_body()
+            _up2 = _pl2.Path.home() / ".taskflow" / "user_profile.json"
+            existing = {}
             try:
-                from task_manager import commands as _cmds
-                _cmds.ensure_daily_summaries()
-                summaries = storage.storage.load_daily_summaries()
-                self._send_json(200, {"summaries": summaries[-7:]})
+                if _up2.exists():
+                    existing = json.loads(_up2.read_text(encoding="utf-8"))
             except Exception:
-                self._send_json(200, {"summaries": []})
+                pass
+            if not isinstance(existing, dict):
+                existing = {}
+            basics = existing.get("basics") or {}
+            for field in ("name", "pronouns", "life_context", "peak_hours"):
+                if field in body:
+                    basics[field] = str(body[field]).strip()
+            existing["basics"] = basics
+            from datetime import datetime as _dt2
+            existing["updated_at"] = _dt2.now().isoformat()
+            _tmp2 = _up2.with_suffix(".json.tmp")
+            _tmp2.write_text(json.dumps(existing, indent=2, ensure_ascii=False), encoding="utf-8")
+            _tmp2.replace(_up2)
+            self.send_response(200)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"ok": True}).encode("utf-8"))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode("utf-8"))
 
-        elif path == "/api/stats/day-of-week":
-            # S14-F: per-weekday performance aggregates for the Analytics "DAY OF WEEK" card
-            try:
-                from task_manager import commands as _cmds
-                _cmds.ensure_daily_summaries()
-                summaries = storage.storage.load_daily_summaries()
-                self._send_json(200, _cmds.compute_day_of_week_stats(summaries))
-            except Exception as e:
-                self._send_json(200, {"by_day": {}, "best_day": None, "worst_day": None,
-                                      "best_day_name": None, "worst_day_name": None,
-                                      "best_day_avg_tis": None, "worst_day_avg_tis": None,
-                                      "recommendation": "", "error": str(e)})
+    @_route("POST", "/api/blocklist")
+    def _post_blocklist(self):
+        data = self._read_body()
+        try:
+            from task_manager.blockers.blocklist import blocklist_manager
+            if "add" in data:
+                blocklist_manager.add_sites([data["add"]])
+            elif "remove" in data:
+                # remove_sites expects indices? Wait, the API takes indices: `def remove_sites(indices)`?
+                # Let me check if blocklist_manager has a way to remove by name, or I'll just load and save.
+                saved = blocklist_manager.load_sites()
+                if data["remove"] in saved:
+                    saved.remove(data["remove"])
+                    # How does it save? It doesn't have save_sites?
+                    with open(blocklist_manager.blocklist_file, 'w') as f:
+                        json.dump({"websites": saved}, f, indent=4)
+
+            self.send_response(200)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/focus_state":
+    @_route("POST", "/api/focus/start")
+    def _post_focus_start(self):
+        data = self._read_body()
+        task_id_raw = data.get("task_id") or data.get("id")
+        try:
+            task_id = int(task_id_raw) if task_id_raw is not None else None
+        except (ValueError, TypeError):
+            task_id = None
+
+        minutes = int(data.get("minutes", 25))
+        mode = data.get("mode", "gentle")
+        block_sites = data.get("block_sites") or None      # strict-mode site list from the UI
+        block_apps = data.get("block_apps") or None
+
+        def run_focus():
+            import sys, io
+            # Import locally: other do_POST branches do `from task_manager import commands`,
+            # which makes `commands` a function-local for ALL of do_POST — so the module-level
+            # `commands` is shadowed and unbound on this path. (This was the real focus bug:
+            # focus_task never ran, no session persisted, overlay died at the first poll.)
+            from task_manager import commands as _cmds
+            original = sys.stdout
             try:
-                from task_manager.commands import focus_manager
-                status = focus_manager.get_focus_status()
-                # e.g. {"focus_active": True, "task_id": X, "task_title": "...", "minutes_left": 25, ...}
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps(status).encode('utf-8'))
+                sys.stdout = io.StringIO()   # keep focus_task's prints out of the server log
+                # open_ui=False: we ARE the web server — never re-launch the dashboard here.
+                _cmds.focus_task(task_id=task_id, minutes=minutes, mode=mode,
+                                 block_sites=block_sites, block_apps=block_apps,
+                                 force=True, open_ui=False)
             except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+                sys.stderr.write(f"[focus/start] {e}\n")
+            finally:
+                sys.stdout = original        # always restore — never leave server stdout dead
+        threading.Thread(target=run_focus, daemon=True).start()
+        self.send_response(200)
+        self.end_headers_json()
+        self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
 
-        elif path == "/api/intelligence":
-            # Local, honest behavioral insights (no network/LLM) for the Intelligence tab.
-            try:
-                from task_manager import commands
-                self._send_json(200, commands.get_intelligence_insights())
-            except Exception as e:
-                self._send_json(200, {"insights": [], "have_data": False, "error": str(e)})
+    @_route("POST", "/api/path/generate")
+    def _post_path_generate(self):
+        # S10-F: regenerate today's path on demand
+        try:
+            self._send_json(200, self._path_payload(regenerate=True))
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
 
-        elif path == "/api/focus/next":
-            # Ranked next-targets for the post-completion momentum modal (Zeigarnik-in-reverse).
-            try:
-                from task_manager import commands
-                limit = int(parse_qs(parsed.query).get('limit', ['3'])[0])
-                self._send_json(200, {"targets": commands.get_momentum_targets(limit=limit)})
-            except Exception as e:
-                self._send_json(500, {"error": str(e)})
+    @_route("POST", "/api/focus/queue")
+    def _post_focus_queue(self):
+        # S11-F: queue a task captured during an active focus session
+        data = self._read_body()
+        try:
+            from task_manager import commands as _cmds
+            n = _cmds.enqueue_focus_task(data)
+            self._send_json(200, {"queued": True, "queue_length": n})
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
 
-        elif path == "/api/focus-status":
-            # S11-F: focus lock status for the UI (active / task_id / ends_at / queued_count)
-            try:
-                from task_manager import commands as _cmds
-                self._send_json(200, _cmds.focus_status_payload())
-            except Exception:
-                self._send_json(200, {"active": False, "task_id": None, "ends_at": None, "queued_count": 0})
+    @_route("POST", "/api/recovery-activate")
+    def _post_recovery_activate(self):
+        data = self._read_body()
+        try:
+            from datetime import datetime as _dt
+            from task_manager import commands as _cmds
+            reason = data.get("trigger_reason") or "D"
+            state = storage.storage.load_recovery_state()
+            if not state.get("active"):
+                sel = _cmds.select_recovery_tasks()
+                state["active"] = True
+                state["triggered_at"] = _dt.now().isoformat()
+                state["trigger_reason"] = reason
+                state["session_tasks"] = [t.id for t in sel]
+                state["completed_in_recovery"] = []
+                state["dismissed_at"] = None
+                state["last_checked_date"] = _dt.now().strftime('%Y-%m-%d')
+                storage.storage.save_recovery_state(state)
+            self.send_response(200)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"success": True, "session_tasks": state.get("session_tasks", [])}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/focus/preflight":
-            # Honest answer for the Focus Setup modal: can strict blocking actually engage?
-            # (Editing the hosts file / killing apps needs Administrator on Windows.)
-            try:
-                from task_manager.system_detector import SystemDetector
-                self._send_json(200, {"is_admin": bool(SystemDetector.is_admin()),
-                                      "platform": SystemDetector.get_os()})
-            except Exception:
-                self._send_json(200, {"is_admin": False, "platform": "unknown"})
+    @_route("POST", "/api/recovery-exit")
+    def _post_recovery_exit(self):
+        try:
+            from datetime import datetime as _dt
+            state = storage.storage.load_recovery_state()
+            if state.get("active"):
+                _comp = state.get("completed_in_recovery", []) or []
+                storage.storage.append_recovery_log({
+                    "date": _dt.now().strftime('%Y-%m-%d'),
+                    "triggered_at": state.get("triggered_at"),
+                    "trigger_reason": state.get("trigger_reason"),
+                    "session_tasks": state.get("session_tasks", []),
+                    "tasks_completed": len(_comp),
+                    "was_successful": len(_comp) >= 1,
+                    "exited_at": _dt.now().isoformat()
+                })
+            _was = len(state.get("completed_in_recovery", []) or []) >= 1
+            state["active"] = False
+            state["dismissed_at"] = _dt.now().isoformat()
+            storage.storage.save_recovery_state(state)
+            self.send_response(200)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"success": True, "was_successful": _was}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/user-profile":
-            # Shared user_profile.json — read basics for OPERATOR M "About You" panel
-            import pathlib as _pl
-            _up = _pl.Path.home() / ".taskflow" / "user_profile.json"
-            try:
-                _data = json.loads(_up.read_text(encoding="utf-8")) if _up.exists() else {}
-            except Exception:
-                _data = {}
+    @_route("POST", "/api/reminder-dismiss/{task_id:int}")
+    def _post_reminder_dismiss(self, task_id):
+        try:
+            tasks = _repo.checkout()
+            for task in tasks:
+                if task.id == task_id:
+                    task.reminder_dismissed = True
+                    break
+            _repo.commit(tasks)
             self.send_response(200)
             self.end_headers_json()
-            self.wfile.write(json.dumps({"profile": _data}).encode("utf-8"))
+            self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-        elif path == "/api/blocklist":
-            try:
-                from task_manager.blockers.blocklist import blocklist_manager
-                saved = blocklist_manager.load_sites()
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"blocklist": saved}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
+    @_route("POST", "/api/tasks/create-full", lock="optimistic")
+    def _post_create_full(self):
+        # Create task with all Phase 1 fields (duration, deadline, deadline_type)
+        data = self._read_body()
+        try:
+            title = data.get("title", "").strip()
+            if not title:
+                self.send_response(400)
                 self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-            
-        elif path == "/api/path":
-            # S10-F: current day's Daily Execution Path (auto-generates if stale)
-            try:
-                self._send_json(200, self._path_payload(regenerate=False))
-            except Exception as e:
-                self._send_json(200, {
-                    "generated_date": None,
-                    "sections": {"prime": [], "secondary": [], "low_effort": [], "unscheduled": []},
-                    "section_minutes": {"prime": 0, "secondary": 0, "low_effort": 0, "unscheduled": 0},
-                    "total_minutes": 0, "adherence": None, "error": str(e),
-                    "overdue_candidates": [], "overdue_total": 0, "evening": False, "has_path": False
-                })
+                self.wfile.write(json.dumps({"error": "Title required"}).encode('utf-8'))
+                return
 
-        elif path.startswith("/static/"):
-            try:
-                import os
-                file_path = path[8:].lstrip('/\\')
-                static_dir = os.path.realpath(os.path.join(os.path.dirname(__file__), 'static'))
-                full_path = os.path.realpath(os.path.join(static_dir, file_path))
-                # SEC-05: containment — the resolved path must stay inside static_dir.
-                # realpath + commonpath defeats ../ traversal AND absolute/drive paths.
-                if os.path.commonpath([static_dir, full_path]) != static_dir:
-                    self.send_response(404)
-                    self.end_headers()
-                    return
+            import re
+
+            priority_raw = data.get("priority", "medium")
+            tags = data.get("tags", [])
+
+            # Extract priority (!h, !m, !l)
+            pri_match = re.search(r'!(h|m|l|hard|medium|low)\b', title, re.IGNORECASE)
+            if pri_match:
+                p_val = pri_match.group(1).lower()
+                if p_val in ['h', 'hard']: priority_raw = 'high'
+                elif p_val in ['l', 'low']: priority_raw = 'low'
+                elif p_val in ['m', 'medium']: priority_raw = 'medium'
+                title = re.sub(r'!(h|m|l|hard|medium|low)\b', '', title, flags=re.IGNORECASE).strip()
+
+            # Extract tags (#tag)
+            tag_matches = re.findall(r'#(\w+)', title)
+            if tag_matches:
+                tags.extend(tag_matches)
+                title = re.sub(r'#\w+', '', title).strip()
+
+            priority = normalize_priority(priority_raw)
+            from task_manager.commands import normalize_duration as _norm_dur
+            duration = _norm_dur(data.get("duration"))   # D1-01: sanitise web-supplied duration
+            deadline = data.get("deadline")
+            deadline_type = data.get("deadline_type")
+            mission_type = data.get("mission_type", "Task")
+            date = data.get("date")
+            start_time = data.get("start_time")
+            end_time = data.get("end_time")
+
+            # Setup default reminder for Events
+            reminder_time = None
+            if mission_type == "Event" and deadline:
+                from datetime import datetime, timedelta
+                try:
+                    dt = datetime.fromisoformat(deadline.replace('Z', '+00:00'))
+                    # Default offset is 60 minutes, handle None from JSON
+                    offset_minutes = data.get("reminder_offset", 60)
+                    if offset_minutes is None:
+                        offset_minutes = 60
+                    if offset_minutes >= 0:
+                        reminder_time = (dt - timedelta(minutes=offset_minutes)).isoformat()
+                except ValueError:
+                    pass
 
-                if os.path.exists(full_path) and os.path.isfile(full_path):
-                    self.send_response(200)
-                    if full_path.endswith('.js'):
-                        self.send_header('Content-Type', 'application/javascript')
-                    elif full_path.endswith('.css'):
-                        self.send_header('Content-Type', 'text/css')
-                    self.end_headers()
-                    with open(full_path, 'rb') as f:
-                        self.wfile.write(f.read())
+            tasks = _repo.checkout()
+            manager = models.TaskManager(tasks)
+
+            new_task = models.Task(
+                id=0,
+                title=title,
+                priority=priority,
+                tags=tags,
+                duration=duration,
+                deadline=deadline,
+                deadline_type=deadline_type,
+                mission_type=mission_type,
+                date=date,
+                start_time=start_time,
+                end_time=end_time,
+                reminder_time=reminder_time
+            )
+
+            # Enrichment on creation (E12/E13): description, links, checklist
+            from datetime import datetime as _dt
+            from task_manager.commands import detect_link_type
+            desc = data.get("description")
+            if desc:
+                new_task.description = desc
+                new_task.description_updated_at = _dt.now().isoformat()
+            norm_links = []
+            for ln in (data.get("links") or [])[:10]:
+                if isinstance(ln, str):
+                    url, title, ltype = ln.strip(), None, None
                 else:
-                    self.send_response(404)
-                    self.end_headers()
-            except Exception:
-                self.send_response(404)
-                self.end_headers()
-
-        else:
-            self.send_response(404)
-            self.end_headers()
-
-    def do_POST(self):
-        with _WRITE_LOCK:   # D7-03: serialise writes
-            self._handle_POST()
-
-    def _handle_POST(self):
-        parsed = urlparse(self.path)
-        path = parsed.path
-        if self._guard(mutating=True):   # SEC-02/07: block cross-site + foreign-Host writes
-            return
+                    url = (ln.get("url") or "").strip()
+                    title = ln.get("title") or None
+                    ltype = ln.get("type")
+                if not url:
+                    continue
+                norm_links.append({
+                    "id": f"lnk_{len(norm_links)+1:03d}",
+                    "type": ltype or detect_link_type(url),
+                    "url": url,
+                    "title": title,
+                    "added_at": _dt.now().isoformat()
+                })
+            new_task.links = norm_links
+            new_task.links_count = len(norm_links)
+            norm_chk = []
+            for it in (data.get("checklist") or [])[:20]:
+                if isinstance(it, str):
+                    text, done = it.strip(), False
+                else:
+                    text = (it.get("text") or "").strip()
+                    done = bool(it.get("done"))
+                if not text:
+                    continue
+                norm_chk.append({
+                    "id": f"chk_{len(norm_chk)+1:03d}",
+                    "text": text,
+                    "done": done,
+                    "done_at": _dt.now().isoformat() if done else None
+                })
+            new_task.checklist = norm_chk
+            new_task.checklist_total = len(norm_chk)
+            new_task.checklist_done = sum(1 for x in norm_chk if x.get("done"))
 
-        try:
-            content_length = int(self.headers.get('Content-Length', 0))
-        except (TypeError, ValueError):
-            content_length = 0
-        post_data = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else "{}"
-        
-        try:
-            data = json.loads(post_data)
-        except json.JSONDecodeError:
-            data = {}
+            manager.add_task(new_task)
+            _repo.commit(manager.tasks)
 
-        if path == "/api/tasks" and self.command == 'POST':
-            try:
-                title = data.get("title")
-                priority_raw = data.get("priority", "medium")
-                priority = normalize_priority(priority_raw)
-                tags = data.get("tags", [])
-                
-                if not title:
-                    self.send_response(400)
-                    self.end_headers_json()
-                    self.wfile.write(json.dumps({"error": "Title is required"}).encode('utf-8'))
-                    return
+            # Read after the commit: a concurrent add may have moved ours to another id
+            self.send_response(201)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"success": True, "id": new_task.id}).encode('utf-8'))
+        except Exception as e:
+            self.send_response(500)
+            self.end_headers_json()
+            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
 
-                tasks = storage.load_tasks()
-                manager = models.TaskManager(tasks)
-                
-                new_task = models.Task(
-                    id=0,
-                    title=title,
-                    priority=priority,
-                    tags=tags
-                )
-                
-                new_id = manager.add_task(new_task)
-                storage.save_tasks(manager.tasks)
-                
-                self.send_response(201)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"success": True, "id": new_id}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+    @_route("POST", "/api/tasks/{task_id:int}/links", lock="optimistic")
+    def _post_links(self, task_id):
+        # POST /api/tasks/<id>/links  (E13)
+        data = self._read_body()
+        from datetime import datetime as _dt
+        from task_manager.commands import detect_link_type
+        tasks = _repo.checkout()
+        task = self._find_task(tasks, task_id)
+        if not task:
+            self._send_json(404, {"error": "Task not found"})
             return
-
-        elif path == "/api/tasks/dump" and self.command == 'POST':
-            try:
-                title = data.get("title", "").strip()
-                if not title:
-                    self.send_response(400)
-                    self.end_headers_json()
-                    self.wfile.write(json.dumps({"error": "Empty title"}).encode('utf-8'))
-                    return
-                    
-                from task_manager import commands
-                task_dict = commands.dump_task(title)
-                if task_dict:
-                    self.send_response(201)
-                    self.end_headers_json()
-                    self.wfile.write(json.dumps({"success": True, "task": task_dict}).encode('utf-8'))
-                else:
-                    self.send_response(500)
-                    self.end_headers_json()
-                    self.wfile.write(json.dumps({"error": "Failed to dump task"}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+        url = (data.get("url") or "").strip()
+        if not url:
+            self._send_json(400, {"error": "Missing 'url'"})
             return
-
-        elif path == "/api/timeline" and self.command == 'POST':
-            try:
-                # Expect dict {"mapping": {"1": "2026-03-31_prime"}}
-                mapping = data.get("mapping", {})
-                storage.save_timeline(mapping)
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+        links = getattr(task, 'links', None) or []
+        if len(links) >= 10:
+            self._send_json(400, {"error": "Maximum 10 links reached"})
             return
-            
-        elif (path == "/api/focus_end" or path == "/api/focus/end") and self.command == 'POST':
-            from task_manager import commands
-            try:
-                commands.end_focus(force=True)        # graceful end (blocker cleanup, queue flush)
-            except Exception:
-                pass
-            # ALWAYS tear down blocking, even if the session was already cleared (expiry/poll race)
-            # so end_focus skipped it — this is what left the proxy/hosts stuck after a focus ended.
+        max_num = 0
+        for l in links:
             try:
-                commands.focus_manager.deactivate_blocking()
-            except Exception:
-                pass
-            # GUARANTEE the session is gone in memory AND on disk, regardless of what end_focus
-            # did — otherwise check_focus() reloads the old session and the overlay resurrects.
-            try:
-                commands.time_tracker.active_session = None
-                commands.time_tracker.start_time = None
-                commands.time_tracker._save_state({'active_session': None, 'start_time': None})
-            except Exception:
+                max_num = max(max_num, int(str(l.get('id', 'lnk_000')).replace('lnk_', '')))
+            except ValueError:
                 pass
-            self._send_json(200, {"success": True})
+        links.append({
+            "id": f"lnk_{max_num + 1:03d}",
+            "type": data.get("type") or detect_link_type(url),
+            "url": url,
+            "title": data.get("title") or None,
+            "added_at": _dt.now().isoformat()
+        })
+        task.links = links
+        self._sync_counters(task)
+        _repo.commit(tasks)
+        self._send_json(200, task.to_dict())
+
+    @_route("POST", "/api/tasks/{task_id:int}/checklist", lock="optimistic")
+    def _post_checklist(self, task_id):
+        # POST /api/tasks/<id>/checklist  (E13)
+        data = self._read_body()
+        tasks = _repo.checkout()
+        task = self._find_task(tasks, task_id)
+        if not task:
+            self._send_json(404, {"error": "Task not found"})
             return
-
-        elif path == "/api/focus/pause" and self.command == 'POST':
-            try:
-                from task_manager import commands
-                commands.time_tracker.pause_focus()
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+        text = (data.get("text") or "").strip()
+        if not text:
+            self._send_json(400, {"error": "Missing 'text'"})
             return
-
-        elif path == "/api/focus/resume" and self.command == 'POST':
-            try:
-                from task_manager import commands
-                commands.time_tracker.resume_focus()
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-            return
-
-        elif path == "/api/focus/extend" and self.command == 'POST':
-            # "Need more time" — re-arm the clock without re-blocking (blocking stays active).
-            from task_manager import commands
-            try:
-                mins = int(data.get("minutes", 10))
-            except (ValueError, TypeError):
-                mins = 10
-            ok = commands.extend_focus(mins)
-            self._send_json(200, {"success": bool(ok), "minutes": mins})
+        chk = getattr(task, 'checklist', None) or []
+        if len(chk) >= 20:
+            self._send_json(400, {"error": "Maximum 20 checklist items reached"})
             return
-
-        elif path == "/api/focus/complete" and self.command == 'POST':
+        max_num = 0
+        for c in chk:
             try:
-                from task_manager import commands
-                efficiency_score = data.get("efficiency_score", 0)
-                time_saved = data.get("time_saved", 0)
-                time_used = data.get("time_used", 0)
-                
-                # Update task in storage via unified complete_task (triggers Dopamine Engine)
-                status = commands.focus_manager.get_focus_status()
-                dopamine = {}
-                if status and status.get("focus_active"):
-                    task_id = status.get("task_id")
-                    if task_id:
-                        # Generate dopamine via unified engine (marks complete + tracks streak)
-                        result = commands.complete_task(task_id)
-                        if isinstance(result, dict):
-                            dopamine = result
-                        
-                        # Also track the focus time (this was handled before mark_complete)
-                        tasks = storage.load_tasks()
-                        for task in tasks:
-                            if task.id == task_id:
-                                task.add_focus_minutes(time_used)
-                                storage.save_tasks(tasks)
-                                break
-
-                # Sync focus state
-                try:
-                    commands.complete_focus(efficiency_score, time_saved, time_used)
-                except Exception as ex:
-                    try:
-                        commands.time_tracker.end_focus()
-                        commands.time_tracker._save_state({'active_session': None, 'start_time': None})
-                    except: pass
-                # ALWAYS release blocking on complete, regardless of session state (expiry race).
-                try:
-                    commands.focus_manager.deactivate_blocking()
-                except Exception:
-                    pass
-
-                self.send_response(200)
-                self.end_headers_json()
-                response = {"success": True}
-                response.update(dopamine)
-                self.wfile.write(json.dumps(response).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+                max_num = max(max_num, int(str(c.get('id', 'chk_000')).replace('chk_', '')))
+            except ValueError:
+                pass
+        chk.append({
+            "id": f"chk_{max_num + 1:03d}",
+            "text": text,
+            "done": False,
+            "done_at": None
+        })
+        task.checklist = chk
+        self._sync_counters(task)
+        _repo.commit(tasks)
+        self._send_json(200, task.to_dict())
+
+    def _checkout_task(self, task_id):
+        """(checked-out task list, the task) — or None after answering 404."""
+        tasks = _repo.checkout()
+        task = self._find_task(tasks, task_id)
+        if not task:
+            self._send_json(404, {"error": "Task not found"})
+            return None
+        return tasks, task
+
+    @_route("PATCH", "/api/tasks/{task_id:int}", lock="optimistic")
+    def _patch_task(self, task_id):
+        # PATCH /api/tasks/<id>  — general field edit (Edit System).
+        # Whitelist editable fields only; id / created_at / completed_at / postpone_count
+        # and all behavioral telemetry are intentionally NOT editable here.
+        from datetime import datetime as _dt
+        found = self._checkout_task(task_id)
+        if not found:
             return
-            
-
-        elif path.startswith("/api/tasks/") and path.endswith("/complete"):
-            try:
-                task_id = int(path.split("/")[3])
-                from task_manager import commands
-                dopamine = commands.complete_task(task_id)
-                
-                if dopamine is not False:
-                    self.send_response(200)
-                    self.end_headers_json()
-                    response_data = {"success": True}
-                    if isinstance(dopamine, dict):
-                        response_data.update(dopamine)
-                    self.wfile.write(json.dumps(response_data).encode('utf-8'))
-                else:
-                    self.send_response(404)
-                    self.end_headers_json()
-                    self.wfile.write(json.dumps({"error": "Task not found"}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-
-        elif path.startswith("/api/tasks/") and path.endswith("/delete"):
-            try:
-                task_id = int(path.split("/")[3])
-                tasks = storage.load_tasks()
-                manager = models.TaskManager(tasks)
-                if manager.delete_task(task_id):
-                    storage.save_tasks(manager.tasks)
-                    self.send_response(200)
-                    self.end_headers_json()
-                    self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
-                else:
-                    self.send_response(404)
-                    self.end_headers_json()
-                    self.wfile.write(json.dumps({"error": "Task not found"}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-
-        elif path.startswith("/api/tasks/") and path.endswith("/postpone"):
-            try:
-                task_id = int(path.split("/")[3])
-                increment = data.get("increment", "+1h")
-                tasks = storage.load_tasks()
-                task = None
-                for t in tasks:
-                    if t.id == task_id:
-                        task = t
-                        break
-                if not task:
-                    self.send_response(404)
-                    self.end_headers_json()
-                    self.wfile.write(json.dumps({"error": "Task not found"}).encode('utf-8'))
-                    return
-                from datetime import datetime, timedelta
-                now = datetime.now()
-                # Calculate new deadline based on increment
-                increment_map = {
-                    "+15m": timedelta(minutes=15),
-                    "+1h": timedelta(hours=1),
-                    "+3h": timedelta(hours=3),
-                    "tomorrow": None  # Special case
-                }
-                if increment == "tomorrow":
-                    tomorrow = now + timedelta(days=1)
-                    new_deadline = tomorrow.replace(hour=9, minute=0, second=0, microsecond=0)
-                elif increment in increment_map:
-                    base = datetime.fromisoformat(task.deadline) if task.deadline else now
-                    if base < now:
-                        base = now  # Don't postpone from an overdue date
-                    new_deadline = base + increment_map[increment]
-                else:
-                    try:
-                        # Attempt to parse as ISO string
-                        new_deadline = datetime.fromisoformat(increment.replace('Z', '+00:00'))
-                    except ValueError:
-                        new_deadline = now + timedelta(hours=1)
-                
-                reason = data.get("reason", "").strip()
-                history_entry = json.dumps({
-                    "date": now.isoformat(),
-                    "increment": increment,
-                    "reason": reason
-                })
-                
-                task.deadline = new_deadline.isoformat()
-                task.postpone_count += 1
-                task.postpone_history.append(history_entry)
-                storage.save_tasks(tasks)
-                
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({
-                    "success": True,
-                    "postpone_count": task.postpone_count,
-                    "new_deadline": task.deadline
-                }).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-
-        elif path.startswith("/api/tasks/") and path.endswith("/offload"):
-            try:
-                task_id = int(path.split("/")[3])
-                note = data.get("note", "Delegated")
-                tasks = storage.load_tasks()
-                task = None
-                for t in tasks:
-                    if t.id == task_id:
-                        task = t
-                        break
-                if not task:
-                    self.send_response(404)
-                    self.end_headers_json()
-                    self.wfile.write(json.dumps({"error": "Task not found"}).encode('utf-8'))
-                    return
-                from datetime import datetime
-                task.offloaded_at = datetime.now().isoformat()
-                task.offload_note = note
-                storage.save_tasks(tasks)
-                
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-
-        elif path == "/api/user-profile":
-            # POST: update basics fields in user_profile.json
-            import pathlib as _pl2
-            try:
-                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
-                _up2 = _pl2.Path.home() / ".taskflow" / "user_profile.json"
-                existing = {}
+        tasks, task = found
+        from task_manager.commands import normalize_duration as _norm_dur, parse_deadline as _parse_dl
+        body = self._read_body()
+        if 'title' in body:
+            nt = (body.get('title') or '').strip()
+            if nt:
+                task.title = nt[:500]
+        if body.get('priority') is not None:
+            task.priority = normalize_priority(str(body.get('priority')))
+        if 'tags' in body:
+            tags = body.get('tags') or []
+            if isinstance(tags, str):
+                tags = [s.strip() for s in tags.split(',') if s.strip()]
+            task.tags = [str(t).strip() for t in tags if str(t).strip()][:20]
+        if 'duration' in body:
+            nd = _norm_dur(body.get('duration'))
+            if nd:
+                task.duration = nd
+        if 'description' in body:
+            desc = body.get('description')
+            task.description = desc if desc else None
+            task.description_updated_at = _dt.now().isoformat()
+        if 'scheduled_date' in body:
+            sd = body.get('scheduled_date')
+            task.scheduled_date = sd if sd else None
+        deadline_touched = False
+        if 'deadline' in body:
+            raw = body.get('deadline')
+            if not raw:
+                task.deadline = None
+                task.reminder_time = None
+                task.reminder_time_2 = None
+            else:
+                parsed = None
                 try:
-                    if _up2.exists():
-                        existing = json.loads(_up2.read_text(encoding="utf-8"))
+                    parsed = _dt.fromisoformat(str(raw))
                 except Exception:
-                    pass
-                if not isinstance(existing, dict):
-                    existing = {}
-                basics = existing.get("basics") or {}
-                for field in ("name", "pronouns", "life_context", "peak_hours"):
-                    if field in body:
-                        basics[field] = str(body[field]).strip()
-                existing["basics"] = basics
-                from datetime import datetime as _dt2
-                existing["updated_at"] = _dt2.now().isoformat()
-                _tmp2 = _up2.with_suffix(".json.tmp")
-                _tmp2.write_text(json.dumps(existing, indent=2, ensure_ascii=False), encoding="utf-8")
-                _tmp2.replace(_up2)
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"ok": True}).encode("utf-8"))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode("utf-8"))
-
-        elif path == "/api/blocklist":
-            try:
-                from task_manager.blockers.blocklist import blocklist_manager
-                if "add" in data:
-                    blocklist_manager.add_sites([data["add"]])
-                elif "remove" in data:
-                    # remove_sites expects indices? Wait, the API takes indices: `def remove_sites(indices)`?
-                    # Let me check if blocklist_manager has a way to remove by name, or I'll just load and save.
-                    saved = blocklist_manager.load_sites()
-                    if data["remove"] in saved:
-                        saved.remove(data["remove"])
-                        # How does it save? It doesn't have save_sites?
-                        with open(blocklist_manager.blocklist_file, 'w') as f:
-                            json.dump({"websites": saved}, f, indent=4)
-                
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-
-        elif path == "/api/focus/start":
-            task_id_raw = data.get("task_id") or data.get("id")
-            try:
-                task_id = int(task_id_raw) if task_id_raw is not None else None
-            except (ValueError, TypeError):
-                task_id = None
-                
-            minutes = int(data.get("minutes", 25))
-            mode = data.get("mode", "gentle")
-            block_sites = data.get("block_sites") or None      # strict-mode site list from the UI
-            block_apps = data.get("block_apps") or None
-
-            def run_focus():
-                import sys, io
-                # Import locally: other do_POST branches do `from task_manager import commands`,
-                # which makes `commands` a function-local for ALL of do_POST — so the module-level
-                # `commands` is shadowed and unbound on this path. (This was the real focus bug:
-                # focus_task never ran, no session persisted, overlay died at the first poll.)
-                from task_manager import commands as _cmds
-                original = sys.stdout
-                try:
-                    sys.stdout = io.StringIO()   # keep focus_task's prints out of the server log
-                    # open_ui=False: we ARE the web server — never re-launch the dashboard here.
-                    _cmds.focus_task(task_id=task_id, minutes=minutes, mode=mode,
-                                     block_sites=block_sites, block_apps=block_apps,
-                                     force=True, open_ui=False)
-                except Exception as e:
-                    sys.stderr.write(f"[focus/start] {e}\n")
-                finally:
-                    sys.stdout = original        # always restore — never leave server stdout dead
-            threading.Thread(target=run_focus, daemon=True).start()
-            self.send_response(200)
-            self.end_headers_json()
-            self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
-
-        elif path == "/api/path/generate" and self.command == 'POST':
-            # S10-F: regenerate today's path on demand
-            try:
-                self._send_json(200, self._path_payload(regenerate=True))
-            except Exception as e:
-                self._send_json(500, {"error": str(e)})
-
-        elif path == "/api/focus/queue" and self.command == 'POST':
-            # S11-F: queue a task captured during an active focus session
-            try:
-                from task_manager import commands as _cmds
-                n = _cmds.enqueue_focus_task(data)
-                self._send_json(200, {"queued": True, "queue_length": n})
-            except Exception as e:
-                self._send_json(500, {"error": str(e)})
-
-        elif path == "/api/recovery-activate" and self.command == 'POST':
-            try:
-                from datetime import datetime as _dt
-                from task_manager import commands as _cmds
-                reason = data.get("trigger_reason") or "D"
-                state = storage.storage.load_recovery_state()
-                if not state.get("active"):
-                    sel = _cmds.select_recovery_tasks()
-                    state["active"] = True
-                    state["triggered_at"] = _dt.now().isoformat()
-                    state["trigger_reason"] = reason
-                    state["session_tasks"] = [t.id for t in sel]
-                    state["completed_in_recovery"] = []
-                    state["dismissed_at"] = None
-                    state["last_checked_date"] = _dt.now().strftime('%Y-%m-%d')
-                    storage.storage.save_recovery_state(state)
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"success": True, "session_tasks": state.get("session_tasks", [])}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-
-        elif path == "/api/recovery-exit" and self.command == 'POST':
-            try:
-                from datetime import datetime as _dt
-                state = storage.storage.load_recovery_state()
-                if state.get("active"):
-                    _comp = state.get("completed_in_recovery", []) or []
-                    storage.storage.append_recovery_log({
-                        "date": _dt.now().strftime('%Y-%m-%d'),
-                        "triggered_at": state.get("triggered_at"),
-                        "trigger_reason": state.get("trigger_reason"),
-                        "session_tasks": state.get("session_tasks", []),
-                        "tasks_completed": len(_comp),
-                        "was_successful": len(_comp) >= 1,
-                        "exited_at": _dt.now().isoformat()
-                    })
-                _was = len(state.get("completed_in_recovery", []) or []) >= 1
-                state["active"] = False
-                state["dismissed_at"] = _dt.now().isoformat()
-                storage.storage.save_recovery_state(state)
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"success": True, "was_successful": _was}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-
-        elif path.startswith("/api/reminder-dismiss/") and self.command == 'POST':
-            try:
-                task_id = int(path.split("/")[-1])
-                tasks = storage.load_tasks()
-                for task in tasks:
-                    if task.id == task_id:
-                        task.reminder_dismissed = True
-                        break
-                storage.save_tasks(tasks)
-                self.send_response(200)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-
-        elif path == "/api/tasks/create-full" and self.command == 'POST':
-            # Create task with all Phase 1 fields (duration, deadline, deadline_type)
+                    parsed = _parse_dl(str(raw))
+                if parsed:
+                    task.deadline = parsed.isoformat()
+                    deadline_touched = True
+        if 'deadline_type' in body and task.deadline:
+            task.deadline_type = 'hard' if body.get('deadline_type') == 'hard' else 'soft'
+        if not task.deadline:
+            task.deadline_type = None
+        # Append client-supplied edit_history entry (APPEND-ONLY).
+        entry = body.get('edit_history_entry')
+        if isinstance(entry, dict):
+            if getattr(task, 'edit_history', None) is None:
+                task.edit_history = []
+            nova_on = storage.storage.load_config().get('nova_data_enabled', True) is not False
+            rt = entry.get("reason_text")
+            task.edit_history.append({
+                "timestamp": entry.get("timestamp") or _dt.now().isoformat(),
+                "field": str(entry.get("field", "edit"))[:40],
+                "old_value": entry.get("old_value"),
+                "new_value": entry.get("new_value"),
+                "reason_code": entry.get("reason_code") if nova_on else None,
+                "reason_text": (str(rt)[:1000] if (rt and nova_on) else None),
+            })
+        if deadline_touched and task.deadline:
             try:
-                title = data.get("title", "").strip()
-                if not title:
-                    self.send_response(400)
-                    self.end_headers_json()
-                    self.wfile.write(json.dumps({"error": "Title required"}).encode('utf-8'))
-                    return
-
-                import re
-                
-                priority_raw = data.get("priority", "medium")
-                tags = data.get("tags", [])
-                
-                # Extract priority (!h, !m, !l)
-                pri_match = re.search(r'!(h|m|l|hard|medium|low)\b', title, re.IGNORECASE)
-                if pri_match:
-                    p_val = pri_match.group(1).lower()
-                    if p_val in ['h', 'hard']: priority_raw = 'high'
-                    elif p_val in ['l', 'low']: priority_raw = 'low'
-                    elif p_val in ['m', 'medium']: priority_raw = 'medium'
-                    title = re.sub(r'!(h|m|l|hard|medium|low)\b', '', title, flags=re.IGNORECASE).strip()
-                
-                # Extract tags (#tag)
-                tag_matches = re.findall(r'#(\w+)', title)
-                if tag_matches:
-                    tags.extend(tag_matches)
-                    title = re.sub(r'#\w+', '', title).strip()
-                    
-                priority = normalize_priority(priority_raw)
-                from task_manager.commands import normalize_duration as _norm_dur
-                duration = _norm_dur(data.get("duration"))   # D1-01: sanitise web-supplied duration
-                deadline = data.get("deadline")
-                deadline_type = data.get("deadline_type")
-                mission_type = data.get("mission_type", "Task")
-                date = data.get("date")
-                start_time = data.get("start_time")
-                end_time = data.get("end_time")
-
-                # Setup default reminder for Events
-                reminder_time = None
-                if mission_type == "Event" and deadline:
-                    from datetime import datetime, timedelta
-                    try:
-                        dt = datetime.fromisoformat(deadline.replace('Z', '+00:00'))
-                        # Default offset is 60 minutes, handle None from JSON
-                        offset_minutes = data.get("reminder_offset", 60)
-                        if offset_minutes is None:
-                            offset_minutes = 60
-                        if offset_minutes >= 0:
-                            reminder_time = (dt - timedelta(minutes=offset_minutes)).isoformat()
-                    except ValueError:
-                        pass
-
-                tasks = storage.load_tasks()
-                manager = models.TaskManager(tasks)
-
-                new_task = models.Task(
-                    id=0,
-                    title=title,
-                    priority=priority,
-                    tags=tags,
-                    duration=duration,
-                    deadline=deadline,
-                    deadline_type=deadline_type,
-                    mission_type=mission_type,
-                    date=date,
-                    start_time=start_time,
-                    end_time=end_time,
-                    reminder_time=reminder_time
-                )
-
-                # Enrichment on creation (E12/E13): description, links, checklist
-                from datetime import datetime as _dt
-                from task_manager.commands import detect_link_type
-                desc = data.get("description")
-                if desc:
-                    new_task.description = desc
-                    new_task.description_updated_at = _dt.now().isoformat()
-                norm_links = []
-                for ln in (data.get("links") or [])[:10]:
-                    if isinstance(ln, str):
-                        url, title, ltype = ln.strip(), None, None
-                    else:
-                        url = (ln.get("url") or "").strip()
-                        title = ln.get("title") or None
-                        ltype = ln.get("type")
-                    if not url:
-                        continue
-                    norm_links.append({
-                        "id": f"lnk_{len(norm_links)+1:03d}",
-                        "type": ltype or detect_link_type(url),
-                        "url": url,
-                        "title": title,
-                        "added_at": _dt.now().isoformat()
-                    })
-                new_task.links = norm_links
-                new_task.links_count = len(norm_links)
-                norm_chk = []
-                for it in (data.get("checklist") or [])[:20]:
-                    if isinstance(it, str):
-                        text, done = it.strip(), False
-                    else:
-                        text = (it.get("text") or "").strip()
-                        done = bool(it.get("done"))
-                    if not text:
-                        continue
-                    norm_chk.append({
-                        "id": f"chk_{len(norm_chk)+1:03d}",
-                        "text": text,
-                        "done": done,
-                        "done_at": _dt.now().isoformat() if done else None
-                    })
-                new_task.checklist = norm_chk
-                new_task.checklist_total = len(norm_chk)
-                new_task.checklist_done = sum(1 for x in norm_chk if x.get("done"))
-
-                new_id = manager.add_task(new_task)
-                storage.save_tasks(manager.tasks)
-
-                self.send_response(201)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"success": True, "id": new_id}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.end_headers_json()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+                commands.calculate_reminder_time(task)
+            except Exception:
+                pass
+        self._sync_counters(task)
+        _repo.commit(tasks)
+        self._send_json(200, {**task.to_dict(), **_computed_task_fields(task)})
 
-        elif path.startswith("/api/tasks/") and path.endswith("/links") and self.command == 'POST':
-            # POST /api/tasks/<id>/links  (E13)
-            from datetime import datetime as _dt
-            from task_manager.commands import detect_link_type
-            parts = [p for p in path.split('/') if p]
-            try:
-                task_id = int(parts[2])
-            except (ValueError, IndexError):
-                self._send_json(400, {"error": "Invalid task id"})
-                return
-            tasks = storage.load_tasks()
-            task = self._find_task(tasks, task_id)
-            if not task:
-                self._send_json(404, {"error": "Task not found"})
-                return
-            url = (data.get("url") or "").strip()
-            if not url:
-                self._send_json(400, {"error": "Missing 'url'"})
-                return
-            links = getattr(task, 'links', None) or []
-            if len(links) >= 10:
-                self._send_json(400, {"error": "Maximum 10 links reached"})
-                return
-            max_num = 0
-            for l in links:
-                try:
-                    max_num = max(max_num, int(str(l.get('id', 'lnk_000')).replace('lnk_', '')))
-                except ValueError:
-                    pass
-            links.append({
-                "id": f"lnk_{max_num + 1:03d}",
-                "type": data.get("type") or detect_link_type(url),
-                "url": url,
-                "title": data.get("title") or None,
-                "added_at": _dt.now().isoformat()
-            })
-            task.links = links
-            self._sync_counters(task)
-            storage.save_tasks(tasks)
-            self._send_json(200, task.to_dict())
+    @_route("PATCH", "/api/tasks/{task_id:int}/description", lock="optimistic")
+    def _patch_description(self, task_id):
+        from datetime import datetime as _dt
+        found = self._checkout_task(task_id)
+        if not found:
             return
-
-        elif path.startswith("/api/tasks/") and path.endswith("/checklist") and self.command == 'POST':
-            # POST /api/tasks/<id>/checklist  (E13)
-            parts = [p for p in path.split('/') if p]
-            try:
-                task_id = int(parts[2])
-            except (ValueError, IndexError):
-                self._send_json(400, {"error": "Invalid task id"})
-                return
-            tasks = storage.load_tasks()
-            task = self._find_task(tasks, task_id)
-            if not task:
-                self._send_json(404, {"error": "Task not found"})
-                return
-            text = (data.get("text") or "").strip()
-            if not text:
-                self._send_json(400, {"error": "Missing 'text'"})
-                return
-            chk = getattr(task, 'checklist', None) or []
-            if len(chk) >= 20:
-                self._send_json(400, {"error": "Maximum 20 checklist items reached"})
-                return
-            max_num = 0
-            for c in chk:
-                try:
-                    max_num = max(max_num, int(str(c.get('id', 'chk_000')).replace('chk_', '')))
-                except ValueError:
-                    pass
-            chk.append({
-                "id": f"chk_{max_num + 1:03d}",
-                "text": text,
-                "done": False,
-                "done_at": None
-            })
-            task.checklist = chk
-            self._sync_counters(task)
-            storage.save_tasks(tasks)
-            self._send_json(200, task.to_dict())
+        tasks, task = found
+        body = self._read_body()
+        if 'description' not in body:
+            self._send_json(400, {"error": "Missing 'description'"})
             return
-
+        desc = body.get('description')
+        task.description = desc if desc else None
+        task.description_updated_at = _dt.now().isoformat()
+        self._sync_counters(task)
+        _repo.commit(tasks)
+        self._send_json(200, task.to_dict())
+
+    @_route("PATCH", "/api/tasks/{task_id:int}/checklist/{chk_id}/toggle", lock="optimistic")
+    def _patch_checklist_toggle(self, task_id, chk_id):
+        from datetime import datetime as _dt
+        found = self._checkout_task(task_id)
+        if not found:
+            return
+        tasks, task = found
+        item = next((c for c in (getattr(task, 'checklist', None) or []) if c.get('id') == chk_id), None)
+        if not item:
+            self._send_json(404, {"error": "Checklist item not found"})
+            return
+        if item.get('done'):
+            item['done'] = False
+            item['done_at'] = None
         else:
-            self.send_response(404)
-            self.end_headers()
-
-    def do_PATCH(self):
-        with _WRITE_LOCK:   # D7-03: serialise writes
-            self._handle_PATCH()
-
-    def _handle_PATCH(self):
-        parsed = urlparse(self.path)
-        if self._guard(mutating=True):   # SEC-02/07
+            item['done'] = True
+            item['done_at'] = _dt.now().isoformat()
+        self._sync_counters(task)
+        _repo.commit(tasks)
+        self._send_json(200, task.to_dict())
+
+    @_route("DELETE", "/api/tasks/{task_id:int}/links/{link_id}", lock="optimistic")
+    def _delete_link(self, task_id, link_id):
+        # IDs are permanent; no re-index (Rule #3)
+        found = self._checkout_task(task_id)
+        if not found:
             return
-        parts = [p for p in parsed.path.split('/') if p]
-        if len(parts) >= 3 and parts[0] == 'api' and parts[1] == 'tasks':
-            from datetime import datetime as _dt
-            try:
-                task_id = int(parts[2])
-            except ValueError:
-                self._send_json(400, {"error": "Invalid task id"})
-                return
-            tasks = storage.load_tasks()
-            task = self._find_task(tasks, task_id)
-            if not task:
-                self._send_json(404, {"error": "Task not found"})
-                return
-
-            # PATCH /api/tasks/<id>  — general field edit (Edit System).
-            # Whitelist editable fields only; id / created_at / completed_at / postpone_count
-            # and all behavioral telemetry are intentionally NOT editable here.
-            if len(parts) == 3:
-                from task_manager.commands import normalize_duration as _norm_dur, parse_deadline as _parse_dl
-                body = self._read_body()
-                if 'title' in body:
-                    nt = (body.get('title') or '').strip()
-                    if nt:
-                        task.title = nt[:500]
-                if body.get('priority') is not None:
-                    task.priority = normalize_priority(str(body.get('priority')))
-                if 'tags' in body:
-                    tags = body.get('tags') or []
-                    if isinstance(tags, str):
-                        tags = [s.strip() for s in tags.split(',') if s.strip()]
-                    task.tags = [str(t).strip() for t in tags if str(t).strip()][:20]
-                if 'duration' in body:
-                    nd = _norm_dur(body.get('duration'))
-                    if nd:
-                        task.duration = nd
-                if 'description' in body:
-                    desc = body.get('description')
-                    task.description = desc if desc else None
-                    task.description_updated_at = _dt.now().isoformat()
-                if 'scheduled_date' in body:
-                    sd = body.get('scheduled_date')
-                    task.scheduled_date = sd if sd else None
-                deadline_touched = False
-                if 'deadline' in body:
-                    raw = body.get('deadline')
-                    if not raw:
-                        task.deadline = None
-                        task.reminder_time = None
-                        task.reminder_time_2 = None
-                    else:
-                        parsed = None
-                        try:
-                            parsed = _dt.fromisoformat(str(raw))
-                        except Exception:
-                            parsed = _parse_dl(str(raw))
-                        if parsed:
-                            task.deadline = parsed.isoformat()
-                            deadline_touched = True
-                if 'deadline_type' in body and task.deadline:
-                    task.deadline_type = 'hard' if body.get('deadline_type') == 'hard' else 'soft'
-                if not task.deadline:
-                    task.deadline_type = None
-                # Append client-supplied edit_history entry (APPEND-ONLY).
-                entry = body.get('edit_history_entry')
-                if isinstance(entry, dict):
-                    if getattr(task, 'edit_history', None) is None:
-                        task.edit_history = []
-                    nova_on = storage.storage.load_config().get('nova_data_enabled', True) is not False
-                    rt = entry.get("reason_text")
-                    task.edit_history.append({
-                        "timestamp": entry.get("timestamp") or _dt.now().isoformat(),
-                        "field": str(entry.get("field", "edit"))[:40],
-                        "old_value": entry.get("old_value"),
-                        "new_value": entry.get("new_value"),
-                        "reason_code": entry.get("reason_code") if nova_on else None,
-                        "reason_text": (str(rt)[:1000] if (rt and nova_on) else None),
-                    })
-                if deadline_touched and task.deadline:
-                    try:
-                        commands.calculate_reminder_time(task)
-                    except Exception:
-                        pass
-                self._sync_counters(task)
-                storage.save_tasks(tasks)
-                self._send_json(200, {**task.to_dict(), **_computed_task_fields(task)})
-                return
-
-            # PATCH /api/tasks/<id>/description
-            if len(parts) == 4 and parts[3] == 'description':
-                body = self._read_body()
-                if 'description' not in body:
-                    self._send_json(400, {"error": "Missing 'description'"})
-                    return
-                desc = body.get('description')
-                task.description = desc if desc else None
-                task.description_updated_at = _dt.now().isoformat()
-                self._sync_counters(task)
-                storage.save_tasks(tasks)
-                self._send_json(200, task.to_dict())
-                return
-
-            # PATCH /api/tasks/<id>/checklist/<chk_id>/toggle
-            if len(parts) == 6 and parts[3] == 'checklist' and parts[5] == 'toggle':
-                chk_id = parts[4]
-                item = next((c for c in (getattr(task, 'checklist', None) or []) if c.get('id') == chk_id), None)
-                if not item:
-                    self._send_json(404, {"error": "Checklist item not found"})
-                    return
-                if item.get('done'):
-                    item['done'] = False
-                    item['done_at'] = None
-                else:
-                    item['done'] = True
-                    item['done_at'] = _dt.now().isoformat()
-                self._sync_counters(task)
-                storage.save_tasks(tasks)
-                self._send_json(200, task.to_dict())
-                return
-
-        self._send_json(404, {"error": "Not found"})
-
-    def do_DELETE(self):
-        with _WRITE_LOCK:   # D7-03: serialise writes
-            self._handle_DELETE()
-
-    def _handle_DELETE(self):
-        parsed = urlparse(self.path)
-        if self._guard(mutating=True):   # SEC-02/07
+        tasks, task = found
+        links = getattr(task, 'links', None) or []
+        new_links = [l for l in links if l.get('id') != link_id]
+        if len(new_links) == len(links):
+            self._send_json(404, {"error": "Link not found"})
             return
-        parts = [p for p in parsed.path.split('/') if p]
-        if len(parts) == 5 and parts[0] == 'api' and parts[1] == 'tasks':
-            try:
-                task_id = int(parts[2])
-            except ValueError:
-                self._send_json(400, {"error": "Invalid task id"})
-                return
-            tasks = storage.load_tasks()
-            task = self._find_task(tasks, task_id)
-            if not task:
-                self._send_json(404, {"error": "Task not found"})
-                return
-
-            # DELETE /api/tasks/<id>/links/<link_id>  (IDs are permanent; no re-index, Rule #3)
-            if parts[3] == 'links':
-                link_id = parts[4]
-                links = getattr(task, 'links', None) or []
-                new_links = [l for l in links if l.get('id') != link_id]
-                if len(new_links) == len(links):
-                    self._send_json(404, {"error": "Link not found"})
-                    return
-                task.links = new_links
-                self._sync_counters(task)
-                storage.save_tasks(tasks)
-                self._send_json(200, task.to_dict())
-                return
-
-            # DELETE /api/tasks/<id>/checklist/<chk_id>
-            if parts[3] == 'checklist':
-                chk_id = parts[4]
-                chk = getattr(task, 'checklist', None) or []
-                new_chk = [c for c in chk if c.get('id') != chk_id]
-                if len(new_chk) == len(chk):
-                    self._send_json(404, {"error": "Checklist item not found"})
-                    return
-                task.checklist = new_chk
-                self._sync_counters(task)
-                storage.save_tasks(tasks)
-                self._send_json(200, task.to_dict())
-                return
-
-        self._send_json(404, {"error": "Not found"})
+        task.links = new_links
+        self._sync_counters(task)
+        _repo.commit(tasks)
+        self._send_json(200, task.to_dict())
+
+    @_route("DELETE", "/api/tasks/{task_id:int}/checklist/{chk_id}", lock="optimistic")
+    def _delete_checklist_item(self, task_id, chk_id):
+        found = self._checkout_task(task_id)
+        if not found:
+            return
+        tasks, task = found
+        chk = getattr(task, 'checklist', None) or []
+        new_chk = [c for c in chk if c.get('id') != chk_id]
+        if len(new_chk) == len(chk):
+            self._send_json(404, {"error": "Checklist item not found"})
+            return
+        task.checklist = new_chk
+        self._sync_counters(task)
+        _repo.commit(tasks)
+        self._send_json(200, task.to_dict())
 
     def log_message(self, format, *args):
         # Suppress logging to keep CLI clean
         pass
 
 
-def start_server(port=18082):
+def start_server(port=18082, mode=None):
+    """Start the dashboard server in the background. mode "async" (or TASKFLOW_SERVER=async)
+    selects the asyncio server (HTTP/1.1 keep-alive, bounded workers); default is threaded."""
+    if (mode or os.environ.get("TASKFLOW_SERVER") or "thread") == "async":
+        from task_manager.async_server import start_async_server
+        return start_async_server(port)
     server = ThreadingHTTPServer(('127.0.0.1', port), TaskFlowHandler)
     def run_server():
         try:
@@ -1451,7 +1877,6 @@ def start_server(port=18082):
     return server
 
 if __name__ == "__main__":
-    import time
     import sys
     
     port = 18083
@@ -1470,8 +1895,9 @@ if __name__ == "__main__":
             clear_stale_taskflow_hosts()
     except Exception:
         pass
+    mode = "async" if "--async" in sys.argv else None
     print(f"\nStarting TaskFlow Web UI Server on port {port}...")
-    srv = start_server(port)
+    srv = start_server(port, mode)
     
     print(f"   Dashboard: http://127.0.0.1:{port}")
     print("   Press Ctrl+C to stop.\n")
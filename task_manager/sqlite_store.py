@@ -0,0 +1,189 @@
+"""
+TaskFlow SQLite Store
+---------------------
+Optional row-per-task backend for TaskStorage (stdlib sqlite3, WAL mode).
+
+The JSON file rewrites every task on every save; here a single-task edit is a
+single-row upsert, so `taskflow done` on a 20k-task board stays fast.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from task_manager.models import HEADER_FIELDS
+
+try:
+    import sqlite3
+except ImportError:  # some minimal Python builds ship without _sqlite3
+    sqlite3 = None
+
+
+def sqlite_available() -> bool:
+    return sqlite3 is not None
+
+
+def _encode(task_dict: dict) -> str:
+    return json.dumps(task_dict, separators=(',', ':'), ensure_ascii=False)
+
+
+def _encode_head(task_dict: dict) -> str:
+    return _encode({name: task_dict[name] for name in HEADER_FIELDS if name in task_dict})
+
+
+def _row(task_dict: dict) -> tuple:
+    return task_dict["id"], _encode(task_dict), _encode_head(task_dict)
+
+
+class SQLiteTaskStore:
+    """
+    One table, one row per task: (id, data, head).
+    
+    data is the task's to_dict() JSON; head repeats just the header fields
+    (models.HEADER_FIELDS) so load_heads() never reads the heavy ones.
+    """
+
+    SCHEMA_VERSION = 2
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self._conn = None
+        # ThreadingHTTPServer shares this store across request threads.
+        self._lock = threading.RLock()
+
+    def connect(self):
+        """Open (and on first use create) the database. Raises sqlite3.Error on failure."""
+        if sqlite3 is None:
+            raise RuntimeError("sqlite3 module is not available in this Python build")
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS tasks (id INTEGER PRIMARY KEY, data TEXT NOT NULL, head TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                         (str(self.SCHEMA_VERSION),))
+            conn.commit()
+            self._migrate(conn)
+            self._conn = conn
+        return self._conn
+
+    def _migrate(self, conn):
+        """Bring a database written by an older TaskFlow up to SCHEMA_VERSION."""
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        version = int(row[0]) if row and str(row[0]).isdigit() else 1
+        if version >= self.SCHEMA_VERSION:
+            return
+        with conn:
+            columns = {r[1] for r in conn.execute("PRAGMA table_info(tasks)")}
+            if "head" not in columns:
+                # v1 -> v2: split out the header fields for load_heads()
+                conn.execute("ALTER TABLE tasks ADD COLUMN head TEXT")
+            rows = conn.execute("SELECT id, data FROM tasks WHERE head IS NULL").fetchall()
+            conn.executemany("UPDATE tasks SET head = ? WHERE id = ?",
+                             [(_encode_head(json.loads(data)), task_id) for task_id, data in rows])
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                         (str(self.SCHEMA_VERSION),))
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- meta ---
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self.connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self._lock:
+            conn = self.connect()
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+            conn.commit()
+
+    # --- rows ---
+    def load_all(self) -> List[dict]:
+        """Return every task dict in id order."""
+        with self._lock:
+            rows = self.connect().execute("SELECT data FROM tasks ORDER BY id").fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def iter_all(self) -> Iterator[dict]:
+        """Yield task dicts in id order, fetching rows in batches rather than all at once."""
+        last_id = None
+        while True:
+            with self._lock:
+                if last_id is None:
+                    rows = self.connect().execute(
+                        "SELECT id, data FROM tasks ORDER BY id LIMIT 500").fetchall()
+                else:
+                    rows = self.connect().execute(
+                        "SELECT id, data FROM tasks WHERE id > ? ORDER BY id LIMIT 500", (last_id,)).fetchall()
+            if not rows:
+                return
+            for r in rows:
+                yield json.loads(r[1])
+            last_id = rows[-1][0]
+
+    def load_heads(self) -> List[dict]:
+        """Return every task's header fields in id order (full data where head is missing)."""
+        with self._lock:
+            rows = self.connect().execute("SELECT COALESCE(head, data) FROM tasks ORDER BY id").fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def get(self, task_id: int) -> Optional[dict]:
+        with self._lock:
+            row = self.connect().execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(self) -> int:
+        with self._lock:
+            return self.connect().execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def upsert(self, task_dict: dict):
+        with self._lock:
+            conn = self.connect()
+            conn.execute("INSERT OR REPLACE INTO tasks (id, data, head) VALUES (?, ?, ?)",
+                         _row(task_dict))
+            conn.commit()
+
+    def delete(self, task_id: int) -> bool:
+        with self._lock:
+            conn = self.connect()
+            cur = conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            conn.commit()
+        return cur.rowcount > 0
+
+    def apply_changes(self, upserts: List[dict], deleted_ids: Iterable[int]):
+        """Upsert changed rows and delete removed ones in a single transaction."""
+        with self._lock:
+            conn = self.connect()
+            with conn:
+                if upserts:
+                    conn.executemany("INSERT OR REPLACE INTO tasks (id, data, head) VALUES (?, ?, ?)",
+                                     [_row(d) for d in upserts])
+                if deleted_ids:
+                    conn.executemany("DELETE FROM tasks WHERE id = ?", [(i,) for i in deleted_ids])
+
+    def replace_all(self, task_dicts: Iterable[dict]):
+        """Make the table match `task_dicts` exactly, in one transaction.
+
+        Unchanged rows are left untouched (the UPDATE's WHERE skips identical data), so a
+        full-list save still only dirties the pages of tasks that actually changed.
+        """
+        payload = [_row(d) for d in task_dicts]
+        with self._lock:
+            conn = self.connect()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO tasks (id, data, head) VALUES (?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET data = excluded.data, head = excluded.head "
+                    "WHERE tasks.data != excluded.data OR tasks.head IS NULL",
+                    payload)
+                keep = {p[0] for p in payload}
+                stale = [r[0] for r in conn.execute("SELECT id FROM tasks") if r[0] not in keep]
+                if stale:
+                    conn.executemany("DELETE FROM tasks WHERE id = ?", [(i,) for i in stale])
@@ -0,0 +1,298 @@
+"""
+TaskFlow Startup Pipeline
+-------------------------
+The hooks `taskflow` runs before every command, in one pass over one snapshot.
+
+The hooks used to load storage independently, one after another. Here they share a
+Snapshot, which loads the task list and the config at most once and only if a hook
+that actually runs needs them.
+
+A hook with a fingerprint can be skipped. Its key is made of cheap inputs (file
+signatures, today's date) that are read without parsing anything. After a quiet run
+the hook also records `until`, the moment its answer can change on its own (the
+next reminder, the next deadline today, midnight). The next invocation skips the
+hook while the key is unchanged and `until` hasn't passed. So `taskflow ids` with
+nothing due never loads the task list for the hooks. Fingerprints live in config
+under "startup_fingerprints" and are written once, at the end of the pipeline.
+
+`taskflow <command> --profile-startup` prints what each hook cost (stderr).
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+BOOT = "boot"        # before argument parsing, on every invocation
+COMMAND = "command"  # after parsing (may redirect the command or capture it for focus)
+REVIEW = "review"    # just before the command runs
+
+_READ_VIEWS = ('list', 'status', 'today')
+_FOREVER = "9999-12-31T00:00:00"
+
+
+class Snapshot:
+    """Inputs shared by the startup hooks, each loaded at most once."""
+
+    def __init__(self, store):
+        self.store = store
+        self.command = None
+        self.focus_lock = None
+        self._tasks = None
+        self._config = None
+
+    @property
+    def tasks(self) -> list:
+        if self._tasks is None:
+            self._tasks = self.store.load_tasks()
+        return self._tasks
+
+    @property
+    def task_headers(self) -> list:
+        """The loaded tasks if a hook already needed them, else slim headers (read-only use)."""
+        if self._tasks is not None:
+            return self._tasks
+        return self.store.load_task_headers()
+
+    @property
+    def config(self) -> dict:
+        if self._config is None:
+            self._config = self.store.load_config()
+        return self._config
+
+    def signature(self, *paths) -> list:
+        """JSON-friendly (mtime_ns, size) per path — changes whenever a file is rewritten."""
+        return [list(s) if s else None for s in self.store._cache.signature(paths)]
+
+    def task_signature(self) -> list:
+        return self.signature(*self.store._task_paths())
+
+
+class Hook:
+    """One startup step: run(snapshot) -> True when its outcome may be reused.
+
+    key(snapshot) and until(snapshot) make it skippable (see module doc); a hook
+    without them always runs. `commands` limits it to those commands.
+    """
+
+    __slots__ = ("name", "phase", "run", "key", "until", "commands")
+
+    def __init__(self, name: str, phase: str, run: Callable, key: Optional[Callable] = None,
+                 until: Optional[Callable] = None, commands: Optional[tuple] = None):
+        self.name = name
+        self.phase = phase
+        self.run = run
+        self.key = key
+        self.until = until
+        self.commands = commands
+
+
+def _tomorrow(now: datetime) -> datetime:
+    return now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+
+def _naive(value) -> Optional[datetime]:
+    try:
+        dt = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return dt.replace(tzinfo=None) if dt.tzinfo is not None else dt
+
+
+# --- boot hooks ---
+def _path_warning(snap) -> bool:
+    # S0-B: Path detection
+    config = snap.config
+    if config.get("path_warning_shown"):
+        return True
+    scripts_dir = os.path.dirname(sys.executable)
+    if not scripts_dir.endswith("Scripts"):
+        scripts_dir = os.path.join(scripts_dir, "Scripts")
+    if scripts_dir.lower() not in os.environ.get("PATH", "").lower():
+        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print("taskflow is installed but not in PATH.")
+        print("Run this once to fix it permanently:\n")
+        print("Windows CMD:")
+        print(f"setx PATH \"%PATH%;{scripts_dir}\"\n")
+        print("Then restart your terminal and run: taskflow")
+        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        config["path_warning_shown"] = True
+        snap.store.save_config(config)
+    return True
+
+
+_HOSTS_PATH = r"C:\Windows\System32\drivers\etc\hosts"
+
+
+def _orphan_blocks(snap) -> bool:
+    # If on Windows and admin, check for orphaned blocks IF no active session
+    from task_manager.system_detector import SystemDetector
+    if SystemDetector.get_os() != "windows":
+        return True
+    if not SystemDetector.is_admin():
+        return False   # the next run may be elevated
+    from task_manager.blockers.windows import WindowsBlocker
+    from task_manager.commands import time_tracker
+    if time_tracker.active_session:
+        return False
+    checker = WindowsBlocker()
+    # This will silently clean up if there are orphaned blocks
+    with open(checker.hosts_path, 'r') as f:
+        if "# TaskFlow Focus Mode" in f.read():
+            print("🔍 Checking for orphaned focus blocks...")
+            checker.unblock_websites()
+    return True
+
+
+# --- command hooks ---
+def _reminders(snap) -> bool:
+    # S7-D: reminders fire at the start of EVERY command (silent if none due)
+    from task_manager.commands import check_reminders
+    check_reminders(snap.tasks)
+    return True
+
+
+def _next_reminder(snap) -> str:
+    due = []
+    for t in snap.tasks:
+        if t.completed or t.dropped_at or t.offloaded_at:
+            continue
+        if t.reminder_time and not t.reminder_fired:
+            due.append(_naive(t.reminder_time))
+        if t.reminder_time_2 and not t.reminder_fired_2:
+            due.append(_naive(t.reminder_time_2))
+    due = [d for d in due if d is not None]
+    return min(due).isoformat() if due else _FOREVER
+
+
+def _recovery(snap) -> bool:
+    # S9-D: recovery check intercepts the read views only
+    from task_manager.commands import check_recovery_mode
+    if check_recovery_mode(snap.task_headers):
+        snap.command = 'recover'
+        return False
+    return True
+
+
+def _next_deadline_today(snap) -> str:
+    # Until a pending task's deadline passes today, the answer can't change by itself
+    from task_manager.commands import _recovery_pending, _task_deadline_dt
+    now = datetime.now()
+    ahead = [dt for dt in (_task_deadline_dt(t) for t in snap.task_headers if _recovery_pending(t))
+             if dt and now < dt < _tomorrow(now)]
+    return (min(ahead) if ahead else _tomorrow(now)).isoformat()
+
+
+def _focus_lock(snap) -> bool:
+    # S11-B: Focus Window Lock — derive active state, lazily flush an ended session's queue
+    from task_manager.commands import focus_lock_active
+    try:
+        snap.focus_lock = focus_lock_active()
+    except Exception:
+        snap.focus_lock = None
+    return True
+
+
+def _daily_summaries(snap) -> bool:
+    # S12: keep daily summaries + streak fresh (guarded to once per new day)
+    from task_manager.commands import ensure_daily_summaries
+    ensure_daily_summaries()
+    return True
+
+
+def _weekly_review(snap) -> bool:
+    # S12-E: Monday-morning weekly review (once per week, before normal output)
+    from task_manager.commands import maybe_weekly_review
+    maybe_weekly_review()
+    return True
+
+
+def _momentum(snap) -> bool:
+    # Brainstorm #3: momentum re-entry nudge on the review commands (shown every time)
+    from task_manager.commands import check_momentum_warning
+    return not check_momentum_warning(snap.task_headers)
+
+
+def _today(snap):
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def _end_of_day(snap):
+    return _tomorrow(datetime.now()).isoformat()
+
+
+HOOKS: List[Hook] = [
+    Hook("path_warning", BOOT, _path_warning),
+    Hook("orphan_blocks", BOOT, _orphan_blocks,
+         key=lambda s: [sys.platform, s.signature(_HOSTS_PATH)], until=lambda s: _FOREVER),
+    Hook("reminders", COMMAND, _reminders,
+         key=lambda s: s.task_signature(), until=_next_reminder),
+    Hook("recovery", COMMAND, _recovery,
+         key=lambda s: [s.task_signature(), s.signature(s.store.recovery_state_file), _today(s)],
+         until=_next_deadline_today, commands=_READ_VIEWS),
+    Hook("focus_lock", COMMAND, _focus_lock),
+    Hook("daily_summaries", REVIEW, _daily_summaries, key=_today, until=_end_of_day),
+    Hook("weekly_review", REVIEW, _weekly_review),
+    Hook("momentum", REVIEW, _momentum,
+         key=lambda s: [s.task_signature(), _today(s)], until=_end_of_day, commands=_READ_VIEWS),
+]
+
+
+class StartupPipeline:
+    """Runs HOOKS phase by phase against one Snapshot, skipping unchanged ones."""
+
+    def __init__(self, store, hooks: Optional[List[Hook]] = None, profile: bool = False):
+        self.snapshot = Snapshot(store)
+        self.hooks = HOOKS if hooks is None else hooks
+        self.profile = profile
+        self.timings = []     # (name, seconds, outcome)
+        self._fingerprints = None
+        self._dirty = False
+
+    def _stored(self) -> dict:
+        if self._fingerprints is None:
+            stored = self.snapshot.config.get("startup_fingerprints")
+            self._fingerprints = dict(stored) if isinstance(stored, dict) else {}
+        return self._fingerprints
+
+    def run(self, phase: str, command: Optional[str] = None):
+        """Run one phase's hooks. A hook error never stops the command."""
+        snap = self.snapshot
+        snap.command = command
+        for hook in self.hooks:
+            if hook.phase != phase or (hook.commands and command not in hook.commands):
+                continue
+            start = time.perf_counter()
+            outcome = "ran"
+            try:
+                key = hook.key(snap) if hook.key else None
+                seen = self._stored().get(hook.name) if hook.key else None
+                if (seen and seen.get("key") == key
+                        and datetime.now().isoformat() < seen.get("until", "")):
+                    outcome = "skipped (unchanged)"
+                elif hook.run(snap) and hook.key:
+                    # Inputs after the run: the hook itself may have written them
+                    self._stored()[hook.name] = {"key": hook.key(snap), "until": hook.until(snap)}
+                    self._dirty = True
+                elif hook.key and self._stored().pop(hook.name, None) is not None:
+                    self._dirty = True
+            except Exception:
+                outcome = "failed"
+            self.timings.append((hook.name, time.perf_counter() - start, outcome))
+
+    def finish(self):
+        """Persist changed fingerprints (one config write) and print the profile if asked."""
+        if self._dirty:
+            store = self.snapshot.store
+            config = store.load_config()   # the hooks may have saved config meanwhile
+            config["startup_fingerprints"] = self._fingerprints
+            store.save_config(config)
+            self._dirty = False
+        if self.profile:
+            total = sum(seconds for _, seconds, _ in self.timings)
+            out = sys.stderr
+            print("\nstartup hooks", file=out)
+            for name, seconds, outcome in self.timings:
+                print(f"  {name:<16} {seconds * 1000:>8.2f} ms  {outcome}", file=out)
+            print(f"  {'total':<16} {total * 1000:>8.2f} ms", file=out)
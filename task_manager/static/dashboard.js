@@ -561,20 +561,100 @@
     }
 
     let timelineMapping = {}; // Execution Engine: Backend synced timeline mapping
+    let tasksLoadedOnce = false;
+
+    // ── LIVE EVENTS (SSE): the server pushes task deltas, focus and recovery changes ──
+    // While the stream is up the 5s focus poll stands down; on (re)connect the server
+    // sends `hello` and we resync with one conditional fetch of each view.
+    let tfEventsLive = false;
+    function tfConnectEvents() {
+        if (!window.EventSource) return;
+        const es = new EventSource('/api/events');
+        es.addEventListener('hello', () => {
+            tfEventsLive = true;
+            loadTasks().catch(console.error);
+            checkFocusState(true);
+            checkRecoveryStatus();
+        });
+        es.addEventListener('tasks', ev => { try { tfApplyTaskDelta(JSON.parse(ev.data)); } catch (e) { console.error(e); } });
+        es.addEventListener('focus', ev => { try { tfApplyFocusState(JSON.parse(ev.data)); } catch (e) { console.error(e); } });
+        es.addEventListener('recovery', () => checkRecoveryStatus());
+        es.addEventListener('resync', () => { tfTasksVersion = null; loadTasks().catch(console.error); });
+        es.onerror = () => { tfEventsLive = false; };   // EventSource reconnects by itself
+    }
+
+    // ── DELTA SYNC: /api/tasks?since=<version> returns only changes + tombstones ──
+    // A full (ETag-revalidated) fetch at least once a minute keeps the server-computed,
+    // time-relative fields (pressure, overdue) of untouched tasks current.
+    let tfTasksVersion = null, tfTasksFullAt = 0;
+    async function tfFetchTasks() {
+        if (tfTasksVersion && tasksLoadedOnce && Date.now() - tfTasksFullAt < 60000) {
+            const d = await (await fetch('/api/tasks?since=' + encodeURIComponent(tfTasksVersion))).json();
+            tfTasksVersion = d.version || null;
+            if (d.full === false) {
+                const changed = !!((d.tasks || []).length || (d.deleted || []).length);
+                if (changed) tfMergeTasks(d.tasks, d.deleted);
+                return { changed, tasks: allTasks };
+            }
+            tfTasksFullAt = Date.now();   // server restarted / we were too far behind: full list
+            return { changed: true, tasks: d.tasks || [] };
+        }
+        const r = await tfFetchJSON('/api/tasks');
+        tfTasksVersion = r.data.version || null;
+        tfTasksFullAt = Date.now();
+        return { changed: r.changed, tasks: r.data.tasks || [] };
+    }
+
+    function tfMergeTasks(changed, deleted) {
+        const gone = new Set(deleted || []);
+        const fresh = new Map((changed || []).map(t => [t.id, t]));
+        allTasks = allTasks.filter(t => !gone.has(t.id)).map(t => {
+            const u = fresh.get(t.id);
+            if (u) fresh.delete(t.id);
+            return u || t;
+        });
+        fresh.forEach(t => allTasks.push(t));   // newly created
+    }
+
+    function tfApplyTaskDelta(delta) {
+        tfMergeTasks(delta.changed, delta.deleted);
+        if (delta.version) tfTasksVersion = delta.version;
+        tfFetchJSON('/api/stats').then(r => { updateIntegrityMeter(r.data); updateStreakDisplay(r.data); }).catch(() => {});
+        updateControlCenter();
+        renderTaskList();
+        renderTimeline();
+    }
+
+    // ── CONDITIONAL FETCH: polled JSON is revalidated with If-None-Match ──
+    // The server answers 304 (no body) when the payload is unchanged; we re-parse our own
+    // copy of the last body (callers may mutate what they get) and report changed=false.
+    const _tfEtagCache = new Map();   // url -> { etag, text }
+    async function tfFetchJSON(url) {
+        const hit = _tfEtagCache.get(url);
+        const res = await fetch(url, hit ? { headers: { 'If-None-Match': hit.etag } } : undefined);
+        if (res.status === 304 && hit) return { data: JSON.parse(hit.text), changed: false, ok: true };
+        const text = await res.text();
+        const etag = res.headers.get('ETag');
+        if (etag && res.ok) _tfEtagCache.set(url, { etag, text }); else _tfEtagCache.delete(url);
+        return { data: JSON.parse(text), changed: true, ok: res.ok };
+    }
 
     // ── MOMENTUM CASCADE ENGINE ───────────────────────────────────────────
     async function loadTasks() {
         try {
             const [tasksRes, statsRes, timelineRes] = await Promise.all([
-                fetch('/api/tasks'),
-                fetch('/api/stats'),
-                fetch('/api/timeline')
+                tfFetchTasks(),
+                tfFetchJSON('/api/stats'),
+                tfFetchJSON('/api/timeline').catch(e => ({ error: e, changed: true }))
             ]);
-            const tasksData = await tasksRes.json();
-            const statsData = await statsRes.json();
+            // Nothing changed on the server since the last render: skip the whole re-render
+            if (tasksLoadedOnce && !tasksRes.changed && !statsRes.changed && !timelineRes.changed) return;
+            tasksLoadedOnce = true;
+            const statsData = statsRes.data;
             
             try {
-                const timelineData = await timelineRes.json();
+                if (timelineRes.error) throw timelineRes.error;
+                const timelineData = timelineRes.data;
                 const localMappingStr = localStorage.getItem('task_timeline_mapping');
                 if (Object.keys(timelineData).length === 0 && localMappingStr && localMappingStr !== '{}') {
                     // One-time migration from Local Storage to Server
@@ -588,7 +668,7 @@
                     timelineMapping = timelineData;
                 }
             } catch(e) { console.error("Timeline API fail", e); }
-            allTasks = tasksData.tasks || [];
+            allTasks = tasksRes.tasks;
             updateIntegrityMeter(statsData);
             updateStreakDisplay(statsData);
             updateControlCenter();
@@ -745,8 +825,9 @@
             }
         } catch (e) { showToast('Couldn\'t schedule — try again', 'var(--red)'); }
     };
+    let pathRendered = false;
     function loadPath() {
-        fetch('/api/path').then(r => r.json()).then(renderPath).catch(() => {});
+        tfFetchJSON('/api/path').then(r => { if (r.changed || !pathRendered) { pathRendered = true; renderPath(r.data); } }).catch(() => {});
     }
     function regeneratePath() {
         const btn = document.getElementById('cc-path-regen');
@@ -3355,6 +3436,7 @@
         // Start Focus Sync Engine
         checkFocusState();
         setInterval(checkFocusState, 5000);
+        tfConnectEvents();
 
         // ── PHASE 1: Duration pill clicks ──
         document.querySelectorAll('.dur-pill').forEach(pill => {
@@ -3545,37 +3627,39 @@
     let isPaused = false;
     let activeBlockedSites = [];
 
-    async function checkFocusState() {
+    async function checkFocusState(force) {
+        if (tfEventsLive && force !== true) return;   // the /api/events stream pushes focus changes
         try {
-            const res = await fetch('/api/focus_state');
-            if (res.ok) {
-                const data = await res.json();
-                if (data.focus_active) {
-                    if (data.paused && !isPaused) {
-                        isPaused = true;
-                        updatePauseUI();
-                    } else if (!data.paused && isPaused) {
-                        isPaused = false;
-                        updatePauseUI();
-                    }
-                    activateFocusLock(data);
-                    // Backstop: server says the timer hit 0 (within grace) — surface the decision
-                    // even if the local countdown drifted or this is a fresh page after a refresh.
-                    if (data.awaiting_decision && focusLocalActive && !sessionDecisionShown) {
-                        showSessionEndDecision();
-                    }
-                } else {
-                    // Server reports no active session. Do NOT tear down a locally-running
-                    // countdown — that was the bug: the start-race (poll fires before the start
-                    // thread persists) or a transient read killed the overlay ~5s in and it never
-                    // came back. A session ends only via its own timer (completeFocusSession) or
-                    // an explicit abort — both clear focusLocalActive.
-                    if (focusTickInterval && !focusLocalActive) deactivateFocusLock();
-                }
-            }
+            const res = await tfFetchJSON('/api/focus_state');
+            if (res.ok) tfApplyFocusState(res.data);
         } catch (e) { console.error("Focus sync error:", e); }
     }
 
+    function tfApplyFocusState(data) {
+        if (data.focus_active) {
+            if (data.paused && !isPaused) {
+                isPaused = true;
+                updatePauseUI();
+            } else if (!data.paused && isPaused) {
+                isPaused = false;
+                updatePauseUI();
+            }
+            activateFocusLock(data);
+            // Backstop: server says the timer hit 0 (within grace) — surface the decision
+            // even if the local countdown drifted or this is a fresh page after a refresh.
+            if (data.awaiting_decision && focusLocalActive && !sessionDecisionShown) {
+                showSessionEndDecision();
+            }
+        } else {
+            // Server reports no active session. Do NOT tear down a locally-running
+            // countdown — that was the bug: the start-race (poll fires before the start
+            // thread persists) or a transient read killed the overlay ~5s in and it never
+            // came back. A session ends only via its own timer (completeFocusSession) or
+            // an explicit abort — both clear focusLocalActive.
+            if (focusTickInterval && !focusLocalActive) deactivateFocusLock();
+        }
+    }
+
     function activateFocusLock(data) {
         if (!focusTickInterval && !document.getElementById('focus-overlay').classList.contains('active')) {
             document.body.classList.add('state-deep-work');
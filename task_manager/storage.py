@@ -2,16 +2,80 @@
 TaskFlow Storage Module
 ----------------------
 Handles data persistence with backup and recovery.
+
+Tasks (JSON backend) live in a tasks.json snapshot plus an append-only tasks.journal
+of per-task mutations; the journal is folded into a new snapshot on a size/age
+threshold, and the outgoing snapshot/journal pair becomes the backup.
+
+Every load goes through a per-process FileCache keyed on (mtime_ns, size), so the
+CLI's startup hooks can each call load_tasks()/load_config() without rereading.
 """
 
+import copy
 import json
 import os
 import shutil
+import threading
+from functools import partial, wraps
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 from datetime import datetime
 
-from task_manager.models import Task
+from task_manager.behavior_store import BehaviorStore
+from task_manager.file_cache import FileCache
+from task_manager.file_lock import FileLock
+from task_manager.models import Task, TaskHeader
+from task_manager.sqlite_store import SQLiteTaskStore, sqlite_available
+from task_manager.search_index import SearchIndex
+from task_manager.task_codec import BODY_KEY, TASK_FORMATS, decode_body, iter_records, write_records
+
+STORAGE_BACKENDS = ("json", "sqlite")
+
+# Journal compaction thresholds (JSON backend) and how many snapshot backups to keep
+JOURNAL_COMPACT_BYTES = 256 * 1024
+JOURNAL_COMPACT_SECONDS = 6 * 3600
+MAX_BACKUPS = 10
+
+_MISSING = object()
+
+
+# Task record fields holding lists (and lists of dicts) that callers edit in place
+_LIST_KEYS = ("tags", "postpone_history")
+_DICT_LIST_KEYS = ("links", "checklist", "edit_history")
+
+
+def _thaw(record: dict) -> dict:
+    """Private copy of a (cached) task record: lists and their dict items are copied too,
+    so editing a loaded Task's tags/checklist can never write through into the cache."""
+    out = dict(record)
+    for key in _LIST_KEYS:
+        value = out.get(key)
+        if value:
+            out[key] = list(value)
+    for key in _DICT_LIST_KEYS:
+        value = out.get(key)
+        if value:
+            out[key] = [dict(x) if type(x) is dict else x for x in value]
+    return out
+
+
+class TaskConflict(Exception):
+    """commit(strict=True): a task changed in storage since it was loaded, in a field this
+    commit changes too. `conflicts` lists the (task_id, field) pairs; nothing was written."""
+
+    def __init__(self, conflicts):
+        super().__init__(", ".join(f"#{task_id}.{name}" for task_id, name in conflicts))
+        self.conflicts = conflicts
+
+
+def _write_locked(method):
+    """Run a task write under TaskStorage._write_lock (the dashboard writes from many threads)
+    and the tasks.lock file lock (the CLI, daemon and server write from separate processes)."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock, self._tasks_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class TaskStorage:
@@ -21,6 +85,7 @@ class TaskStorage:
         # Global user-level storage directory
         self.data_dir = Path.home() / ".taskflow"   
         self.tasks_file = self.data_dir / "tasks.json"
+        self.journal_file = self.data_dir / "tasks.journal"
         self.timeline_file = self.data_dir / "timeline.json"
         self.backup_dir = self.data_dir / "backups"
         self.recovery_state_file = self.data_dir / "recovery_state.json"
@@ -30,6 +95,12 @@ class TaskStorage:
         self.focus_lock_file = self.data_dir / "focus_lock.json"
         # S12 — computed daily aggregates (the behavior data store's derived layer)
         self.daily_summaries_file = self.data_dir / "daily_summaries.json"
+        # Optional SQLite backend (row-per-task); tasks.json stays the default
+        self.db_file = self.data_dir / "tasks.db"
+        # S12 — behavior_log.jsonl with its day/event index
+        self.behavior = BehaviorStore(self.data_dir)
+        # Full-text index for `taskflow search` (derived; kept in step by the task writes)
+        self.search = SearchIndex(self.data_dir / "search.db")
 
         self._ensure_directories()
 
@@ -40,6 +111,105 @@ class TaskStorage:
                 old_dir.rename(self.data_dir)
             except Exception:
                 pass
+
+        # Parsed files keyed on (mtime_ns, size): repeated loads in one process are free
+        self._cache = FileCache()
+        self.backend = "json"
+        self._sqlite = None
+        # Writes are short and serialised; concurrent load -> edit -> commit cycles are
+        # reconciled per task in commit() instead of being serialised end to end.
+        self._write_lock = threading.RLock()
+        # Held across a write's before/after signatures, so search.apply() never stamps
+        # the index with another process's write it hasn't seen
+        self._tasks_lock = FileLock(self.data_dir / "tasks.lock")
+        self._local = threading.local()
+        # Ids present in storage as of this thread's last load/save — commit() diffs against it for deletes
+        self._known_ids = None
+        config = self.load_config()
+        fmt = str(config.get("tasks_format") or "pretty").strip().lower()
+        # On-disk snapshot format for tasks.json (see task_codec); readers auto-detect
+        self.tasks_format = fmt if fmt in TASK_FORMATS else "pretty"
+        self._init_backend(self._requested_backend(config))
+
+    def _requested_backend(self, config: dict) -> str:
+        """TASKFLOW_STORAGE env var wins over config.json's storage_backend."""
+        name = os.environ.get("TASKFLOW_STORAGE") or config.get("storage_backend") or "json"
+        name = str(name).strip().lower()
+        return name if name in STORAGE_BACKENDS else "json"
+
+    def _init_backend(self, name: str):
+        """Activate a backend. SQLite failures fall back to JSON instead of breaking startup."""
+        self._cache.invalidate("tasks", "task_headers")
+        if name != "sqlite":
+            self.backend = "json"
+            self._sqlite = None
+            return
+        try:
+            if not sqlite_available():
+                raise RuntimeError("sqlite3 is not available")
+            store = SQLiteTaskStore(self.db_file)
+            fresh = not self.db_file.exists()
+            store.connect()
+            if fresh or store.get_meta("migrated_from_json") is None:
+                self._migrate_json_to_sqlite(store)
+            self._sqlite = store
+            self.backend = "sqlite"
+        except Exception as e:
+            print(f"Warning: SQLite storage unavailable ({e}); falling back to tasks.json.")
+            self._sqlite = None
+            self.backend = "json"
+
+    def _migrate_json_to_sqlite(self, store: SQLiteTaskStore):
+        """One-shot import of tasks.json into a new database. tasks.json is left untouched."""
+        tasks = self._load_tasks_json() if self.tasks_file.exists() else []
+        if tasks and store.count() == 0:
+            store.replace_all(t.to_dict() for t in tasks)
+            print(f"Migrated {len(tasks)} task(s) from tasks.json to {self.db_file.name}.")
+        store.set_meta("migrated_from_json", datetime.now().isoformat())
+
+    @_write_locked
+    def set_backend(self, name: str) -> bool:
+        """Switch backends, carrying the current tasks across, and persist the choice."""
+        name = (name or "").strip().lower()
+        if name not in STORAGE_BACKENDS:
+            print(f"Error: unknown storage backend '{name}' (choose: {', '.join(STORAGE_BACKENDS)})")
+            return False
+        if name == self.backend:
+            return True
+        tasks = self.load_tasks()
+        if name == "sqlite":
+            self._init_backend("sqlite")
+            if self.backend != "sqlite":
+                return False
+            self._sqlite.replace_all(t.to_dict() for t in tasks)
+        else:
+            # Fallback path: write the database's rows back out as tasks.json
+            if self._sqlite is not None:
+                self._sqlite.close()
+            self._sqlite = None
+            self.backend = "json"
+            self._cache.invalidate("tasks", "task_headers")
+            if not self._compact(tasks):
+                return False
+        config = self.load_config()
+        config["storage_backend"] = name
+        return self.save_config(config)
+
+    @_write_locked
+    def set_tasks_format(self, fmt: str) -> bool:
+        """Choose the tasks.json snapshot format and rewrite the snapshot in it."""
+        fmt = (fmt or "").strip().lower()
+        if fmt not in TASK_FORMATS:
+            print(f"Error: unknown tasks format '{fmt}' (choose: {', '.join(TASK_FORMATS)})")
+            return False
+        self.tasks_format = fmt
+        config = self.load_config()
+        config["tasks_format"] = fmt
+        if not self.save_config(config):
+            return False
+        if self._sqlite is None and (self.tasks_file.exists() or self.journal_file.exists()):
+            return self.save_tasks(self.load_tasks())
+        return True
     
     def _ensure_directories(self):
         """Ensure required directories exist, with private (0700) perms where supported."""
@@ -55,55 +225,220 @@ class TaskStorage:
             pass
     
     def _create_backup(self):
-        """Create timestamped backup of tasks file."""
-        if not self.tasks_file.exists():
-            return
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_file = self.backup_dir / f"tasks_backup_{timestamp}.json"
-        shutil.copy2(self.tasks_file, backup_file)
-        
-        # Keep only last 10 backups
+        """Create timestamped backup of the current tasks.
+
+        JSON: rotates the snapshot + journal pair into backups/ (hard link + rename, no
+        full-file copy). SQLite: dumps the rows as a tasks.json-shaped file.
+        """
+        if self._sqlite is not None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_file = self.backup_dir / f"tasks_backup_{timestamp}.json"
+            # Same tasks.json-shaped snapshot, so restore works across backends
+            with open(backup_file, 'w', encoding='utf-8') as file:
+                json.dump(self._sqlite.load_all(), file, indent=4)
+            self._prune_backups()
+        elif self.tasks_file.exists() or self.journal_file.exists():
+            self._compact(self._load_tasks_json())
+
+    def _prune_backups(self):
+        """Keep only the last MAX_BACKUPS snapshots (and their paired journals)."""
         backups = sorted(self.backup_dir.glob("tasks_backup_*.json"))
-        if len(backups) > 10:
-            for old_backup in backups[:-10]:
-                old_backup.unlink()
+        for old_backup in backups[:-MAX_BACKUPS]:
+            old_backup.unlink()
+            paired = self._paired_journal(old_backup)
+            if paired.exists():
+                paired.unlink()
+
+    def _paired_journal(self, backup_file: Path) -> Path:
+        """backups/tasks_backup_<ts>.json -> backups/tasks_journal_<ts>.jsonl"""
+        stamp = backup_file.stem[len("tasks_backup_"):]
+        return self.backup_dir / f"tasks_journal_{stamp}.jsonl"
     
     def load_tasks(self) -> List[Task]:
         """
-        Load tasks from JSON file with error recovery.
+        Load tasks from the active backend with error recovery.
         
         Returns:
             List of Task objects
         """
-        if not self.tasks_file.exists():
-            return []
+        if self._sqlite is not None:
+            try:
+                tasks = self._tasks_from_dicts(self._task_records().values())
+            except Exception as e:
+                print(f"Error loading tasks: {e}")
+                return []
+        else:
+            tasks = self._load_tasks_json()
+        self._mark_persisted(tasks)
+        return tasks
+
+    # --- Task cache (see file_cache): records are shared, so hand out _thaw() copies ---
+    def _task_paths(self) -> tuple:
+        if self._sqlite is not None:
+            return self.db_file, self.db_file.with_name(self.db_file.name + "-wal")
+        return self.tasks_file, self.journal_file
+
+    def _task_signature(self):
+        return self._cache.signature(self._task_paths())
+
+    def _task_records(self) -> dict:
+        """id -> stored task dict for the active backend, from the cache while current."""
+        sig = self._cache.signature(self._task_paths())
+        state = self._cache.get("tasks", sig)
+        if state is None:
+            if self._sqlite is not None:
+                state = {d["id"]: d for d in self._sqlite.load_all()}
+            else:
+                state = self._json_state()
+            self._cache.put("tasks", sig, state)
+        return state
+
+    def _cached_task_records(self) -> Optional[dict]:
+        """The cached records if they still match disk (no read otherwise)."""
+        return self._cache.get("tasks", self._cache.signature(self._task_paths()))
+
+    def _update_task_cache(self, before: Optional[dict], puts: List[dict] = (), deleted=()):
+        """Fold a successful write into the cache, if the cache was current before it."""
+        self._cache.invalidate("task_headers")
+        if before is None:
+            self._cache.invalidate("tasks")
+            return
+        state = dict(before)   # new dict: other threads may be iterating the old one
+        for data in puts:
+            state[data["id"]] = _thaw(data)
+        for task_id in deleted:
+            state.pop(task_id, None)
+        self._cache.put("tasks", self._cache.signature(self._task_paths()), state)
+
+    def _reset_task_cache(self, data: List[dict]):
+        """After a full rewrite, the written dicts are the current state."""
+        self._cache.invalidate("task_headers")
+        self._cache.put("tasks", self._cache.signature(self._task_paths()),
+                        {d["id"]: _thaw(d) for d in data})
+
+    def load_task_headers(self) -> List[TaskHeader]:
+        """
+        Load slim TaskHeader proxies instead of full Task objects.
+        
+        For read-mostly views (list, today, path, recovery checks). The heavy fields
+        (description, links, checklist, edit/postpone history) are fetched per task only
+        if something touches them; with the 'rows' format or SQLite they are not even
+        decoded until then. Headers can be passed to commit() like loaded Tasks.
         
+        Returns:
+            List of TaskHeader objects (full Tasks if corruption recovery had to run)
+        """
+        sig = self._cache.signature(self._task_paths())
+        records = self._cache.get("tasks", sig)
+        if records is not None:
+            # Full records already cached (an earlier load_tasks): nothing to read at all
+            headers = [TaskHeader(record, partial(_thaw, record)) for record in records.values()]
+        elif self._sqlite is not None:
+            try:
+                heads = self._cache.get("task_headers", sig)
+                if heads is None:
+                    heads = self._sqlite.load_heads()
+                    self._cache.put("task_headers", sig, heads)
+            except Exception as e:
+                print(f"Error loading tasks: {e}")
+                return []
+            headers = [TaskHeader(head, self._sqlite_fetcher(head)) for head in heads]
+        else:
+            if not self.tasks_file.exists() and not self.journal_file.exists():
+                return []
+            state = self._cache.get("task_headers", sig)
+            if state is None:
+                try:
+                    state = ({item.get("id"): item for item in iter_records(self.tasks_file, headers_only=True)}
+                             if self.tasks_file.exists() else {})
+                except ValueError:
+                    return self.load_tasks()   # D3-01 recovery lives there
+                state = self._replay_journal(state, self.journal_file)
+                self._cache.put("task_headers", sig, state)
+            headers = [TaskHeader(record, self._body_fetcher(record) if BODY_KEY in record
+                                  else partial(_thaw, record))
+                       for record in state.values()]
+        self._known_ids = {header.id for header in headers}
+        return headers
+
+    def _sqlite_fetcher(self, head: dict):
+        store, task_id = self._sqlite, head.get("id")
+        return lambda: store.get(task_id) or _thaw(head)
+
+    @staticmethod
+    def _body_fetcher(record: dict):
+        return lambda: _thaw(dict(record, **decode_body(record[BODY_KEY])))
+
+    @property
+    def _known_ids(self) -> Optional[set]:
+        return getattr(self._local, "known_ids", None)
+
+    @_known_ids.setter
+    def _known_ids(self, ids: Optional[set]):
+        self._local.known_ids = ids
+
+    def _mark_persisted(self, tasks: List[Task]):
+        """Snapshot tasks as matching storage, so commit() can tell what changed."""
+        for task in tasks:
+            task.mark_clean()
+        self._known_ids = {task.id for task in tasks}
+
+    def _disk_ids(self) -> set:
+        """Ids currently stored (used when commit() runs without a prior load)."""
         try:
-            with open(self.tasks_file, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            return set(self._task_records().keys())
+        except Exception:
+            return set()
 
-            tasks = []
-            for item in data:
+    def _tasks_from_dicts(self, data) -> List[Task]:
+        tasks = []
+        for item in data:
+            try:
+                tasks.append(Task.from_dict(_thaw(item)))
+            except Exception as e:
+                print(f"Warning: Skipping invalid task data: {e}")
+        return tasks
+
+    # --- JSON backend: tasks.json snapshot + append-only tasks.journal ---
+    def _read_snapshot(self, path: Path) -> dict:
+        """Read a snapshot file (any format) into an id -> task dict mapping (insertion-ordered)."""
+        return {item.get("id"): item for item in iter_records(path)}
+
+    def _replay_journal(self, state: dict, path: Path) -> dict:
+        """Apply journal records on top of a snapshot state. A torn last line is skipped."""
+        if not path.exists():
+            return state
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
                 try:
-                    # Handle legacy format (no tags/notes)
-                    if 'tags' not in item:
-                        item['tags'] = []
-                    if 'notes' not in item:
-                        item['notes'] = ""
-                    
-                    task = Task.from_dict(item)
-                    tasks.append(task)
-                except Exception as e:
-                    print(f"Warning: Skipping invalid task data: {e}")
-                    continue
-            
-            return tasks
+                    record = json.loads(line)
+                except ValueError:
+                    continue   # crash mid-append: only the tail record can be incomplete
+                if record.get("op") == "put":
+                    task = record.get("task") or {}
+                    state[task.get("id")] = task
+                elif record.get("op") == "del":
+                    state.pop(record.get("id"), None)
+        return state
+
+    def _json_state(self) -> dict:
+        """Current JSON-backend state: the snapshot with the journal replayed over it."""
+        state = self._read_snapshot(self.tasks_file) if self.tasks_file.exists() else {}
+        return self._replay_journal(state, self.journal_file)
+
+    def _load_tasks_json(self) -> List[Task]:
+        """Load tasks from tasks.json + tasks.journal (D3-01 corruption recovery included)."""
+        if not self.tasks_file.exists() and not self.journal_file.exists():
+            return []
+        
+        try:
+            return self._tasks_from_dicts(self._task_records().values())
             
         except json.JSONDecodeError:
             # D3-01: a corrupt tasks.json must NEVER silently become an empty board — a later
-            # save would then overwrite the only copy. Quarantine the bad file, then restore the
-            # newest backup that actually parses, so one bad write can't erase the user's work.
+            # save would then overwrite the only copy. Quarantine the bad file, then rebuild
+            # from the newest backup snapshot that parses: replay the journal that was rotated
+            # out with it, then the live journal, so one bad write can't erase the user's work.
             print("Error: tasks.json is corrupted. Attempting automatic recovery from backup…")
             try:
                 quarantine = self.data_dir / f"tasks_corrupt_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -112,16 +447,15 @@ class TaskStorage:
                 pass
             for backup in sorted(self.backup_dir.glob("tasks_backup_*.json"), reverse=True):
                 try:
-                    with open(backup, 'r', encoding='utf-8') as bf:
-                        data = json.load(bf)
-                    recovered = []
-                    for item in data:
-                        try:
-                            recovered.append(Task.from_dict(item))
-                        except Exception:
-                            continue
-                    shutil.copy2(backup, self.tasks_file)
-                    print(f"Recovered {len(recovered)} task(s) from {backup.name}.")
+                    state = self._replay_journal(self._read_snapshot(backup), self._paired_journal(backup))
+                    state = self._replay_journal(state, self.journal_file)
+                    recovered = self._tasks_from_dicts(state.values())
+                    data = [t.to_dict() for t in recovered]
+                    with self._write_lock, self._tasks_lock:
+                        self._write_snapshot(data)
+                        self._truncate_journal()
+                    self._reset_task_cache(data)
+                    print(f"Recovered {len(recovered)} task(s) from {backup.name} + journal.")
                     return recovered
                 except Exception:
                     continue
@@ -130,10 +464,156 @@ class TaskStorage:
         except Exception as e:
             print(f"Error loading tasks: {e}")
             return []
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Yield tasks one at a time, decoding lazily where the format allows.
+        
+        With the 'rows' snapshot format (or SQLite) the first task is ready before the
+        rest is read, so streaming views can start printing early. Read-only: tasks
+        yielded here are not tracked for commit(); use load_tasks() to edit.
+        """
+        cached = self._cached_task_records()
+        if cached is not None:
+            for data in list(cached.values()):
+                try:
+                    yield Task.from_dict(_thaw(data))
+                except Exception as e:
+                    print(f"Warning: Skipping invalid task data: {e}")
+            return
+        if self._sqlite is not None:
+            for data in self._sqlite.iter_all():
+                try:
+                    yield Task.from_dict(data)
+                except Exception as e:
+                    print(f"Warning: Skipping invalid task data: {e}")
+            return
+        # Journal records override snapshot rows: read them first (the journal is small)
+        pending, deleted = self._journal_overrides()
+        yielded = False
+        try:
+            if self.tasks_file.exists():
+                for item in iter_records(self.tasks_file):
+                    task_id = item.get("id")
+                    if task_id in deleted:
+                        continue
+                    item = pending.pop(task_id, item)
+                    try:
+                        task = Task.from_dict(item)
+                    except Exception as e:
+                        print(f"Warning: Skipping invalid task data: {e}")
+                        continue
+                    yielded = True
+                    yield task
+        except ValueError:
+            if yielded:
+                print("Error: tasks.json is corrupted; listing stopped early. Run any command to recover.")
+                return
+            yield from self.load_tasks()   # runs D3-01 recovery
+            return
+        for item in pending.values():
+            try:
+                yield Task.from_dict(item)
+            except Exception as e:
+                print(f"Warning: Skipping invalid task data: {e}")
+
+    def _journal_overrides(self):
+        """(puts, deleted_ids) from the live journal: the last record per id wins."""
+        puts, deleted = {}, set()
+        if not self.journal_file.exists():
+            return puts, deleted
+        with open(self.journal_file, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("op") == "put":
+                    task = record.get("task") or {}
+                    puts[task.get("id")] = task
+                    deleted.discard(task.get("id"))
+                elif record.get("op") == "del":
+                    puts.pop(record.get("id"), None)
+                    deleted.add(record.get("id"))
+        return puts, deleted
+
+    def _append_journal(self, records: List[dict]):
+        """Append mutation records to tasks.journal and fsync (durable before we return)."""
+        payload = "".join(json.dumps(r, separators=(',', ':'), ensure_ascii=False) + "\n" for r in records)
+        with open(self.journal_file, 'a+b') as file:
+            # A crash can leave a torn last line; start on a fresh line so it stays isolated.
+            if file.tell() > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    payload = "\n" + payload
+            file.write(payload.encode('utf-8'))
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _truncate_journal(self):
+        if self.journal_file.exists():
+            self.journal_file.unlink()
+
+    def _journal_due_for_compaction(self) -> bool:
+        """Compact once the journal is big, or once the snapshot it applies to is old."""
+        try:
+            size = self.journal_file.stat().st_size
+        except OSError:
+            return False
+        if size >= JOURNAL_COMPACT_BYTES:
+            return True
+        try:
+            age = datetime.now().timestamp() - self.tasks_file.stat().st_mtime
+        except OSError:
+            return True   # journal but no snapshot yet
+        return age >= JOURNAL_COMPACT_SECONDS
+
+    def _write_snapshot(self, data: List[dict]):
+        temp_file = self.tasks_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            write_records(file, data, self.tasks_format)
+        temp_file.replace(self.tasks_file)
+
+    def _compact(self, tasks: Optional[List[Task]] = None) -> bool:
+        """Write a fresh snapshot (of `tasks`, default the stored state) and start an empty journal.
+
+        The outgoing snapshot + journal pair moves to backups/ (hard link + rename, so no
+        bytes are copied) — that pair is what D3-01 recovery replays from.
+        """
+        try:
+            sig = self._task_signature()
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            backup_file = self.backup_dir / f"tasks_backup_{timestamp}.json"
+            if self.tasks_file.exists():
+                try:
+                    os.link(self.tasks_file, backup_file)
+                except OSError:
+                    shutil.copy2(self.tasks_file, backup_file)   # filesystems without hard links
+            # Snapshot first: a crash before the journal moves only leaves redundant,
+            # idempotent records to replay.
+            if tasks is not None:
+                data = [task.to_dict() for task in tasks]
+            else:
+                data = [_thaw(record) for record in self._task_records().values()]
+            self._write_snapshot(data)
+            if self.journal_file.exists():
+                if backup_file.exists():
+                    self.journal_file.replace(self._paired_journal(backup_file))
+                else:
+                    self._truncate_journal()
+            self._reset_task_cache(data)
+            # Compacting alone changes no task, just the files the index follows
+            self.search.apply(sig, self._task_signature(), replace=data if tasks is not None else None)
+            self._prune_backups()
+            return True
+        except Exception as e:
+            print(f"Error saving tasks: {e}")
+            return False
     
+    @_write_locked
     def save_tasks(self, tasks: List[Task]) -> bool:
         """
-        Save tasks to JSON file with backup.
+        Save the full task list to the active backend (JSON snapshot, or SQLite rows).
         
         Args:
             tasks: List of Task objects
@@ -141,27 +621,179 @@ class TaskStorage:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            # Create backup before saving
-            self._create_backup()
-            
-            # Convert tasks to dictionaries
-            data = [task.to_dict() for task in tasks]
-            
-            # Save to temporary file first
-            temp_file = self.tasks_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=4)
-            
-            # Replace original file
-            temp_file.replace(self.tasks_file)
+        if self._sqlite is not None:
+            try:
+                sig = self._task_signature()
+                data = [task.to_dict() for task in tasks]
+                self._sqlite.replace_all(data)
+            except Exception as e:
+                print(f"Error saving tasks: {e}")
+                self._cache.invalidate("tasks", "task_headers")
+                return False
+            self._reset_task_cache(data)
+            self.search.apply(sig, self._task_signature(), replace=data)
+        elif not self._compact(tasks):
+            return False
+        self._mark_persisted(tasks)
+        return True
+
+    @_write_locked
+    def commit(self, tasks: List[Task], loaded: Optional[Iterable[int]] = None,
+               strict: bool = False) -> bool:
+        """
+        Persist only what changed since the tasks were loaded.
+        
+        New and modified tasks are written, tasks no longer in `tasks` are deleted, and
+        when nothing changed this returns without touching disk at all. On SQLite that is
+        one upsert per changed row; on JSON one journal record per change, with the
+        snapshot compacted only when the journal passes its size/age threshold.
+
+        A modified task that someone else changed in storage meanwhile is merged field by
+        field (Task.rebase); a new task whose id was taken meanwhile gets the next free id.
+        
+        Args:
+            tasks: The full task list (as returned by load_tasks, then mutated)
+            loaded: Ids the list was loaded with (default: this thread's last load); the
+                    ones missing from `tasks` are deleted
+            strict: Raise TaskConflict instead of keeping our value when both sides changed a field
             
+        Returns:
+            True if successful (or nothing to do), False otherwise
+        """
+        changed = [task for task in tasks if task.is_dirty()]
+        ids = {task.id for task in tasks}
+        if loaded is not None:
+            known = set(loaded)
+        else:
+            known = self._known_ids if self._known_ids is not None else self._disk_ids()
+        deleted = known - ids
+        if not changed and not deleted:
             return True
-            
+
+        try:
+            stored = self._task_records()
+        except Exception:
+            stored = None
+        if stored is not None:
+            conflicts = self._rebase(changed, stored, ids, known)
+            if conflicts and strict:
+                raise TaskConflict(conflicts)
+            ids = {task.id for task in tasks}
+
+        before = self._cached_task_records()
+        sig = self._task_signature()
+        puts = [task.to_dict() for task in changed]
+        try:
+            if self._sqlite is not None:
+                self._sqlite.apply_changes(puts, deleted)
+            else:
+                self._append_journal([{"op": "put", "task": data} for data in puts]
+                                     + [{"op": "del", "id": task_id} for task_id in sorted(deleted)])
         except Exception as e:
             print(f"Error saving tasks: {e}")
+            self._cache.invalidate("tasks", "task_headers")
             return False
+        self._update_task_cache(before, puts, deleted)
+        self.search.apply(sig, self._task_signature(), puts, deleted)
+        for task in changed:
+            task.mark_clean()
+        self._known_ids = ids
+        if self._sqlite is None and self._journal_due_for_compaction():
+            # From the stored state, not `tasks`: another writer's changes may be newer
+            self._compact()
+        return True
+
+    @staticmethod
+    def _rebase(changed: List[Task], stored: dict, ids: set, known: set) -> list:
+        """Reconcile changed tasks with the stored records (see commit); returns conflicts."""
+        conflicts = []
+        used = set(stored) | ids
+        for task in changed:
+            record = stored.get(task.id)
+            if record is None:
+                continue
+            if task.is_new():
+                if task.id not in known:
+                    # Two writers picked the same next id: ours moves to a free one
+                    task.id = max(used) + 1
+                    used.add(task.id)
+                continue
+            conflicts.extend((task.id, name) for name in task.rebase(Task.from_dict(_thaw(record))))
+        return conflicts
     
+    # --- Single-task access (one row on SQLite, one journal record on JSON) ---
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """Load one task by id, or None."""
+        if self._sqlite is not None:
+            try:
+                data = self._sqlite.get(task_id)
+                return Task.from_dict(data) if data else None
+            except Exception as e:
+                print(f"Error loading task #{task_id}: {e}")
+                return None
+        return next((t for t in self.load_tasks() if t.id == task_id), None)
+
+    @_write_locked
+    def upsert_task(self, task: Task) -> bool:
+        """Insert or replace a single task."""
+        before = self._cached_task_records()
+        sig = self._task_signature()
+        data = task.to_dict()
+        try:
+            if self._sqlite is not None:
+                self._sqlite.upsert(data)
+            else:
+                self._append_journal([{"op": "put", "task": data}])
+        except Exception as e:
+            print(f"Error saving task #{task.id}: {e}")
+            self._cache.invalidate("tasks", "task_headers")
+            return False
+        self._update_task_cache(before, [data])
+        self.search.apply(sig, self._task_signature(), [data])
+        task.mark_clean()
+        if self._known_ids is not None:
+            self._known_ids.add(task.id)
+        return True
+
+    @_write_locked
+    def delete_task(self, task_id: int) -> bool:
+        """Delete a single task. Returns False if it did not exist."""
+        before = self._cached_task_records()
+        sig = self._task_signature()
+        try:
+            if self._sqlite is not None:
+                found = self._sqlite.delete(task_id)
+            else:
+                known = self._known_ids if self._known_ids is not None else self._disk_ids()
+                found = task_id in known
+                if found:
+                    self._append_journal([{"op": "del", "id": task_id}])
+        except Exception as e:
+            print(f"Error deleting task #{task_id}: {e}")
+            self._cache.invalidate("tasks", "task_headers")
+            return False
+        if found:
+            self._update_task_cache(before, deleted=[task_id])
+            self.search.apply(sig, self._task_signature(), deleted=[task_id])
+        if self._known_ids is not None:
+            self._known_ids.discard(task_id)
+        return found
+
+    # --- Full-text search (see search_index) ---
+    def search_tasks(self, query: str, status: Optional[str] = None, priority: Optional[str] = None,
+                     tag: Optional[str] = None, limit: Optional[int] = 20,
+                     reindex: bool = False) -> List[dict]:
+        """Ranked search over title, notes, description, tags, checklist and links.
+
+        The index catches up with the task files first if they changed behind its back;
+        `reindex` rebuilds it from scratch.
+        """
+        sig = self._task_signature()
+        if reindex:
+            self.search.rebuild(self._task_records().values(), sig)
+        return self.search.search(query, sig, self._task_records, status=status,
+                                  priority=priority, tag=tag, limit=limit)
+
     def export_tasks(self, export_path: str, format: str = "json") -> bool:
         """Export tasks to external file."""
         try:
@@ -206,32 +838,59 @@ class TaskStorage:
             print(f"Error importing tasks: {e}")
             return []
     
+    @_write_locked
+    def create_backup(self) -> bool:
+        """Create a manual backup of the current tasks (either backend)."""
+        try:
+            self._create_backup()
+            return True
+        except Exception as e:
+            print(f"Error creating backup: {e}")
+            return False
+
     def get_backup_list(self) -> List[str]:
         """Get list of available backups."""
         backups = sorted(self.backup_dir.glob("tasks_backup_*.json"))
         return [b.name for b in backups]
     
     def restore_backup(self, backup_name: str) -> bool:
-        """Restore from specific backup."""
+        """Restore from specific backup (its snapshot plus the journal rotated out with it)."""
         backup_file = self.backup_dir / backup_name
         if not backup_file.exists():
             return False
         
         try:
-            shutil.copy2(backup_file, self.tasks_file)
-            return True
+            state = self._replay_journal(self._read_snapshot(backup_file), self._paired_journal(backup_file))
+            return self.save_tasks(self._tasks_from_dicts(state.values()))
         except Exception as e:
             print(f"Error restoring backup: {e}")
             return False
             
+    # --- Small JSON files (config, timeline, ...) through the file cache ---
+    def _read_json(self, path: Path):
+        """json.load() the file, or reuse the cached parse while it is unchanged on disk.
+
+        Returns a private deep copy (callers mutate what they load). Raises like json.load.
+        """
+        sig = self._cache.signature((path,))
+        data = self._cache.get(path, sig, _MISSING)
+        if data is _MISSING:
+            with open(path, 'r') as file:
+                data = json.load(file)
+            self._cache.put(path, sig, data)
+        return copy.deepcopy(data)
+
+    def _remember_json(self, path: Path, data):
+        """Record what was just written to `path`, so the next load needs no read."""
+        self._cache.put(path, self._cache.signature((path,)), copy.deepcopy(data))
+
     # --- Timeline Storage Methods ---
     def load_timeline(self) -> dict:
         """Load the timeline mapping dict mapping task ID strings to date strings."""
         if not self.timeline_file.exists():
             return {}
         try:
-            with open(self.timeline_file, 'r') as file:
-                return json.load(file)
+            return self._read_json(self.timeline_file)
         except Exception as e:
             print(f"Error loading timeline mapping: {e}")
             return {}
@@ -243,6 +902,7 @@ class TaskStorage:
             with open(temp_file, 'w') as file:
                 json.dump(mapping, file, indent=4)
             temp_file.replace(self.timeline_file)
+            self._remember_json(self.timeline_file, mapping)
             return True
         except Exception as e:
             print(f"Error saving timeline mapping: {e}")
@@ -263,8 +923,7 @@ class TaskStorage:
             return default_state
 
         try:
-            with open(self.recovery_state_file, 'r') as file:
-                state = json.load(file)
+            state = self._read_json(self.recovery_state_file)
             for k, v in default_state.items():
                 state.setdefault(k, v)
             return state
@@ -278,6 +937,7 @@ class TaskStorage:
             with open(temp_file, 'w') as file:
                 json.dump(state, file, indent=2)
             temp_file.replace(self.recovery_state_file)
+            self._remember_json(self.recovery_state_file, state)
             return True
         except Exception as e:
             print(f"Error saving recovery state: {e}")
@@ -320,18 +980,23 @@ class TaskStorage:
             "streak_last_date": None,
             "last_weekly_review": None,
             "last_summary_date": None,
+            # Last day ensure_daily_summaries has already considered (incremental backfill)
+            "summaries_watermark": None,
             # Edit system — global Nova behavioral-data toggle (OPERATOR M → Advanced)
-            "nova_data_enabled": True
+            "nova_data_enabled": True,
+            # Task storage backend: "json" (tasks.json) or "sqlite" (tasks.db)
+            "storage_backend": "json",
+            # tasks.json snapshot format: "pretty" | "compact" | "rows" (see task_codec)
+            "tasks_format": "pretty"
         }
         if not self.config_file.exists():
             return default_config
         try:
-            with open(self.config_file, 'r') as file:
-                config = json.load(file)
-                for k, v in default_config.items():
-                    if k not in config:
-                        config[k] = v
-                return config
+            config = self._read_json(self.config_file)
+            for k, v in default_config.items():
+                if k not in config:
+                    config[k] = v
+            return config
         except Exception:
             return default_config
 
@@ -342,6 +1007,7 @@ class TaskStorage:
             with open(temp_file, 'w') as file:
                 json.dump(config, file, indent=2)
             temp_file.replace(self.config_file)
+            self._remember_json(self.config_file, config)
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -353,8 +1019,7 @@ class TaskStorage:
         if not self.focus_lock_file.exists():
             return default
         try:
-            with open(self.focus_lock_file, 'r') as file:
-                data = json.load(file)
+            data = self._read_json(self.focus_lock_file)
             for k, v in default.items():
                 data.setdefault(k, v)
             return data
@@ -368,6 +1033,7 @@ class TaskStorage:
             with open(temp_file, 'w') as file:
                 json.dump(state, file, indent=2)
             temp_file.replace(self.focus_lock_file)
+            self._remember_json(self.focus_lock_file, state)
             return True
         except Exception as e:
             print(f"Error saving focus lock: {e}")
@@ -378,8 +1044,7 @@ class TaskStorage:
         if not self.daily_summaries_file.exists():
             return []
         try:
-            with open(self.daily_summaries_file, 'r') as file:
-                data = json.load(file)
+            data = self._read_json(self.daily_summaries_file)
             return data if isinstance(data, list) else []
         except Exception:
             return []
@@ -391,6 +1056,7 @@ class TaskStorage:
             with open(temp_file, 'w') as file:
                 json.dump(summaries, file, indent=2)
             temp_file.replace(self.daily_summaries_file)
+            self._remember_json(self.daily_summaries_file, summaries)
             return True
         except Exception as e:
             print(f"Error saving daily summaries: {e}")
@@ -409,6 +1075,9 @@ def load_tasks() -> List[Task]:
 def save_tasks(tasks: List[Task]) -> bool:
     return storage.save_tasks(tasks)
 
+def commit_tasks(tasks: List[Task]) -> bool:
+    return storage.commit(tasks)
+
 def load_timeline() -> dict:
     return storage.load_timeline()
 
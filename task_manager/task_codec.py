@@ -0,0 +1,94 @@
+"""
+TaskFlow Task Codec
+-------------------
+On-disk snapshot formats for tasks.json.
+
+  pretty   indent=4 JSON array (the original format, still the default)
+  compact  minified JSON array
+  rows     schema-versioned JSON Lines: a header naming the columns, then one
+           JSON array of values per task. No repeated keys, and it can be read
+           one task at a time (iter_records) instead of parsing the whole file.
+           Since v2 each line is `<header values>\t<heavy values>`: the heavy
+           fields (models.HEAVY_FIELDS) sit after a tab, which compact JSON never
+           contains, so header-only loads skip decoding them entirely.
+
+Every reader auto-detects the format, so switching formats never strands old files.
+"""
+
+import json
+from typing import IO, Iterable, Iterator, List, Tuple
+
+from task_manager.models import HEADER_FIELDS, HEAVY_FIELDS
+
+TASK_FORMATS = ("pretty", "compact", "rows")
+
+ROWS_MAGIC = "taskflow-rows"
+ROWS_VERSION = 2
+
+# Key under which iter_records(headers_only=True) leaves the still-encoded heavy fields
+BODY_KEY = "_body"
+
+_COMPACT = (',', ':')
+
+
+def write_records(file: IO[str], records: Iterable[dict], fmt: str = "pretty"):
+    """Serialize task dicts to an open text file in the given format."""
+    if fmt == "rows":
+        file.write(json.dumps({"format": ROWS_MAGIC, "version": ROWS_VERSION,
+                               "fields": HEADER_FIELDS, "body": HEAVY_FIELDS},
+                              separators=_COMPACT) + "\n")
+        dumps = json.JSONEncoder(separators=_COMPACT, ensure_ascii=False).encode
+        for rec in records:
+            file.write(dumps([rec.get(name) for name in HEADER_FIELDS]) + "\t"
+                       + dumps([rec.get(name) for name in HEAVY_FIELDS]) + "\n")
+    elif fmt == "compact":
+        json.dump(list(records), file, separators=_COMPACT, ensure_ascii=False)
+    else:
+        json.dump(list(records), file, indent=4)
+
+
+def _rows_header(line: str) -> Tuple[List[str], List[str]]:
+    header = json.loads(line)
+    if not isinstance(header, dict) or header.get("format") != ROWS_MAGIC:
+        raise json.JSONDecodeError("not a taskflow rows header", line, 0)
+    if int(header.get("version", 0)) > ROWS_VERSION:
+        raise json.JSONDecodeError(f"rows format v{header.get('version')} is newer than this TaskFlow", line, 0)
+    return header["fields"], header.get("body") or []   # v1 files have no body columns
+
+
+def decode_body(raw: str, body_fields=HEAVY_FIELDS) -> dict:
+    """Decode the heavy-field segment of a rows line (as kept under BODY_KEY)."""
+    return dict(zip(body_fields, json.loads(raw))) if raw else {}
+
+
+def iter_records(path, headers_only: bool = False) -> Iterator[dict]:
+    """Yield task dicts from a snapshot file of any format.
+
+    The rows format is decoded line by line, so the first task is available before the
+    rest of the file is read. JSON array formats have to be parsed in one go.
+    With headers_only, v2 rows records carry their heavy fields undecoded under BODY_KEY
+    (other formats still yield full records). Raises json.JSONDecodeError on a corrupt file.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        first = file.read(1)
+        while first and first.isspace():
+            first = file.read(1)
+        if first == "{":
+            fields, body_fields = _rows_header(first + file.readline())
+            for line in file:
+                head, _tab, body = line.rstrip("\n").partition("\t")
+                if not head.strip():
+                    continue
+                record = dict(zip(fields, json.loads(head)))
+                if body_fields:
+                    if headers_only:
+                        record[BODY_KEY] = body
+                    else:
+                        record.update(decode_body(body, body_fields))
+                yield record
+            return
+        data = json.loads(first + file.read())
+    if not isinstance(data, list):
+        raise json.JSONDecodeError("tasks snapshot is not a list", "", 0)
+    yield from data
+
@@ -0,0 +1,184 @@
+"""
+TaskFlow Task Repository
+------------------------
+Resident task list for the dashboard server.
+
+The dashboard polls /api/tasks, /api/stats, /api/path ... several times a second;
+before this every poll rebuilt every Task from storage. The repository keeps one
+loaded list and hands the same objects to every reader until the task files change
+on disk (a CLI edit, another process) — detected by the storage file signature — or
+the server itself commits.
+
+Readers must treat tasks() as read-only. Mutations go through checkout() (a private,
+freshly loaded list) and commit(), which writes through to storage; the resident list
+is then rebuilt from the storage cache.
+
+Writers don't serialise end to end. commit() is compare-and-swap per task: inside
+attempt() it fails (conflicted() turns True) when a task it changed was changed by
+someone else in the same field since checkout, and the caller re-runs its mutation
+on fresh state. Edits to other tasks or other fields are merged (TaskStorage.commit).
+An exclusive attempt holds off every other commit, so a final retry always lands.
+
+Change sequence: every time the resident list is replaced, the tasks that differ
+from the previous list are stamped with a new `seq`, and removed ones leave a
+tombstone. changes_since(seq) answers "what happened after seq" for delta sync
+(/api/tasks?since=) and the /api/events push channel. Sequences are per server
+run; `epoch` tells a client its token is from an earlier run.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from task_manager.models import Task
+from task_manager.storage import TaskConflict
+
+# Tombstones kept for delta clients; older deletions force a full resync
+MAX_TOMBSTONES = 10000
+
+
+class TaskList(list):
+    """checkout() result: remembers the ids it was loaded with, so commit() knows what was deleted."""
+    loaded_ids = frozenset()
+
+
+class TaskRepository:
+    """Loaded-once, shared, read-only task list backed by a TaskStorage."""
+
+    def __init__(self, store):
+        self._store = store
+        self._tasks: Optional[List[Task]] = None
+        self._sig = None
+        self._lock = threading.Lock()
+        self.version = 0   # bumped whenever the resident list is replaced
+        self._listeners = []
+        self._exclusive = threading.RLock()   # held briefly by commit(), throughout by exclusive attempts
+        self._attempt = threading.local()
+        # Change sequence (see module doc)
+        self.epoch = format(time.time_ns(), 'x')
+        self.seq = 0
+        self._floor = 0                                 # changes_since(s) needs s >= _floor
+        self._state: Optional[Dict[int, dict]] = None   # id -> to_dict() of the resident list
+        self._changed_at: Dict[int, int] = {}           # id -> seq of its last change
+        self._tombstones: Dict[int, int] = {}           # deleted id -> seq of the deletion
+
+    def _signature(self):
+        return self._store._cache.signature(self._store._task_paths())
+
+    def tasks(self) -> List[Task]:
+        """The resident task list (shared: do not mutate), reloaded only if disk changed."""
+        sig = self._signature()   # before loading: a write mid-load forces another reload
+        with self._lock:
+            if self._tasks is None or sig != self._sig:
+                self._adopt(self._store.load_tasks())
+                self._sig = sig
+            return self._tasks
+
+    def checkout(self) -> List[Task]:
+        """A private, mutable task list for a read-modify-commit cycle."""
+        tasks = TaskList(self._store.load_tasks())
+        tasks.loaded_ids = frozenset(t.id for t in tasks)
+        return tasks
+
+    def commit(self, tasks: List[Task]) -> bool:
+        """
+        Write `tasks` through to storage (only what changed since checkout). Inside a
+        non-exclusive attempt(), a same-field conflict writes nothing, marks the attempt
+        conflicted and returns False.
+        """
+        strict = getattr(self._attempt, "active", False) and not getattr(self._attempt, "exclusive", False)
+        with self._exclusive:
+            try:
+                ok = self._store.commit(tasks, loaded=getattr(tasks, "loaded_ids", None), strict=strict)
+            except TaskConflict:
+                self._attempt.conflict = True
+                return False
+        # Rebuilt lazily from the storage cache: `tasks` may be stale for tasks other writers changed
+        self.invalidate()
+        if ok:
+            for listener in list(self._listeners):
+                listener()
+        return ok
+
+    @contextmanager
+    def attempt(self, exclusive: bool = False):
+        """Scope one try of a checkout -> mutate -> commit handler (see module doc)."""
+        self._attempt.active = True
+        self._attempt.conflict = False
+        self._attempt.exclusive = exclusive
+        if exclusive:
+            self._exclusive.acquire()
+        try:
+            yield
+        finally:
+            if exclusive:
+                self._exclusive.release()
+            self._attempt.active = False
+            self._attempt.exclusive = False
+
+    def conflicted(self) -> bool:
+        """True if a commit in the current attempt hit a conflict."""
+        return getattr(self._attempt, "conflict", False)
+
+    def add_listener(self, callback):
+        """Call `callback()` after every successful commit (change notification for push channels)."""
+        self._listeners.append(callback)
+
+    def invalidate(self):
+        """Forget the resident list (next tasks() reloads)."""
+        with self._lock:
+            self._tasks = None
+
+    # --- change sequence ---
+    def _adopt(self, tasks: List[Task]):
+        """Make `tasks` resident and stamp what differs from the previous list (lock held)."""
+        state = {t.id: t.to_dict() for t in tasks}
+        previous = self._state
+        self._tasks = tasks
+        self._state = state
+        self.version += 1
+        if previous is None:
+            return   # first load: everything is "as of seq 0"
+        changed = [task_id for task_id, d in state.items() if previous.get(task_id) != d]
+        deleted = [task_id for task_id in previous if task_id not in state]
+        if not changed and not deleted:
+            return
+        self.seq += 1
+        for task_id in changed:
+            self._changed_at[task_id] = self.seq
+            self._tombstones.pop(task_id, None)
+        for task_id in deleted:
+            self._changed_at.pop(task_id, None)
+            self._tombstones[task_id] = self.seq
+        if len(self._tombstones) > MAX_TOMBSTONES:
+            oldest = sorted(self._tombstones.items(), key=lambda item: item[1])
+            for task_id, seq in oldest[:len(oldest) - MAX_TOMBSTONES]:
+                del self._tombstones[task_id]
+                self._floor = max(self._floor, seq)
+
+    def changes_since(self, seq: int) -> Optional[Tuple[int, List[Task], List[int]]]:
+        """
+        (current seq, tasks changed after `seq`, ids deleted after `seq`), or None when
+        `seq` can't be answered (ahead of this run, or older than the kept tombstones).
+        """
+        self.tasks()   # pick up disk changes first
+        with self._lock:
+            if seq > self.seq or seq < self._floor:
+                return None
+            by_id = {t.id: t for t in self._tasks}
+            changed = [by_id[task_id] for task_id, at in sorted(self._changed_at.items())
+                       if at > seq and task_id in by_id]
+            deleted = sorted(task_id for task_id, at in self._tombstones.items() if at > seq)
+            return self.seq, changed, deleted
+
+    def token(self, seq: Optional[int] = None) -> str:
+        """Opaque "<epoch>.<seq>" sync token (for the current seq by default)."""
+        return f"{self.epoch}.{self.seq if seq is None else seq}"
+
+    def parse_token(self, token: str) -> Optional[int]:
+        """The seq inside a token from this run, or None (other run / malformed)."""
+        epoch, _, seq = (token or '').partition('.')
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
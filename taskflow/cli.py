@@ -8,7 +8,7 @@ Calm, Powerful CLI Task Assistant with Focus Blocking
 import sys
 import os
 import argparse
-import difflib
+import functools
 
 class CustomParser(argparse.ArgumentParser):
     """Custom parser for cleaner errors and fuzzy suggestions."""
@@ -29,6 +29,7 @@ class CustomParser(argparse.ArgumentParser):
                 if isinstance(action, argparse._SubParsersAction):
                     choices.extend(action.choices.keys())
             
+            import difflib
             suggestions = difflib.get_close_matches(wrong_cmd, choices, n=1, cutoff=0.5)
             if suggestions:
                 print(f"💡 Did you mean 'taskflow {suggestions[0]}'?\n")
@@ -45,69 +46,9 @@ if sys.platform == "win32":
         sys.stdout.reconfigure(encoding='utf-8')
     os.system('chcp 65001 > nul')  # Set console to UTF-8
 
-from task_manager.commands import (
-    add_task,
-    change_priority,
-    list_ids,
-    list_tasks,
-    complete_task,
-    delete_task,
-    rename_task,
-    stats_tasks,
-    undo_task,
-    edit_task,
-    search_tasks,
-    clear_completed_tasks,
-    summary,
-    reset_tasks,
-    command_fresh_start,
-    command_generate_report,
-    command_ai,
-    view_task,
-    set_prime_target,
-    render_timeline,
-    # v2.0 time management commands
-    focus_task,
-    check_focus,
-    end_focus,
-    schedule_task,
-    show_today_tasks,
-    add_note,
-    edit_note,
-    manage_links,
-    manage_checklist,
-    tag_task,
-    backup_tasks,
-    # v2.5 focus blocking commands (new!)
-    focus_blocking_status,
-    test_blocking,
-    emergency_cleanup,
-    manage_blocklist,
-    open_web_ui,
-    kill_web_ui,
-    dump_task,
-    run_today_view,
-    command_postpone,
-    command_remind,
-    command_recover,
-    command_missed,
-    check_reminders,
-    check_recovery_mode,
-    command_path,
-    command_queue,
-    focus_lock_active,
-    focus_capture_add,
-    focus_capture_dump,
-    print_focus_header,
-    focus_complete_nudge,
-    ensure_daily_summaries,
-    maybe_weekly_review,
-    check_momentum_warning,
-    command_rescue,
-    render_heatmap
-)
-from task_manager.storage import storage
-import colorama
+# task_manager is imported inside the functions that use it: `taskflow --version` prints
+# and exits without loading it, and every other command loads task_manager.commands
+# once the arguments are parsed (see main()).
 
 APP_NAME = "TaskFlow"
 APP_VERSION = "v9.1.0"
@@ -147,7 +88,7 @@ def show_help() -> None:
     check <id> [item]       Manage checklist (item number toggles directly)
     tag <id> <tags...>      Categorize mission (multi-tag support)
     priority <id> <level>   Adjust mission priority (low/medium/high)
-    search <keyword>        Query mission database
+    search <words>          Ranked full-text search (--status/--priority/--tag/--reindex)
     summary                 Human-readable mission overview
     stats                   Performance telemetry (--today/--week/--accuracy/--tags/--export)
     heatmap                 Productivity heatmap (last 30 days)
@@ -156,6 +97,8 @@ def show_help() -> None:
   MAINTENANCE & SAFETY:
     clear                   Prune completed missions
     backup                  Create manual mission database backup
+    storage                 Show/switch the storage backend (--use json|sqlite)
+    daemon start|stop|status  Keep TaskFlow warm in the background (faster commands)
     reset                   Hard reset mission database (Caution!)
     help                    Display this assistance manual
     version                 Show system version
@@ -175,6 +118,7 @@ def show_help() -> None:
 
 def show_first_run_wizard():
     """Show first-run wizard for new users (S0-D)."""
+    from task_manager.storage import storage
     print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     print("  Welcome to TaskFlow.")
     print("  Built for people who execute,")
@@ -203,7 +147,7 @@ def show_first_run_wizard():
             # set prime target for today
             today = datetime.now().strftime('%Y-%m-%d')
             task_id = manager.add_task(task)
-            storage.save_tasks(manager.tasks)
+            storage.commit(manager.tasks)
             
             mapping = storage.load_timeline()
             mapping[str(task_id)] = f"{today}_prime"
@@ -226,6 +170,7 @@ def show_first_run_wizard():
 def command_doctor(repair=False):
     """Run full health check report (S0-C). With repair=True, fix safe data issues in place."""
     import platform
+    from task_manager.storage import storage
     print("\nChecking TaskFlow installation...")
     
     # Python
@@ -245,6 +190,10 @@ def command_doctor(repair=False):
         print(f"✓ tasks.json found — {len(tasks)} tasks at {storage.tasks_file}")
     except Exception:
         print(f"✗ tasks.json not found or corrupted at {storage.tasks_file}")
+    if storage.backend == "sqlite":
+        print(f"✓ Storage backend: SQLite ({storage.db_file})")
+    else:
+        print("✓ Storage backend: JSON")
         
     # dateparser
     try:
@@ -356,9 +305,82 @@ def command_doctor(repair=False):
 
     print(f"\nStatus: {'All systems ready' if issues == 0 else f'{issues} issue(s) found. See fix above.'}\n")
 
+def command_storage(use=None, fmt=None):
+    """Show the active task storage backend, or switch it (migrating the current tasks)."""
+    from task_manager.storage import storage
+    if fmt:
+        if storage.set_tasks_format(fmt):
+            print(f"✓ tasks.json format: {storage.tasks_format}")
+        if not use:
+            return
+    if use:
+        before = storage.backend
+        if storage.set_backend(use):
+            if before == storage.backend and before != use:
+                print(f"Storage backend unchanged: {storage.backend}")
+            else:
+                print(f"✓ Storage backend: {storage.backend}")
+        return
+    tasks = storage.load_tasks()
+    location = storage.db_file if storage.backend == "sqlite" else storage.tasks_file
+    print(f"\n  Storage backend: {storage.backend}")
+    print(f"  Location:        {location}")
+    if storage.backend == "json":
+        print(f"  File format:     {storage.tasks_format}")
+    print(f"  Tasks:           {len(tasks)}")
+    print("  Switch with:     taskflow storage --use json|sqlite")
+    print("  File format:     taskflow storage --format pretty|compact|rows\n")
+
+def command_batch(path):
+    """Apply a JSONL file of task operations (one JSON object per line) in one transaction."""
+    import json
+    from task_manager.batch import apply_batch, BatchError
+    operations = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    operations.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    print(f"Error: {path}:{line_no}: invalid JSON ({e.msg})")
+                    return False
+    except OSError as e:
+        print(f"Error: cannot read {path}: {e.strerror or e}")
+        return False
+    try:
+        outcome = apply_batch(operations)
+    except BatchError as e:
+        print(f"Error: {e}")
+        return False
+    for result in outcome["results"]:
+        label = f"  [{result['index'] + 1}] {result['op'] or '?':<9}"
+        if result["ok"]:
+            note = (" (duplicate, skipped)" if result.get("duplicate")
+                    else " (already completed)" if result.get("already_completed") else "")
+            print(f"{label}✓ #{result['id']}{note}")
+        else:
+            print(f"{label}✗ {result.get('error', 'not applied')}")
+    if not outcome["applied"]:
+        print(f"Error: {outcome.get('error', 'an operation failed')} — nothing was changed.")
+        return False
+    print(f"✓ Applied {len(outcome['results'])} operation(s).")
+    return True
+
+def command_daemon(action):
+    """Start, stop or inspect the warm CLI daemon (taskflow.daemon)."""
+    from taskflow import daemon
+    if action == 'start':
+        return daemon.start()
+    if action == 'stop':
+        return daemon.stop()
+    return daemon.status()
+
 def show_version():
     """Show version information with system details."""
     from pathlib import Path
+    from task_manager.storage import storage
     
     print(f"\n  🌊 \033[1;36mTaskFlow {APP_VERSION}\033[0m — {APP_TAGLINE}")
     print(f"  \033[90m{'─' * 60}\033[0m")
@@ -387,8 +409,9 @@ def show_version():
     print("  \033[3mBuilt for deep work. Engineered for execution.\033[0m\n")
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser():
-    """Create argparse parser that matches your command structure."""
+    """Create argparse parser that matches your command structure (built once per process)."""
     parser = CustomParser(
         description=f"{APP_NAME} {APP_VERSION} — {APP_TAGLINE}",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -533,7 +556,15 @@ Examples:
     
     # Search command
     search_parser = subparsers.add_parser('search', help='Search tasks by keyword')
-    search_parser.add_argument('keyword', help='Search keyword')
+    search_parser.add_argument('keyword', nargs='+',
+                               help='Words to match (prefixes too); field:word or #tag narrows a word '
+                                    '(title, notes, desc, tags, check, links)')
+    search_parser.add_argument('--status', choices=['todo', 'done', 'dropped', 'offloaded'],
+                               help='Only tasks with this status')
+    search_parser.add_argument('--priority', help='Only tasks with this priority (low/medium/high)')
+    search_parser.add_argument('--tag', help='Only tasks with this tag')
+    search_parser.add_argument('--limit', type=int, default=20, help='Show at most this many matches (default 20)')
+    search_parser.add_argument('--reindex', action='store_true', help='Rebuild the search index first')
 
     # id command
     subparsers.add_parser("ids", help="Show only task IDs")
@@ -605,6 +636,16 @@ Examples:
         help='Goal to break into tasks, e.g. taskflow ai "prepare for ML interview next Friday"')
     ai_parser.add_argument('--yes', '-y', action='store_true',
         help='Auto-confirm without the interactive review (skips the approval prompt).')
+    storage_parser = subparsers.add_parser('storage', help='Show or switch the task storage backend')
+    storage_parser.add_argument('--use', choices=['json', 'sqlite'],
+                                help='Switch backend, migrating current tasks (sqlite = row-per-task writes)')
+    storage_parser.add_argument('--format', dest='tasks_format', choices=['pretty', 'compact', 'rows'],
+                                help='tasks.json format: pretty (default), compact (minified) or rows (fastest, streamable)')
+    batch_parser = subparsers.add_parser('batch', help='Apply task operations from a JSONL file, all or nothing')
+    batch_parser.add_argument('file', help='One JSON operation per line, e.g. {"op": "complete", "id": 3}')
+    daemon_parser = subparsers.add_parser('daemon',
+        help='Keep TaskFlow warm in a background process so commands answer faster (Linux/macOS)')
+    daemon_parser.add_argument('action', nargs='?', choices=['start', 'stop', 'status'], default='status')
     doctor_parser = subparsers.add_parser('doctor', help='Check system health')
     doctor_parser.add_argument('--repair', action='store_true',
                                help='Fix non-standard durations + offer to remove orphan files (backs up tasks first)')
@@ -630,52 +671,42 @@ Examples:
         p = subparsers.add_parser(cmd, help=help_text)
         if cmd == 'ui':
             p.add_argument('--restart', '-r', action='store_true', help='Force restart the server')
+            p.add_argument('--async', dest='async_server', action='store_true',
+                           help='Use the asyncio server (HTTP/1.1 keep-alive, bounded workers)')
     
     return parser
 
 
 def main():
     """Main command router using argparse with startup cleanup."""
-    
-    # Add this at the VERY beginning of main() to cleanup orphaned blocks
-    try:
-        from task_manager.system_detector import SystemDetector
-        from task_manager.blockers.windows import WindowsBlocker
-        from task_manager.commands import time_tracker
-        
-        # Colorama init
+    # Fast path: answered before anything under task_manager is imported
+    if sys.argv[1:] in (['--version'], ['-V']):
+        print(f"{APP_NAME} {APP_VERSION}")
+        return
+
+    # Warm daemon (taskflow.daemon): when one is running it answers the command
+    from taskflow.daemon import forward
+    code = forward(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+
+    import colorama
+    from task_manager.storage import storage
+    from task_manager.startup import StartupPipeline, BOOT, COMMAND, REVIEW
+
+    # Per-hook timings on stderr; accepted anywhere on the command line
+    profile = '--profile-startup' in sys.argv
+    if profile:
+        sys.argv = [a for a in sys.argv if a != '--profile-startup']
+
+    # Inside the daemon, stdout already goes to the client through colorama
+    if not getattr(sys.stdout, 'forwarded', False):
         colorama.init(autoreset=True)
-        
-        # S0-B: Path detection
-        scripts_dir = os.path.dirname(sys.executable)
-        if not scripts_dir.endswith("Scripts"):
-            scripts_dir = os.path.join(scripts_dir, "Scripts")
-        path_env = os.environ.get("PATH", "")
-        
-        config = storage.load_config()
-        if scripts_dir.lower() not in path_env.lower() and not config.get("path_warning_shown"):
-            print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-            print("taskflow is installed but not in PATH.")
-            print("Run this once to fix it permanently:\n")
-            print("Windows CMD:")
-            print(f"setx PATH \"%PATH%;{scripts_dir}\"\n")
-            print("Then restart your terminal and run: taskflow")
-            print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
-            config["path_warning_shown"] = True
-            storage.save_config(config)
-            
-        # If on Windows and admin, check for orphaned blocks IF no active session
-        if SystemDetector.get_os() == "windows" and SystemDetector.is_admin():
-            if not time_tracker.active_session:
-                checker = WindowsBlocker()
-                # This will silently clean up if there are orphaned blocks
-                with open(checker.hosts_path, 'r') as f:
-                    if "# TaskFlow Focus Mode" in f.read():
-                        print("🔍 Checking for orphaned focus blocks...")
-                        checker.unblock_websites()
-    except Exception as e:
-        pass  # Don't crash on startup
-        
+    # Startup hooks share one snapshot and skip themselves when nothing they read changed
+    # (task_manager.startup). Boot hooks: PATH warning, orphaned Windows blocks.
+    startup = StartupPipeline(storage, profile=profile)
+    startup.run(BOOT)
+
     parser = create_parser()
     
     # Show help if no arguments (or welcome for first-run)
@@ -708,30 +739,74 @@ def main():
     
     # Route commands
     try:
-        # STARTUP HOOKS — S7 (reminders) + S9 (recovery)
-        # S7-D: reminders fire at the start of EVERY command (silent if none due)
-        if getattr(args, 'command', None):
-            try:
-                check_reminders(storage.load_tasks())
-            except Exception:
-                pass
-        # S9-D: recovery check intercepts the read views only
-        if args.command in ['list', 'status', 'today']:
-            if check_recovery_mode():
-                # Intercept normal views if recovery mode is active
-                args.command = 'recover'
+        from task_manager.commands import (
+            add_task,
+            change_priority,
+            list_ids,
+            list_tasks,
+            complete_task,
+            delete_task,
+            rename_task,
+            stats_tasks,
+            undo_task,
+            edit_task,
+            search_tasks,
+            clear_completed_tasks,
+            summary,
+            reset_tasks,
+            command_fresh_start,
+            command_generate_report,
+            command_ai,
+            view_task,
+            set_prime_target,
+            render_timeline,
+            # v2.0 time management commands
+            focus_task,
+            check_focus,
+            end_focus,
+            schedule_task,
+            show_today_tasks,
+            add_note,
+            edit_note,
+            manage_links,
+            manage_checklist,
+            tag_task,
+            backup_tasks,
+            # v2.5 focus blocking commands (new!)
+            focus_blocking_status,
+            test_blocking,
+            emergency_cleanup,
+            manage_blocklist,
+            open_web_ui,
+            kill_web_ui,
+            dump_task,
+            run_today_view,
+            command_postpone,
+            command_remind,
+            command_recover,
+            command_missed,
+            command_path,
+            command_queue,
+            focus_capture_add,
+            focus_capture_dump,
+            print_focus_header,
+            focus_complete_nudge,
+            command_rescue,
+            render_heatmap
+        )
 
-        # S11-B: Focus Window Lock — derive active state, lazily flush an ended session's queue
-        focus_lock = None
-        try:
-            focus_lock = focus_lock_active()
-        except Exception:
-            focus_lock = None
+        # STARTUP HOOKS — S7 reminders, S9 recovery (may turn a read view into 'recover'),
+        # S11-B focus lock
+        startup.run(COMMAND, args.command)
+        args.command = startup.snapshot.command
+        focus_lock = startup.snapshot.focus_lock
 
         if focus_lock and args.command == 'add':
+            startup.finish()
             focus_capture_add(focus_lock)
             return
         if focus_lock and args.command == 'dump':
+            startup.finish()
             _txt = " ".join(getattr(args, 'text', []) or [])
             focus_capture_dump(
                 focus_lock, _txt,
@@ -743,22 +818,9 @@ def main():
         if focus_lock and args.command in ['list', 'status', 'today']:
             print_focus_header(focus_lock)
 
-        # S12: keep daily summaries + streak fresh (guarded to once per new day)
-        try:
-            ensure_daily_summaries()
-        except Exception:
-            pass
-        # S12-E: Monday-morning weekly review (once per week, before normal output)
-        try:
-            maybe_weekly_review()
-        except Exception:
-            pass
-        # Brainstorm #3: momentum re-entry nudge on the review commands
-        if args.command in ['list', 'status', 'today']:
-            try:
-                check_momentum_warning()
-            except Exception:
-                pass
+        # S12 daily summaries, S12-E weekly review, momentum nudge on the review commands
+        startup.run(REVIEW, args.command)
+        startup.finish()
 
         if args.command == 'add':
             add_task(
@@ -861,7 +923,8 @@ def main():
             tag_task(args.id, args.tags)
         
         elif args.command == 'search':
-            search_tasks(args.keyword)
+            search_tasks(' '.join(args.keyword), status=args.status, priority=args.priority,
+                         tag=args.tag, limit=args.limit, reindex=args.reindex)
         
         elif args.command == 'clear':
             clear_completed_tasks()
@@ -915,7 +978,7 @@ def main():
             show_version()
             
         elif args.command == 'ui':
-            open_web_ui(force=args.restart)
+            open_web_ui(force=args.restart, async_server=args.async_server)
 
         elif args.command == 'ui-kill':
             kill_web_ui()
@@ -983,7 +1046,18 @@ def main():
                 
         elif args.command == 'doctor':
             command_doctor(repair=getattr(args, 'repair', False))
+
+        elif args.command == 'storage':
+            command_storage(use=getattr(args, 'use', None), fmt=getattr(args, 'tasks_format', None))
                 
+        elif args.command == 'daemon':
+            if command_daemon(args.action) is False:
+                sys.exit(1)
+
+        elif args.command == 'batch':
+            if command_batch(args.file) is False:
+                sys.exit(1)
+
         elif args.command == 'postpone':
             command_postpone(args.id)
             
@@ -0,0 +1,497 @@
+"""
+TaskFlow Daemon
+---------------
+Opt-in warm process for the CLI: `taskflow daemon start|stop|status`.
+
+Every `taskflow` command is a fresh interpreter that imports task_manager and parses
+~/.taskflow again. The daemon imports it once and keeps resident what the dashboard
+server keeps between requests: task_manager.commands loaded, and storage's FileCache
+holding the parsed tasks, config, timeline and indexes. A cached file is re-read only
+when its (mtime, size) signature changes, so writes from other processes are still seen.
+
+It listens on a Unix domain socket, ~/.taskflow/daemon.sock (mode 0600). While the
+socket exists, cli.main() hands argv to forward(), which runs the command in the
+daemon and streams the output back: stdout and stderr as written, prompts read the
+client's stdin line by line, and the client exits with the command's status.
+Everything runs in-process instead when the daemon isn't running, stays busy past
+HELLO_TIMEOUT or was started from other code, for LOCAL_COMMANDS (they need the
+caller's own process), and whenever TASKFLOW_NO_DAEMON is set.
+
+Commands run one at a time: argv, the working directory and sys.stdin/stdout/stderr
+are process-wide.
+
+Protocol (newline-delimited JSON): the daemon greets each connection with
+{"taskflow": build, "pid"}. The client sends {"argv", "cwd", "tty", "env"}, or
+{"op": "status" | "stop" | "restart"}. For a command, the daemon answers with "out",
+"err" and "read" frames and then {"exit": code}. The client replies to a "read" frame
+with {"line"}, {"eof"} or {"interrupt"}. If the daemon answers with {"fallback": reason}
+instead, it has run nothing and the client runs the command itself.
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# How long a client waits for the greeting before running the command itself
+HELLO_TIMEOUT = 1.0
+# Commands that always run in the caller's process: they open an editor or a browser,
+# start or stop other processes, drive focus blocking or switch the storage backend
+LOCAL_COMMANDS = frozenset({
+    'daemon', 'help', 'version', 'ui', 'ui-kill', 'storage',
+    'focus', 'focus-blocking', 'test-blocking', 'cleanup', 'blocklist', 'note', 'link',
+})
+# Environment that changes what a command does; the daemon refuses a client whose
+# values differ from its own
+_FORWARDED_ENV = ("TASKFLOW_STORAGE",)
+_FLUSH_BYTES = 16384
+
+
+def socket_path() -> Path:
+    return Path.home() / ".taskflow" / "daemon.sock"
+
+
+def _build_id() -> str:
+    """APP_VERSION plus the newest source mtime: a daemon running older code is stale."""
+    from taskflow.cli import APP_VERSION
+    here = Path(__file__).resolve().parent
+    newest = 0
+    for package in (here, here.parent / "task_manager"):
+        try:
+            with os.scandir(package) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".py"):
+                        newest = max(newest, entry.stat().st_mtime_ns)
+        except OSError:
+            pass
+    return f"{APP_VERSION}-{newest}"
+
+
+def _send(conn, frame: dict):
+    conn.sendall((json.dumps(frame) + "\n").encode("utf-8"))
+
+
+def _receive(reader) -> Optional[dict]:
+    line = reader.readline()
+    return json.loads(line) if line else None
+
+
+def _connect():
+    """(conn, reader, greeting) from a live daemon, or None."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path()
+    if not path.exists():
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(HELLO_TIMEOUT)
+        conn.connect(str(path))
+        reader = conn.makefile("rb")
+        hello = _receive(reader)
+        if not hello or "taskflow" not in hello:
+            raise OSError("no greeting")
+        conn.settimeout(None)
+        return conn, reader, hello
+    except (OSError, ValueError):
+        conn.close()
+        return None
+
+
+def _request(frame: dict) -> Optional[tuple]:
+    """Send one control op; (greeting, reply) or None when no daemon answers."""
+    link = _connect()
+    if link is None:
+        return None
+    conn, reader, hello = link
+    with conn:
+        try:
+            _send(conn, frame)
+            return hello, _receive(reader) or {}
+        except (OSError, ValueError):
+            return None
+
+
+# --- client ---
+def forward(argv: List[str]) -> Optional[int]:
+    """
+    Run `taskflow <argv>` in the daemon and return its exit status.
+
+    None means nothing ran there and the caller should run the command itself. Once
+    the command has been handed over it is never run twice: a lost connection is
+    reported and exits with status 1.
+    """
+    if not argv or argv[0].startswith('-') or argv[0] in LOCAL_COMMANDS:
+        return None
+    if os.environ.get("TASKFLOW_NO_DAEMON"):
+        return None
+    link = _connect()
+    if link is None:
+        return None
+    conn, reader, hello = link
+    with conn:
+        try:
+            if hello.get("taskflow") != _build_id():
+                # Started before the code changed: restart it, run this one here
+                _send(conn, {"op": "restart"})
+                return None
+            _send(conn, {"argv": argv, "cwd": os.getcwd(), "tty": sys.stdout.isatty(),
+                         "env": {name: os.environ.get(name) for name in _FORWARDED_ENV}})
+            frame = _receive(reader)
+        except (OSError, ValueError):
+            return None
+        if frame and "fallback" in frame:
+            return None
+        try:
+            while frame is not None:
+                if "out" in frame:
+                    sys.stdout.write(frame["out"])
+                    sys.stdout.flush()
+                elif "err" in frame:
+                    sys.stderr.write(frame["err"])
+                    sys.stderr.flush()
+                elif "read" in frame:
+                    try:
+                        line = sys.stdin.readline()
+                        _send(conn, {"line": line} if line else {"eof": True})
+                    except KeyboardInterrupt:
+                        _send(conn, {"interrupt": True})
+                elif "exit" in frame:
+                    return frame["exit"]
+                frame = _receive(reader)
+        except KeyboardInterrupt:
+            return 130
+        except (OSError, ValueError):
+            pass
+    print("Error: lost the connection to the taskflow daemon mid-command "
+          "(check ~/.taskflow/daemon.log).", file=sys.stderr)
+    return 1
+
+
+# --- daemon side ---
+class _Link:
+    """One forwarded command's connection: ordered, buffered output frames plus stdin."""
+
+    def __init__(self, conn, reader, tty: bool):
+        self.conn = conn
+        self.reader = reader
+        self.tty = tty
+        self.lost = False     # client went away: output is dropped, prompts read EOF
+        self._frames = []     # [kind, text], adjacent writes to one stream merged
+        self._size = 0
+
+    def write(self, kind: str, text: str):
+        if not text or self.lost:
+            return
+        if self._frames and self._frames[-1][0] == kind:
+            self._frames[-1][1] += text
+        else:
+            self._frames.append([kind, text])
+        self._size += len(text)
+        if self._size >= _FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        frames, self._frames, self._size = self._frames, [], 0
+        if self.lost or not frames:
+            return
+        try:
+            self.conn.sendall("".join(json.dumps({kind: text}) + "\n"
+                                      for kind, text in frames).encode("utf-8"))
+        except OSError:
+            self.lost = True
+
+    def send(self, frame: dict):
+        self.flush()
+        if not self.lost:
+            try:
+                _send(self.conn, frame)
+            except OSError:
+                self.lost = True
+
+    def read_line(self) -> str:
+        self.send({"read": True})
+        if self.lost:
+            return ""
+        try:
+            reply = _receive(self.reader)
+        except (OSError, ValueError):
+            reply = None
+        if reply is None:
+            self.lost = True
+            return ""
+        if reply.get("interrupt"):
+            raise KeyboardInterrupt
+        return reply.get("line") or ""
+
+
+class _Output:
+    """sys.stdout / sys.stderr for a forwarded command."""
+
+    forwarded = True   # cli.main() leaves colorama.init() to the daemon
+    encoding = "utf-8"
+    errors = "strict"
+    closed = False
+
+    def __init__(self, link: _Link, kind: str):
+        self._link = link
+        self._kind = kind
+
+    def write(self, text: str) -> int:
+        self._link.write(self._kind, text)
+        return len(text)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        # colorama flushes after every write; output goes out in chunks instead, and
+        # always before a prompt reads and when the command ends
+        pass
+
+    def isatty(self) -> bool:
+        return self._link.tty
+
+    def fileno(self):
+        raise OSError("forwarded stream has no file descriptor")
+
+
+class _Input:
+    """sys.stdin for a forwarded command: each readline() asks the client for a line."""
+
+    encoding = "utf-8"
+    closed = False
+
+    def __init__(self, link: _Link):
+        self._link = link
+
+    def readline(self, size: int = -1) -> str:
+        return self._link.read_line()
+
+    def read(self, size: int = -1) -> str:
+        return self._link.read_line()
+
+    def isatty(self) -> bool:
+        return self._link.tty
+
+    def fileno(self):
+        raise OSError("forwarded stream has no file descriptor")
+
+
+class Daemon:
+    """Serves forwarded commands from one warm interpreter (see module doc)."""
+
+    def __init__(self, path: Optional[Path] = None):
+        import colorama
+        from taskflow.cli import main as cli_main
+        from task_manager.storage import storage
+        import task_manager.commands  # noqa: F401  (the import the daemon exists to keep)
+
+        self.path = Path(path or socket_path())
+        self.colorama = colorama
+        self.cli_main = cli_main
+        self.storage = storage
+        self.build = _build_id()
+        self.started = time.time()
+        self.served = 0
+        self.env = {name: os.environ.get(name) for name in _FORWARDED_ENV}
+        self.settings = self._storage_settings()
+        # Warm the cache the commands read through
+        storage.load_config()
+        storage.load_task_headers()
+
+    def _storage_settings(self) -> tuple:
+        config = self.storage.load_config()
+        fmt = str(config.get("tasks_format") or "pretty").strip().lower()
+        return self.storage._requested_backend(config), fmt
+
+    def serve(self) -> str:
+        """Accept connections until stopped; returns "stop" or "restart"."""
+        if self.path.exists():
+            self.path.unlink()
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            listener.bind(str(self.path))
+        finally:
+            os.umask(umask)
+        listener.listen(16)
+        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] taskflow daemon {self.build} listening on {self.path} (pid {os.getpid()})",
+              flush=True)
+        try:
+            while True:
+                conn, _ = listener.accept()
+                with conn:
+                    outcome = self._handle(conn)
+                if outcome:
+                    return outcome
+        finally:
+            listener.close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def _handle(self, conn) -> Optional[str]:
+        reader = conn.makefile("rb")
+        try:
+            _send(conn, {"taskflow": self.build, "pid": os.getpid()})
+            request = _receive(reader)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(request, dict):
+            return None
+        op = request.get("op")
+        if op:
+            reply = {"pid": os.getpid(), "build": self.build, "started": self.started,
+                     "served": self.served, "socket": str(self.path)}
+            if op in ("stop", "restart"):
+                reply["stopping"] = True
+            try:
+                _send(conn, reply)
+            except OSError:
+                pass
+            return op if op in ("stop", "restart") else None
+
+        argv = request.get("argv")
+        if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+            return None
+        reason = self._refuse(request)
+        if reason:
+            try:
+                _send(conn, {"fallback": reason})
+            except OSError:
+                pass
+            # Storage settings changed under us: come back up with the new ones
+            return "restart" if reason.startswith("storage") else None
+        self._run(_Link(conn, reader, bool(request.get("tty"))), argv, request.get("cwd"))
+        return None
+
+    def _refuse(self, request: dict) -> Optional[str]:
+        if (request.get("env") or {}) != self.env:
+            return "environment differs from the daemon's"
+        if self._storage_settings() != self.settings:
+            return "storage settings changed"
+        cwd = request.get("cwd")
+        if not isinstance(cwd, str) or not os.path.isdir(cwd):
+            return "working directory unavailable"
+        return None
+
+    def _run(self, link: _Link, argv: List[str], cwd: str):
+        saved = (sys.argv, sys.stdin, sys.stdout, sys.stderr, os.getcwd())
+        code = 0
+        try:
+            os.chdir(cwd)
+            sys.argv = ["taskflow"] + argv
+            sys.stdin = _Input(link)
+            # What colorama.init(autoreset=True) does for a terminal, against the client's
+            # tty flag: codes pass (plus resets) to a terminal, are stripped for a pipe
+            sys.stdout = self.colorama.AnsiToWin32(_Output(link, "out"), autoreset=True).stream
+            sys.stderr = self.colorama.AnsiToWin32(_Output(link, "err"), autoreset=True).stream
+            try:
+                self.cli_main()
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    code = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    code = 1
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                code = 1
+        finally:
+            sys.argv, sys.stdin, sys.stdout, sys.stderr = saved[:4]
+            os.chdir(saved[4])
+        self.served += 1
+        link.send({"exit": code})
+
+
+# --- `taskflow daemon start|stop|status` ---
+def _wait(running: bool, seconds: float = 10.0) -> Optional[tuple]:
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        reply = _request({"op": "status"})
+        if (reply is not None) == running:
+            return reply
+        time.sleep(0.05)
+    return None
+
+
+def start() -> bool:
+    """Start the daemon in the background (no-op when it is already running)."""
+    import subprocess
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: the daemon needs Unix domain sockets (Linux or macOS).")
+        return False
+    reply = _request({"op": "status"})
+    if reply is not None:
+        print(f"Daemon already running (pid {reply[1].get('pid')}).")
+        return True
+    path = socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    env = dict(os.environ)
+    env.pop("TASKFLOW_NO_DAEMON", None)
+    root = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (root, env.get("PYTHONPATH")) if p)
+    with open(path.with_name("daemon.log"), "ab") as log:
+        subprocess.Popen([sys.executable, "-m", "taskflow.daemon"], cwd=str(path.parent), env=env,
+                         stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True)
+    reply = _wait(running=True)
+    if reply is None:
+        print(f"Error: the daemon did not come up — see {path.with_name('daemon.log')}")
+        return False
+    print(f"✓ Daemon running (pid {reply[1].get('pid')}) — commands now answer from {path}")
+    print("  Stop it with: taskflow daemon stop")
+    return True
+
+
+def stop() -> bool:
+    reply = _request({"op": "stop"})
+    if reply is None:
+        print("Daemon is not running.")
+        return True
+    _wait(running=False, seconds=5.0)
+    print(f"✓ Daemon stopped (pid {reply[1].get('pid')}, {reply[1].get('served', 0)} command(s) served).")
+    return True
+
+
+def status() -> bool:
+    reply = _request({"op": "status"})
+    if reply is None:
+        print("Daemon is not running. Start it with: taskflow daemon start")
+        return True
+    info = reply[1]
+    uptime = int(time.time() - float(info.get("started") or time.time()))
+    print(f"\n  Daemon:   running (pid {info.get('pid')})")
+    print(f"  Socket:   {info.get('socket')}")
+    print(f"  Uptime:   {uptime // 3600}h {uptime % 3600 // 60}m")
+    print(f"  Served:   {info.get('served', 0)} command(s)")
+    if info.get("build") != _build_id():
+        print("  Code:     changed since it started — it restarts on the next command")
+    print()
+    return True
+
+
+def main():
+    """Foreground entry point: python -m taskflow.daemon (`taskflow daemon start` runs this)."""
+    import signal
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: the daemon needs Unix domain sockets (Linux or macOS).", file=sys.stderr)
+        sys.exit(1)
+    # A command the daemon runs must never forward to the daemon
+    os.environ["TASKFLOW_NO_DAEMON"] = "1"
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    outcome = Daemon().serve()
+    if outcome == "restart":
+        os.environ.pop("TASKFLOW_NO_DAEMON", None)
+        sys.stdout.flush()
+        os.execv(sys.executable, [sys.executable, "-m", "taskflow.daemon"])
+
+
+if __name__ == "__main__":
+    main()